@@ -0,0 +1,377 @@
+import asyncio
+import json
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Iterator, Optional
+from urllib.parse import urlparse, parse_qs
+
+import httpx
+import typer
+
+from sfapi_client import AsyncClient
+from sfapi_client.jobs import JobCommand
+
+cli = typer.Typer()
+
+
+@cli.callback()
+def main():
+    """
+    Benchmarks for the client, run against a local stand-in server.
+    """
+
+
+#
+# A local stand-in for the SF API, it responds to every GET with the payload
+# returned by the handler function, so benchmarks are not affected by the
+# latency of the real API.
+#
+@contextmanager
+def stand_in_server(
+    handler: Callable[[str], Dict], latency: float = 0.0
+) -> Iterator[str]:
+    class _Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            if latency:
+                time.sleep(latency)
+            body = json.dumps(handler(self.path)).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    class _Server(ThreadingHTTPServer):
+        daemon_threads = True
+        # Avoid dropped connections when the client opens a large pool
+        request_queue_size = 1024
+
+    server = _Server(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        host, port = server.server_address
+        yield f"http://{host}:{port}/api/v1.2"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _report(name: str, count: int, elapsed: float):
+    typer.echo(
+        f"{name:<30} {count:>8} requests {elapsed:>8.3f}s {count / elapsed:>10.1f}/s"
+    )
+
+
+#
+# Throughput of concurrent GETs with the default transport settings compared
+# to a transport configured with a larger connection pool.
+#
+@cli.command(name="concurrent-gets")
+def concurrent_gets(
+    requests: int = typer.Option(1000, help="Number of GET requests"),
+    concurrency: int = typer.Option(200, help="Number of concurrent requests"),
+    max_connections: int = typer.Option(200, help="Connection pool size"),
+    latency: float = typer.Option(0.01, help="Server latency in seconds"),
+):
+    async def _run(base_url: str, limits: Optional[httpx.Limits]) -> float:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        # Identical GETs would otherwise be coalesced into a few requests
+        async with AsyncClient(
+            api_base_url=base_url,
+            access_token="benchmark",
+            limits=limits,
+            coalesce_requests=False,
+        ) as client:
+
+            async def _get():
+                async with semaphore:
+                    await client.get("status")
+
+            start = time.perf_counter()
+            await asyncio.gather(*[_get() for _ in range(requests)])
+
+            return time.perf_counter() - start
+
+    with stand_in_server(lambda path: {"status": "active"}, latency) as base_url:
+        elapsed = asyncio.run(_run(base_url, None))
+        _report("default limits", requests, elapsed)
+
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        )
+        elapsed = asyncio.run(_run(base_url, limits))
+        _report(f"max_connections={max_connections}", requests, elapsed)
+
+
+#
+# Fetching the state of a large number of jobs, without chunking the jobids
+# ( likely to exceed the URL limit of the server ), and with chunks fetched
+# serially and concurrently.
+#
+@cli.command(name="fetch-jobids")
+def fetch_jobids(
+    jobs: int = typer.Option(10000, help="Number of jobids"),
+    chunk_size: int = typer.Option(500, help="Number of jobids per request"),
+    concurrency: int = typer.Option(4, help="Number of concurrent chunks"),
+    latency: float = typer.Option(0.05, help="Server latency in seconds"),
+    per_job_latency: float = typer.Option(
+        0.0001, help="Additional server latency per jobid in seconds"
+    ),
+):
+    def _handler(path: str) -> Dict:
+        url = urlparse(path)
+        if "/compute/jobs/" not in url.path:
+            return {
+                "name": "perlmutter",
+                "full_name": "Perlmutter",
+                "description": "System",
+                "system_type": "compute",
+                "notes": [],
+                "status": "active",
+                "updated_at": None,
+            }
+
+        jobids = []
+        for kwarg in parse_qs(url.query).get("kwargs", []):
+            name, value = kwarg.split("=", 1)
+            if name == "jobid":
+                jobids = value.split(",")
+
+        time.sleep(per_job_latency * len(jobids))
+
+        return {
+            "status": "OK",
+            "output": [{"jobid": jobid, "state": "RUNNING"} for jobid in jobids],
+        }
+
+    async def _run(base_url: str, chunk_size: Optional[int], concurrency: int):
+        async with AsyncClient(
+            api_base_url=base_url,
+            access_token="benchmark",
+            jobid_chunk_size=chunk_size,
+            jobid_chunk_concurrency=concurrency,
+        ) as client:
+            compute = await client.compute("perlmutter")
+
+            start = time.perf_counter()
+            fetched = await compute.jobs(
+                jobids=list(range(jobs)), command=JobCommand.squeue
+            )
+            elapsed = time.perf_counter() - start
+            assert len(fetched) == jobs
+
+            return elapsed
+
+    def _requests(chunk_size: Optional[int]) -> int:
+        return 1 if chunk_size is None else -(-jobs // chunk_size)
+
+    with stand_in_server(_handler, latency) as base_url:
+        try:
+            elapsed = asyncio.run(_run(base_url, None, 1))
+            _report("no chunking", _requests(None), elapsed)
+        except (httpx.HTTPStatusError, httpx.InvalidURL) as ex:
+            typer.echo(f"{'no chunking':<30} failed: {ex}")
+
+        elapsed = asyncio.run(_run(base_url, chunk_size, 1))
+        _report(f"chunk_size={chunk_size}", _requests(chunk_size), elapsed)
+
+        elapsed = asyncio.run(_run(base_url, chunk_size, concurrency))
+        _report(
+            f"chunk_size={chunk_size} x{concurrency}", _requests(chunk_size), elapsed
+        )
+
+
+def _report_objects(name: str, count: int, elapsed: float):
+    typer.echo(
+        f"{name:<30} {count:>8} objects {elapsed:>8.3f}s {count / elapsed:>10.1f}/s"
+    )
+
+
+def _best_of(fn: Callable[[], int], repeat: int) -> float:
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    return best
+
+
+#
+# Objects per second when building jobs, directory entries and group members
+# from API responses, the time taken to make the requests is not included.
+#
+@cli.command(name="objects")
+def objects(
+    count: int = typer.Option(10000, help="Number of objects"),
+    repeat: int = typer.Option(3, help="Number of runs, the best is reported"),
+):
+    from sfapi_client.compute import AsyncCompute
+    from sfapi_client.groups import AsyncGroup
+    from sfapi_client.jobs import AsyncJobSacct
+    from sfapi_client.paths import AsyncRemotePath
+    from sfapi_client._jobs import JobStateResponse
+    from sfapi_client._models.job_status_response_sacct import OutputItem
+
+    compute = AsyncCompute.model_construct(name="perlmutter", client=None)
+
+    # sacct rows with every field set, built as _fetch_jobs does
+    jobs_response = {
+        "status": "OK",
+        "output": [
+            dict({field: str(i) for field in OutputItem.model_fields}, state="RUNNING")
+            for i in range(count)
+        ],
+    }
+
+    def _jobs():
+        output = JobStateResponse.model_validate(jobs_response).output
+        return [
+            AsyncJobSacct.model_validate(dict(state, compute=compute))
+            for state in output
+        ]
+
+    _report_objects("jobs (sacct)", count, _best_of(_jobs, repeat))
+
+    ls_response = httpx.Response(
+        200,
+        json={
+            "status": "OK",
+            "entries": [
+                {
+                    "perms": "-rw-r--r--",
+                    "hardlinks": 1,
+                    "user": "user",
+                    "group": "group",
+                    "size": i,
+                    "date": "2024-01-01T00:00:00",
+                    "name": f"file{i}",
+                }
+                for i in range(count)
+            ],
+        },
+    )
+
+    def _entries():
+        return AsyncRemotePath._parse_ls(compute, "/tmp", ls_response)
+
+    _report_objects("directory entries", count, _best_of(_entries, repeat))
+
+    group_response = {
+        "gid": 1,
+        "name": "group",
+        "users": [{"uid": i, "name": f"user{i}"} for i in range(count)],
+    }
+
+    def _members():
+        group = AsyncGroup.model_validate(dict(group_response, client=None))
+        return group.members
+
+    _report_objects("group members", count, _best_of(_members, repeat))
+
+
+def _report_decode(name: str, size: int, elapsed: float):
+    typer.echo(
+        f"{name:<40} {size / 1e6:>8.1f}MB {elapsed * 1000:>8.1f}ms"
+        f" {size / 1e6 / elapsed:>8.1f}MB/s"
+    )
+
+
+#
+# Decoding and validating large responses, a sacct dump and a directory
+# listing, with the stdlib decoder, orjson ( if installed ) and pydantic
+# validating directly from the bytes. Recorded responses can be used in place
+# of the generated ones.
+#
+@cli.command(name="decode")
+def decode(
+    count: int = typer.Option(10000, help="Number of jobs and directory entries"),
+    repeat: int = typer.Option(3, help="Number of runs, the best is reported"),
+    jobs_response: Optional[Path] = typer.Option(
+        None, help="A recorded sacct response to use"
+    ),
+    ls_response: Optional[Path] = typer.Option(
+        None, help="A recorded directory listing response to use"
+    ),
+):
+    from sfapi_client._jobs import JobStateResponse
+    from sfapi_client._json import orjson
+    from sfapi_client._models.job_status_response_sacct import OutputItem
+    from sfapi_client._async.paths import AsyncRemotePath, _DirectoryListingResponse
+
+    if jobs_response is not None:
+        jobs_body = jobs_response.read_bytes()
+    else:
+        jobs_body = json.dumps(
+            {
+                "status": "OK",
+                "output": [
+                    dict(
+                        {field: str(i) for field in OutputItem.model_fields},
+                        state="COMPLETED",
+                    )
+                    for i in range(count)
+                ],
+            }
+        ).encode()
+
+    if ls_response is not None:
+        ls_body = ls_response.read_bytes()
+    else:
+        ls_body = json.dumps(
+            {
+                "status": "OK",
+                "entries": [
+                    {
+                        "perms": "-rw-r--r--",
+                        "hardlinks": 1,
+                        "user": "user",
+                        "group": "group",
+                        "size": i,
+                        "date": "2024-01-01T00:00:00",
+                        "name": f"file{i}",
+                    }
+                    for i in range(count)
+                ],
+            }
+        ).encode()
+
+    decoders = {"json": json.loads}
+    if orjson is not None:
+        decoders["orjson"] = orjson.loads
+
+    for name, model, body in [
+        ("jobs", JobStateResponse, jobs_body),
+        ("directory listing", _DirectoryListingResponse, ls_body),
+    ]:
+        for decoder_name, loads in decoders.items():
+            elapsed = _best_of(lambda: model.model_validate(loads(body)), repeat)
+            _report_decode(f"{name} {decoder_name}", len(body), elapsed)
+
+        elapsed = _best_of(lambda: model.model_validate_json(body), repeat)
+        _report_decode(f"{name} model_validate_json", len(body), elapsed)
+
+    # The full ls path, as used by RemotePath.ls()
+    compute = None
+    response = httpx.Response(200, content=ls_body)
+    elapsed = _best_of(
+        lambda: AsyncRemotePath._parse_ls(compute, "/tmp", response), repeat
+    )
+    _report_decode("directory listing to paths", len(ls_body), elapsed)
+
+
+if __name__ == "__main__":
+    cli()
@@ -35,11 +35,13 @@ def run_unasync():
         "AsyncJobSacct": "JobSacct",
         "AsyncJobSqueue": "JobSqueue",
         "AsyncOAuth2Client": "OAuth2Client",
+        "AsyncRetrying": "Retrying",
         "AsyncStorage": "Storage",
         "AsyncGlobusStorage": "GlobusStorage",
         "AsyncGlobusTransfer": "GlobusTransfer",
         "aclose": "close",
         "_ASYNC_SLEEP": "_SLEEP",
+        "_ASYNC_MAP": "_MAP",
     }
     rules = [
         unasync.Rule(
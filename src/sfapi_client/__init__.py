@@ -1,6 +1,7 @@
 from .client import AsyncClient  # noqa: F401
 from .client import Client  # noqa: F401
 from .exceptions import SfApiError  # noqa: F401
+from .exceptions import SubmitJobsError  # noqa: F401
 from ._models import OutageStatusValue  # noqa: F401
 from ._models import StatusValue  # noqa: F401
 from ._models.resources import Resource  # noqa: F401
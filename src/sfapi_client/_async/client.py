@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Dict, Any, Optional, cast, List, Union
+from typing import Dict, Any, Optional, List, Union
 from pathlib import Path
 import json
 
@@ -10,6 +10,11 @@ import tenacity
 
 from .compute import Machine, AsyncCompute
 from ..exceptions import ClientKeyError
+from .._limiter import AsyncRateLimiter, RateLimit
+from .._retry import RetryPolicy
+from .._token import AsyncTokenRefresher, TokenCache
+from .._cache import AsyncSingleFlight, ResponseCache, ConditionalCache
+from .._json import DEFAULT_JSON_LOADS, JsonLoads
 from .._models import (
     Changelog as ChangelogItem,
     Config as ConfItem,
@@ -26,25 +31,7 @@ from .paths import AsyncRemotePath
 
 SFAPI_TOKEN_URL = "https://oidc.nersc.gov/c2id/token"
 SFAPI_BASE_URL = "https://api.nersc.gov/api/v1.2"
-MAX_RETRY = 10
-
-
-# Retry on httpx.HTTPStatusError recoverable status codes
-class retry_if_http_status_error(tenacity.retry_if_exception):
-    def __init__(self):
-        super().__init__(self._retry)
-
-    def _retry(self, e: Exception):
-        retry_codes = [
-            httpx.codes.TOO_MANY_REQUESTS,
-            httpx.codes.BAD_GATEWAY,
-            httpx.codes.SERVICE_UNAVAILABLE,
-            httpx.codes.GATEWAY_TIMEOUT,
-        ]
-        return (
-            isinstance(e, httpx.HTTPStatusError)
-            and cast(httpx.HTTPStatusError, e).response.status_code in retry_codes
-        )
+SFAPI_TIMEOUT = 10.0
 
 
 class AsyncApi:
@@ -64,7 +51,7 @@ class AsyncApi:
         """
         r = await self._client.get("meta/changelog")
 
-        json_response = r.json()
+        json_response = self._client._json(r)
 
         return [ChangelogItem.model_validate(i) for i in json_response]
 
@@ -77,7 +64,7 @@ class AsyncApi:
         """
         r = await self._client.get("meta/config")
 
-        json_response = r.json()
+        json_response = self._client._json(r)
 
         config_items = [ConfItem.model_validate(i) for i in json_response]
 
@@ -129,7 +116,7 @@ class AsyncResources:
         """
         resource_path = self._resource_name(resource_name)
         response = await self._client.get(f"status/outages{resource_path}")
-        json_response = response.json()
+        json_response = self._client._json(response)
 
         if resource_name:
             outages = [Outage.model_validate(o) for o in json_response]
@@ -151,7 +138,7 @@ class AsyncResources:
         """
         resource_path = self._resource_name(resource_name)
         response = await self._client.get(f"status/outages/planned{resource_path}")
-        json_response = response.json()
+        json_response = self._client._json(response)
 
         if resource_name:
             outages = [Outage.model_validate(o) for o in json_response]
@@ -173,7 +160,7 @@ class AsyncResources:
         """
         resource_path = self._resource_name(resource_name)
         response = await self._client.get(f"status/notes{resource_path}")
-        json_response = response.json()
+        json_response = self._client._json(response)
 
         if resource_name:
             notes = [Note.model_validate(n) for n in json_response]
@@ -196,7 +183,7 @@ class AsyncResources:
         resource_path = self._resource_name(resource_name)
 
         response = await self._client.get(f"status{resource_path}")
-        json_response = response.json()
+        json_response = self._client._json(response)
 
         if resource_name:
             status = Status.model_validate(json_response)
@@ -217,6 +204,22 @@ class AsyncClient:
         token_url: Optional[str] = SFAPI_TOKEN_URL,
         access_token: Optional[str] = None,
         wait_interval: int = 10,
+        timeout: Union[float, httpx.Timeout] = SFAPI_TIMEOUT,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        rate_limits: Optional[Dict[str, RateLimit]] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        token_cache: Optional[TokenCache] = None,
+        coalesce_requests: bool = False,
+        response_cache: Optional[ResponseCache] = None,
+        conditional_requests: bool = False,
+        watch_jobs: bool = False,
+        watch_jobs_thread: bool = False,
+        jobid_chunk_size: Optional[int] = 500,
+        jobid_chunk_concurrency: int = 4,
+        cached_job_state: bool = False,
+        task_interval: float = 1,
+        json_loads: Optional[JsonLoads] = None,
     ):
         """
         Create a client instance.
@@ -235,6 +238,51 @@ class AsyncClient:
         :param api_base_url: The API base URL
         :param token_url: The token URL
         :param access_token: An existing access token
+        :param timeout: The request timeout in seconds, or a `httpx.Timeout` to
+        configure the connect, read, write and pool timeouts individually
+        :param limits: The connection pool limits, a `httpx.Limits` instance
+        that sets the maximum number of connections, keep-alive connections and
+        keep-alive expiry. Defaults to the httpx limits
+        :param http2: Enable HTTP/2, this allows requests to be multiplexed over a
+        single connection. Requires the `http2` extra to be installed
+        :param rate_limits: Limits applied to the requests made by the client, keyed
+        by URL prefix ( for example `compute/jobs` ), the empty prefix applies to
+        all requests. Requests wait for the limit rather than being rejected by
+        the server
+        :param retry_policy: The policy used to retry requests that fail with a
+        recoverable error, defaults to `RetryPolicy()`
+        :param token_cache: A cache used to share access tokens between processes
+        using the same client credentials, see `TokenCache`
+        :param coalesce_requests: Share a single request between concurrent GET
+        requests for the same URL and parameters. A GET made while an identical
+        GET is in flight gets the response to that request, which may have been
+        sent before the call was made
+        :param response_cache: A cache for the responses of slowly changing
+        endpoints such as the resource status, see `ResponseCache`
+        :param conditional_requests: Make GET requests conditional ( using the ETag
+        or Last-Modified of the previous response ), so unchanged responses are
+        not downloaded again
+        :param watch_jobs: Use a single background watcher per compute resource to
+        wait for jobs, the state of all the jobs being waited on is fetched in a
+        batched request every `wait_interval` seconds rather than each job polling
+        for its own state
+        :param watch_jobs_thread: Only used by the sync client with `watch_jobs`,
+        poll for the watched jobs from a background daemon thread rather than
+        from one of the waiting threads
+        :param jobid_chunk_size: The maximum number of jobids fetched in a single
+        job state request, larger lists are split into chunks. None disables
+        chunking
+        :param jobid_chunk_concurrency: The maximum number of chunks fetched
+        concurrently
+        :param cached_job_state: Allow job state to come from the server side cache
+        rather than running squeue/sacct for every request. The state may be a
+        few seconds stale, this can be overridden per call
+        :param task_interval: The interval in seconds between polls for the state
+        of command and job submission tasks, the outstanding tasks for a compute
+        resource are fetched together
+        :param json_loads: The function used to decode JSON responses, it is
+        passed the response body as bytes. Defaults to `orjson.loads` if orjson
+        is installed ( the `orjson` extra ), otherwise `json.loads`
 
         :return: The client instance
         :rtype: AsyncClient
@@ -250,15 +298,48 @@ class AsyncClient:
         self._token_url = token_url
         self._client_user = None
         self.__http_client = None
+        self._token_refresher = None
         self._api = None
         self._resources = None
         self._storage = None
         self._wait_interval = wait_interval
         self._access_token = access_token
+        self._timeout = timeout
+        self._limits = limits
+        self._http2 = http2
+        self._rate_limiter = AsyncRateLimiter(rate_limits)
+        self._retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self._token_cache = token_cache
+        self._single_flight = AsyncSingleFlight() if coalesce_requests else None
+        self._response_cache = response_cache
+        self._conditional_cache = ConditionalCache() if conditional_requests else None
+        self._watch_jobs = watch_jobs
+        self._watch_jobs_thread = watch_jobs_thread
+        self._jobid_chunk_size = jobid_chunk_size
+        self._jobid_chunk_concurrency = jobid_chunk_concurrency
+        self._cached_job_state = cached_job_state
+        self._task_interval = task_interval
+        self._json_loads = json_loads if json_loads is not None else DEFAULT_JSON_LOADS
 
     async def __aenter__(self):
         return self
 
+    # Decode the body of a JSON response
+    def _json(self, response: httpx.Response) -> Any:
+        return self._json_loads(response.content)
+
+    def _transport_kwargs(self) -> Dict[str, Any]:
+        # The transport configuration is shared by the OAuth2 client and the
+        # regular client used with an access token.
+        kwargs = {
+            "timeout": self._timeout,
+            "http2": self._http2,
+        }
+        if self._limits is not None:
+            kwargs["limits"] = self._limits
+
+        return kwargs
+
     async def _http_client(self):
         headers = {"accept": "application/json"}
         # If we have a client_id then we need to use the OAuth2 client
@@ -271,28 +352,25 @@ class AsyncClient:
                     token_endpoint_auth_method=PrivateKeyJWT(self._token_url),
                     grant_type="client_credentials",
                     token_endpoint=self._token_url,
-                    timeout=10.0,
                     headers=headers,
+                    **self._transport_kwargs(),
+                )
+                self._token_refresher = AsyncTokenRefresher(
+                    self.__http_client, cache=self._token_cache
                 )
 
-                await self.__http_client.fetch_token()
-            else:
-                if self.__http_client.token is None:
-                    # We don't have a token, fetch one
-                    await self.__http_client.fetch_token()
-                else:
-                    # We have a session
-                    # Make sure it's still active
-                    await self.__http_client.ensure_active_token(
-                        self.__http_client.token
-                    )
+            # Fetch a token if we don't have a valid one, the token is then
+            # refreshed in the background before it expires.
+            await self._token_refresher.ensure_token()
         # Use regular client, but add the access token if we have one
         elif self.__http_client is None:
             # We already have an access token
             if self._access_token is not None:
                 headers.update({"Authorization": f"Bearer {self._access_token}"})
 
-            self.__http_client = httpx.AsyncClient(headers=headers)
+            self.__http_client = httpx.AsyncClient(
+                headers=headers, **self._transport_kwargs()
+            )
 
         return self.__http_client
 
@@ -312,6 +390,9 @@ class AsyncClient:
         """
         Release resources associated with the client instance.
         """
+        if self._token_refresher is not None:
+            await self._token_refresher.close()
+
         if self.__http_client is not None:
             await self.__http_client.aclose()
 
@@ -365,82 +446,81 @@ class AsyncClient:
         if len(self._client_id) != 13:
             raise ClientKeyError(f"client_id not found in file {key_path}")
 
-    @tenacity.retry(
-        retry=tenacity.retry_if_exception_type(httpx.TimeoutException)
-        | tenacity.retry_if_exception_type(httpx.ConnectError)
-        | retry_if_http_status_error(),
-        wait=tenacity.wait_exponential(max=MAX_RETRY),
-        stop=tenacity.stop_after_attempt(MAX_RETRY),
-    )
-    async def get(self, url: str, params: Dict[str, Any] = {}) -> httpx.Response:
+    async def _send(self, method: str, url: str, **kwargs) -> httpx.Response:
         client = await self._http_client()
-        r = await client.get(
-            f"{self._api_base_url}/{url}",
-            params=params,
-        )
-        r.raise_for_status()
+
+        async with self._rate_limiter.limit(url):
+            r = await client.request(
+                method,
+                f"{self._api_base_url}/{url}",
+                **kwargs,
+            )
+        # Not modified is handled by the caller of a conditional request
+        if r.status_code != httpx.codes.NOT_MODIFIED:
+            r.raise_for_status()
 
         return r
 
-    @tenacity.retry(
-        retry=tenacity.retry_if_exception_type(httpx.TimeoutException)
-        | tenacity.retry_if_exception_type(httpx.ConnectError)
-        | retry_if_http_status_error(),
-        wait=tenacity.wait_exponential(max=MAX_RETRY),
-        stop=tenacity.stop_after_attempt(MAX_RETRY),
-    )
-    async def post(
-        self, url: str, data: Dict[str, Any] = None, json: Dict[str, Any] = None
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        retrying = tenacity.AsyncRetrying(**self._retry_policy._retrying_kwargs())
+
+        return await retrying(self._send, method, url, **kwargs)
+
+    async def _get(
+        self, url: str, params: Dict[str, Any], query: str
     ) -> httpx.Response:
-        client = await self._http_client()
+        if self._conditional_cache is None:
+            return await self._request("GET", url, params=params)
 
-        r = await client.post(
-            f"{self._api_base_url}/{url}",
-            data=data,
-            json=json,
-        )
-        r.raise_for_status()
+        headers = self._conditional_cache.headers(url, query)
+        r = await self._request("GET", url, params=params, headers=headers)
 
-        return r
+        if r.status_code == httpx.codes.NOT_MODIFIED:
+            cached = self._conditional_cache.cached(url, query)
+            if cached is not None:
+                return cached
 
-    @tenacity.retry(
-        retry=tenacity.retry_if_exception_type(httpx.TimeoutException)
-        | tenacity.retry_if_exception_type(httpx.ConnectError)
-        | retry_if_http_status_error(),
-        wait=tenacity.wait_exponential(max=MAX_RETRY),
-        stop=tenacity.stop_after_attempt(MAX_RETRY),
-    )
-    async def put(
-        self, url: str, data: Dict[str, Any] = None, files: Dict[str, Any] = None
-    ) -> httpx.Response:
-        client = await self._http_client()
+            # The stored response has been evicted, so we need it again
+            r = await self._request("GET", url, params=params)
 
-        r = await client.put(
-            f"{self._api_base_url}/{url}",
-            data=data,
-            files=files,
-        )
-        r.raise_for_status()
+        self._conditional_cache.store(url, query, r)
 
         return r
 
-    @tenacity.retry(
-        retry=tenacity.retry_if_exception_type(httpx.TimeoutException)
-        | tenacity.retry_if_exception_type(httpx.ConnectError)
-        | retry_if_http_status_error(),
-        wait=tenacity.wait_exponential(max=MAX_RETRY),
-        stop=tenacity.stop_after_attempt(MAX_RETRY),
-    )
-    async def delete(self, url: str) -> httpx.Response:
-        client = await self._http_client()
+    async def get(self, url: str, params: Dict[str, Any] = {}) -> httpx.Response:
+        query = str(httpx.QueryParams(params))
+
+        if self._response_cache is not None:
+            r = self._response_cache.get(url, query, self._api_base_url)
+            if r is not None:
+                return r
+
+        if self._single_flight is None:
+            r = await self._get(url, params, query)
+        else:
+            # Identical GETs that are in flight share the same response
+            r = await self._single_flight.run(
+                (url, query), self._get, url, params, query
+            )
 
-        r = await client.delete(
-            f"{self._api_base_url}/{url}",
-        )
-        r.raise_for_status()
+        if self._response_cache is not None:
+            self._response_cache.put(url, query, r, self._api_base_url)
 
         return r
 
+    async def post(
+        self, url: str, data: Dict[str, Any] = None, json: Dict[str, Any] = None
+    ) -> httpx.Response:
+        return await self._request("POST", url, data=data, json=json)
+
+    async def put(
+        self, url: str, data: Dict[str, Any] = None, files: Dict[str, Any] = None
+    ) -> httpx.Response:
+        return await self._request("PUT", url, data=data, files=files)
+
+    async def delete(self, url: str) -> httpx.Response:
+        return await self._request("DELETE", url)
+
     async def compute(self, machine: Union[Machine, str]) -> AsyncCompute:
         """Create a compute site to submit jobs or view jobs in the queue
 
@@ -452,9 +532,10 @@ class AsyncClient:
         machine = Machine(machine)
         response = await self.get(f"status/{machine.value}")
 
-        values = response.json()
+        values = self._json(response)
         values["client"] = self
         compute = AsyncCompute.model_validate(values)
+        compute._response = response
 
         return compute
 
@@ -485,6 +566,21 @@ class AsyncClient:
         """
         return await AsyncGroup._fetch_group(self, name)
 
+    @property
+    def response_cache(self) -> Optional[ResponseCache]:
+        """
+        The response cache used by the client, if any.
+        """
+        return self._response_cache
+
+    @property
+    def rate_limiter(self) -> AsyncRateLimiter:
+        """
+        The rate limiter used by the client, it provides statistics on the time
+        requests have spent waiting.
+        """
+        return self._rate_limiter
+
     @property
     def api(self) -> AsyncApi:
         """
@@ -1,8 +1,10 @@
-from typing import Dict, List, Optional, Union
+import sys
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
 from pydantic import PrivateAttr, ConfigDict, BaseModel
-from ..exceptions import SfApiError
-from .._utils import _ASYNC_SLEEP
-from .jobs import AsyncJobSacct, AsyncJobSqueue, JobCommand
+from ..exceptions import SfApiError, SubmitJobsError
+from .._utils import _ASYNC_SLEEP, _ASYNC_MAP
+from .jobs import AsyncJobSacct, AsyncJobSqueue, JobCommand, _fetch_raw_state
 from .._models import (
     AppRoutersStatusModelsStatus as ComputeBase,
     Task as TaskResponse,
@@ -12,8 +14,16 @@ from .._models import (
     AppRoutersComputeModelsStatus as RunCommandResponseStatus,
 )
 from .paths import AsyncRemotePath
-from .._monitor import AsyncJobMonitor
-from .._compute import SubmitJobResponse, SubmitJobResponseStatus, TaskStatus
+from .._callback import AsyncCallbackReceiver
+from .._monitor import AsyncJobMonitor, AsyncJobWatcher, AsyncTaskMonitor
+from .._compute import (
+    SubmitJobResponse,
+    SubmitJobResponseStatus,
+    TaskStatus,
+    TASK_TERMINAL_STATUSES,
+)
+from .._jobs import JobStateChange, TERMINAL_STATES, STATE_FIELDS
+from .._table import JobTable
 from .._utils import check_auth
 
 # Patch to return str names from Enum of py3.11
@@ -50,9 +60,8 @@ class AsyncCommandTask(BaseModel):
         :return: The raw task response returned by the API.
         """
         r = await self.compute.client.get(f"tasks/{self.id}")
-        json_response = r.json()
 
-        return TaskResponse.model_validate(json_response)
+        return TaskResponse.model_validate_json(r.content)
 
     async def update(self):
         """
@@ -60,7 +69,11 @@ class AsyncCommandTask(BaseModel):
 
         :return: The updated task instance.
         """
-        task = await self._fetch()
+        self._apply(await self._fetch())
+
+        return self
+
+    def _apply(self, task: TaskResponse):
         if task.status is not None:
             # Map the status return by the API (lowercase string) to our TaskStatus enum ( uppercase )
             # We do this for consistency as all our enums are uppercase
@@ -69,20 +82,11 @@ class AsyncCommandTask(BaseModel):
         if task.result is not None:
             self.result = AsyncCommandTaskResult.model_validate_json(task.result)
 
-        return self
-
     async def _wait(self):
-        while True:
-            await self.update()
-
-            if self.status in [
-                TaskStatus.COMPLETED,
-                TaskStatus.CANCELLED,
-                TaskStatus.FAILED,
-            ]:
-                return self
+        if self.status in TASK_TERMINAL_STATUSES:
+            return self
 
-            await _ASYNC_SLEEP(1)
+        return await self.compute._task_monitor.wait(self)
 
     def __await__(self):
         return self._wait().__await__()
@@ -97,12 +101,19 @@ class AsyncCommandTask(BaseModel):
 class AsyncCompute(ComputeBase):
     client: Optional["AsyncClient"]  # noqa: F821
     _monitor: AsyncJobMonitor = PrivateAttr()
+    _watcher: Optional[AsyncJobWatcher] = PrivateAttr(None)
+    _task_monitor: AsyncTaskMonitor = PrivateAttr()
+    # The response the status was last read from
+    _response: Any = PrivateAttr(None)
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._monitor = AsyncJobMonitor(self)
+        self._task_monitor = AsyncTaskMonitor(self)
+        if self.client is not None and self.client._watch_jobs:
+            self._watcher = AsyncJobWatcher(self)
 
     def dict(self, *args, **kwargs) -> Dict:
         if "exclude" not in kwargs:
@@ -112,30 +123,211 @@ class AsyncCompute(ComputeBase):
     async def _wait_for_task(self, task_id) -> AsyncCommandTaskResult:
 
         task = AsyncCommandTask(compute=self, id=task_id)
+        await task._wait()
 
-        while True:
-            await task.update()
-
-            if task.status is TaskStatus.FAILED:
-                raise SfApiError(task.result)
-
-            if task.status not in [TaskStatus.COMPLETED, TaskStatus.CANCELLED]:
-                await _ASYNC_SLEEP(1)
-                continue
+        if task.status is TaskStatus.FAILED:
+            raise SfApiError(task.result)
 
-            return task.result
+        return task.result
 
     @check_auth
     async def submit_job(
-        self, script: Union[str, AsyncRemotePath], args: Optional[List[str]] = None
+        self,
+        script: Union[str, AsyncRemotePath],
+        args: Optional[List[str]] = None,
+        callback: Optional[AsyncCallbackReceiver] = None,
+        callback_email: Optional[str] = None,
+        callback_timeout: Optional[int] = None,
     ) -> AsyncJobSqueue:
         """Submit a job to the compute resource
 
         :param script: Path to file on the compute system, or script to run beginning with `#!`.
         :param args: An optional list of command line arguments to pass to the script.
+        :param callback: An optional receiver for the job completion callback, waiting
+        for the job to complete then waits for the callback rather than polling.
+        :param callback_email: An optional email address to notify when the job completes.
+        :param callback_timeout: An optional timeout in seconds for the completion callback.
         :return: Object containing information about the job, its job id, and status on the system.
         """
+        try:
+            [job] = await self._submit_jobs(
+                [(script, args)], callback, 1, callback_email, callback_timeout
+            )
+        except SubmitJobsError as ex:
+            raise ex.errors[0] from None
+
+        return job
+
+    @check_auth
+    async def submit_jobs(
+        self,
+        scripts: List[
+            Union[str, AsyncRemotePath, Tuple[Union[str, AsyncRemotePath], List[str]]]
+        ],
+        concurrency: int = 8,
+        callback: Optional[AsyncCallbackReceiver] = None,
+        callback_email: Optional[str] = None,
+        callback_timeout: Optional[int] = None,
+    ) -> List[AsyncJobSqueue]:
+        """Submit multiple jobs to the compute resource
+
+        The jobs are submitted concurrently and the submission tasks are then
+        resolved together, rather than each job being submitted and resolved in
+        turn.
+
+        :param scripts: The jobs to submit, each is a path to a file on the compute
+        system, a script beginning with `#!` or a tuple of path and the command line
+        arguments to pass to the script.
+        :param concurrency: The maximum number of submissions in flight at a time.
+        :param callback: An optional receiver for the job completion callbacks.
+        :param callback_email: An optional email address to notify when each job completes.
+        :param callback_timeout: An optional timeout in seconds for the completion callbacks.
+        :return: The jobs, in the same order as the scripts.
+        :raises SubmitJobsError: If any of the submissions failed, no further
+        jobs are posted and the error holds the jobs that were submitted.
+        """
+        scripts = [s if isinstance(s, tuple) else (s, None) for s in scripts]
+
+        return await self._submit_jobs(
+            scripts, callback, concurrency, callback_email, callback_timeout
+        )
+
+    async def _submit_jobs(
+        self,
+        scripts: List[Tuple[Union[str, AsyncRemotePath], Optional[List[str]]]],
+        callback: Optional[AsyncCallbackReceiver],
+        concurrency: int,
+        callback_email: Optional[str] = None,
+        callback_timeout: Optional[int] = None,
+    ) -> List[AsyncJobSqueue]:
+        if callback is not None:
+            await callback.start()
+
+        callbacks = [
+            callback._register() if callback is not None else None for _ in scripts
+        ]
+
+        task_ids: List[Optional[str]] = [None] * len(scripts)
+        jobs: List[Optional[AsyncJobSqueue]] = [None] * len(scripts)
+        errors: List[Optional[Exception]] = [None] * len(scripts)
+
+        async def _post(i):
+            # Once a submission has failed don't post any more, those already
+            # in flight are left to complete so their jobs are not lost.
+            if any(e is not None for e in errors):
+                errors[i] = SfApiError("Not submitted, an earlier submission failed")
+                return
+
+            script, args = scripts[i]
+            callback_url = callbacks[i].url if callbacks[i] is not None else None
+
+            try:
+                task_ids[i] = await self._post_job(
+                    script, args, callback_url, callback_email, callback_timeout
+                )
+            except Exception as ex:
+                errors[i] = ex
+
+        async def _resolve(i):
+            try:
+                job = await self._job_from_task(task_ids[i])
+            except Exception as ex:
+                errors[i] = ex
+                return
+
+            job._callback = callbacks[i]
+            jobs[i] = job
+
+        try:
+            await _ASYNC_MAP(_post, range(len(scripts)), concurrency)
+
+            # We now need waiting for the tasks to complete! The task monitor
+            # polls for all of them together, so they are all waited on at once
+            # rather than limited by the submission concurrency.
+            posted = [i for i, task_id in enumerate(task_ids) if task_id is not None]
+            await _ASYNC_MAP(_resolve, posted, len(posted))
+        except BaseException:
+            for c in callbacks:
+                if c is not None:
+                    c.cancel()
+            raise
+
+        if any(e is not None for e in errors):
+            for job, c in zip(jobs, callbacks):
+                if job is None and c is not None:
+                    c.cancel()
+
+            raise SubmitJobsError(jobs, task_ids, errors)
+
+        return jobs
+
+    @check_auth
+    async def cancel_jobs(
+        self,
+        jobids: List[Union[int, str]],
+        wait: bool = False,
+        concurrency: int = 8,
+        timeout: int = sys.maxsize,
+    ) -> Optional[List[AsyncJobSacct]]:
+        """Cancel multiple jobs
+
+        The cancellations are submitted concurrently, when waiting the state of
+        all the jobs is confirmed with a single batched request each
+        `wait_interval`.
+
+        :param jobids: The ids of the jobs to cancel.
+        :param wait: True, to wait for the jobs to finish, otherwise returns when
+        the cancellations have been submitted.
+        :param concurrency: The maximum number of cancellations in flight at a time.
+        :param timeout: The maximum time to wait for in seconds
+        :return: The jobs in their final state if waiting, otherwise None.
+        :raises SfApiError: if a job isn't found when waiting
+        :raises TimeoutError: if timeout is reached
+        """
+        jobids = list(map(str, jobids))
+
+        async def _delete(jobid):
+            await self.client.delete(f"compute/jobs/{self.name}/{jobid}")
 
+        await _ASYNC_MAP(_delete, jobids, concurrency)
+
+        if not wait:
+            return None
+
+        deadline = time.monotonic() + timeout
+        finished = {}
+        while True:
+            pending = [i for i in jobids if i not in finished]
+            jobs = await self._monitor.fetch_jobs(
+                job_type=AsyncJobSacct, jobids=pending, fields=STATE_FIELDS
+            )
+
+            # Otherwise we would wait forever for a job that doesn't exist
+            fetched = {j.jobid for j in jobs}
+            unknown = [i for i in pending if i not in fetched]
+            if unknown:
+                raise SfApiError(f"Jobs not found: {', '.join(unknown)}")
+
+            # A job may have finished before it was cancelled
+            finished.update({j.jobid: j for j in jobs if j.state in TERMINAL_STATES})
+
+            if len(finished) == len(jobids):
+                return [finished[i] for i in jobids]
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError()
+
+            await _ASYNC_SLEEP(min(self.client._wait_interval, remaining))
+
+    async def _post_job(
+        self,
+        script: Union[str, AsyncRemotePath],
+        args: Optional[List[str]] = None,
+        callback_url: Optional[str] = None,
+        callback_email: Optional[str] = None,
+        callback_timeout: Optional[int] = None,
+    ) -> str:
         is_path: bool = True
 
         # If it's a remote path we've already checked so just continue
@@ -159,19 +351,24 @@ class AsyncCompute(ComputeBase):
                     "Command line arguments cannot be passed when the script is not a file."
                 )
             data["args"] = args
+        if callback_url is not None:
+            data["callbackUrl"] = callback_url
+        if callback_email is not None:
+            data["callbackEmail"] = callback_email
+        if callback_timeout is not None:
+            data["callbackTimeout"] = callback_timeout
 
         r = await self.client.post(f"compute/jobs/{self.name}", data)
         r.raise_for_status()
 
-        json_response = r.json()
-        job_response = SubmitJobResponse.model_validate(json_response)
+        job_response = SubmitJobResponse.model_validate_json(r.content)
 
         if job_response.status == SubmitJobResponseStatus.ERROR:
             raise SfApiError(job_response.error)
 
-        task_id = job_response.task_id
+        return job_response.task_id
 
-        # We now need waiting for the task to complete!
+    async def _job_from_task(self, task_id: str) -> AsyncJobSqueue:
         task_result = await self._wait_for_task(task_id)
         if task_result.status == "error":
             raise SfApiError(task_result.error)
@@ -187,11 +384,17 @@ class AsyncCompute(ComputeBase):
 
     @check_auth
     async def job(
-        self, jobid: Union[int, str], command: Optional[JobCommand] = JobCommand.sacct
+        self,
+        jobid: Union[int, str],
+        command: Optional[JobCommand] = JobCommand.sacct,
+        cached: Optional[bool] = None,
+        fields: Optional[List[str]] = None,
     ) -> Union["AsyncJobSacct", "AsyncJobSqueue"]:
         # Get different job depending on query
         Job = AsyncJobSacct if (command == JobCommand.sacct) else AsyncJobSqueue
-        jobs = await self._monitor.fetch_jobs(job_type=Job, jobids=[jobid])
+        jobs = await self._monitor.fetch_jobs(
+            job_type=Job, jobids=[jobid], cached=cached, fields=fields
+        )
         if len(jobs) == 0:
             raise SfApiError(f"Job not found: {jobid}")
 
@@ -204,16 +407,116 @@ class AsyncCompute(ComputeBase):
         user: Optional[str] = None,
         partition: Optional[str] = None,
         command: Optional[JobCommand] = JobCommand.squeue,
-    ) -> List[Union[AsyncJobSacct, AsyncJobSqueue]]:
+        cached: Optional[bool] = None,
+        table: bool = False,
+        fields: Optional[List[str]] = None,
+    ) -> Union[List[Union[AsyncJobSacct, AsyncJobSqueue]], JobTable]:
         Job = AsyncJobSacct if (command == JobCommand.sacct) else AsyncJobSqueue
 
+        # Build the columns directly from the output, skipping the job objects
+        if table:
+            output = await _fetch_raw_state(
+                self,
+                jobids,
+                user,
+                partition,
+                command == JobCommand.sacct,
+                cached,
+                fields,
+            )
+
+            return JobTable._from_output(output)
+
         # If we have been given just jobids, use the monitor
         if jobids is not None and user is None and partition is None:
-            return await self._monitor.fetch_jobs(job_type=Job, jobids=jobids)
+            return await self._monitor.fetch_jobs(
+                job_type=Job, jobids=jobids, cached=cached, fields=fields
+            )
         else:
             return await Job._fetch_jobs(
-                self, jobids=jobids, user=user, partition=partition
+                self,
+                jobids=jobids,
+                user=user,
+                partition=partition,
+                cached=cached,
+                fields=fields,
+            )
+
+    @check_auth
+    async def watch(
+        self,
+        jobids: List[Union[int, str]],
+        command: Optional[JobCommand] = JobCommand.sacct,
+        interval: Optional[float] = None,
+        timeout: int = sys.maxsize,
+    ) -> AsyncIterator[JobStateChange]:
+        """
+        Watch jobs, yielding an event each time the state of a job changes. The
+        state of all the jobs is fetched in a batched request every interval and
+        jobs are no longer polled once they reach a terminal state. Finishes when
+        all the jobs are in a terminal state.
+
+        ```python
+        >>> async for job, old_state, new_state in compute.watch(jobids):
+        >>>     print(f"{job.jobid}: {old_state} => {new_state}")
+        ```
+
+        :param jobids: The ids of the jobs to watch
+        :param command: The command used to fetch the job state
+        :param interval: The time in seconds between polls, defaults to the
+        `wait_interval` of the client
+        :param timeout: The maximum time to watch for in seconds
+        :return: An async iterator of `JobStateChange` events
+        :raises SfApiError: if a job isn't found
+        :raises TimeoutError: if timeout is reached
+        """
+        Job = AsyncJobSacct if (command == JobCommand.sacct) else AsyncJobSqueue
+        if interval is None:
+            interval = self.client._wait_interval
+
+        deadline = time.monotonic() + timeout
+        jobs: Dict[str, Union[AsyncJobSacct, AsyncJobSqueue]] = {}
+        watching = [str(j) for j in jobids]
+
+        while watching:
+            # Squeue jobs that are no longer in the queue get their state from
+            # sacct
+            fetched = await self._monitor.fetch_jobs(
+                job_type=Job, jobids=watching, sacct_fallback=True
             )
+            fetched = {j.jobid: j for j in fetched}
+
+            # Jobs that are in neither squeue or sacct would never finish
+            unknown = [i for i in watching if i not in jobs and i not in fetched]
+            if unknown:
+                raise SfApiError(f"Jobs not found: {', '.join(unknown)}")
+
+            for jobid in watching:
+                new_job = fetched.get(jobid)
+                if new_job is None:
+                    continue
+
+                job = jobs.get(jobid)
+                if job is None:
+                    jobs[jobid] = new_job
+                    yield JobStateChange(new_job, None, new_job.state)
+                elif new_job.state != job.state:
+                    old_state = job.state
+                    job._update(new_job)
+                    yield JobStateChange(job, old_state, job.state)
+
+            watching = [
+                i
+                for i in watching
+                if i not in jobs or jobs[i].state not in TERMINAL_STATES
+            ]
+
+            if watching:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError()
+
+                await _ASYNC_SLEEP(min(interval, remaining))
 
     @check_auth
     async def ls(self, path, directory=False) -> List[AsyncRemotePath]:
@@ -237,8 +540,7 @@ class AsyncCompute(ComputeBase):
         }
 
         r = await self.client.post(f"utilities/command/{self.name}", data=body)
-        json_response = r.json()
-        run_response = RunCommandResponse.model_validate(json_response)
+        run_response = RunCommandResponse.model_validate_json(r.content)
         if run_response.status == RunCommandResponseStatus.ERROR:
             raise SfApiError(run_response.error)
 
@@ -256,6 +558,22 @@ class AsyncCompute(ComputeBase):
         """
         return await self._run_task(args)
 
+    async def update(self):
+        """
+        Update the status of the compute resource by fetching it from the server.
+        """
+        r = await self.client.get(f"status/{self.name}")
+
+        # The same response ( from the conditional or response cache ), so the
+        # status hasn't changed and there is nothing to validate.
+        if r is self._response:
+            return
+
+        compute_state = ComputeBase.model_validate_json(r.content)
+        for k in compute_state.model_fields_set:
+            setattr(self, k, getattr(compute_state, k))
+        self._response = r
+
     async def outages(self):
         return await self.client.resources.outages(self.name)
 
@@ -1,5 +1,5 @@
 from typing import Optional, Union, List, Any
-from pydantic import ValidationError, Field, BaseModel, ConfigDict
+from pydantic import ValidationError, Field, BaseModel, ConfigDict, PrivateAttr
 from .._models import BatchGroupAction as GroupAction, UserStats as GroupMemberBase
 from ..exceptions import SfApiError
 from .users import AsyncUser
@@ -29,6 +29,8 @@ class AsyncGroup(BaseModel):
     gid: Optional[int]
     name: Optional[str]
     users_: Optional[List[GroupMemberBase]] = Field(..., alias="users")
+    # The response the state was last read from
+    _response: Any = PrivateAttr(None)
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
@@ -49,7 +51,7 @@ class AsyncGroup(BaseModel):
         }
 
         r = await self.client.put(f"account/groups/{self.name}", data=params)
-        json_response = r.json()
+        json_response = self.client._json(r)
 
         # if successful will return group object
         try:
@@ -85,29 +87,31 @@ class AsyncGroup(BaseModel):
         """
         The users in this group.
         """
-        members = [
+        # Pass the client in rather than assigning it to each member afterwards
+        return [
             AsyncGroupMember.model_validate(
                 dict(user_info.model_dump(), client=self.client)
             )
             for user_info in self.users_
         ]
 
-        def _set_client(m):
-            m.client = self.client
-
-            return m
-
-        members = map(_set_client, members)
-
-        return list(members)
-
     @staticmethod
     @check_auth
-    async def _fetch_group(client: "AsyncClient", name):  # noqa: F821
+    async def _fetch_group(
+        client: "AsyncClient",  # noqa: F821
+        name,
+        previous: Optional["AsyncGroup"] = None,
+    ):
         response = await client.get(f"account/groups/{name}")
 
-        json_response = response.json()
+        # The same response ( from the conditional or response cache ), so the
+        # group hasn't changed and there is nothing to validate.
+        if previous is not None and response is previous._response:
+            return previous
+
+        json_response = client._json(response)
         group = AsyncGroup.model_validate(dict(json_response, client=client))
+        group._response = response
 
         return group
 
@@ -115,8 +119,10 @@ class AsyncGroup(BaseModel):
         """
         Update the state of the group by fetching the state from the server.
         """
-        group_state = await self._fetch_group(self.client, self.name)
-        self._update(group_state)
+        group_state = await self._fetch_group(self.client, self.name, previous=self)
+        if group_state is not self:
+            self._update(group_state)
+            self._response = group_state._response
 
     def _update(self, new_group_state: Any) -> "AsyncGroup":
         for k in new_group_state.model_fields_set:
@@ -1,20 +1,30 @@
 from __future__ import annotations
 import sys
-import math
+import time
+from datetime import datetime, timezone
 from abc import ABC, abstractmethod
 from typing import Any, Optional, Dict, List, ClassVar, Union
-from .._utils import _ASYNC_SLEEP
+from .._utils import _ASYNC_SLEEP, _ASYNC_MAP
 from ..exceptions import SfApiError
 from .._models.job_status_response_sacct import OutputItem as JobSacctBase
 from .._models.job_status_response_squeue import OutputItem as JobSqueueBase
 from .._models import AppRoutersComputeModelsStatus as JobResponseStatus
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, PrivateAttr, field_validator
 
 from .._jobs import JobCommand
 from .._jobs import JobStateResponse
 from .._jobs import JobState
 from .._jobs import TERMINAL_STATES
+from .._jobs import _job_fields, _normalize_state
+from .._polling import PollingStrategy, FixedPolling
+from .._parse import (
+    _parse_duration,
+    _parse_int,
+    _parse_memory,
+    _parse_timestamp,
+    _parse_tres,
+)
 
 
 async def _fetch_raw_state(
@@ -23,10 +33,46 @@ async def _fetch_raw_state(
     user: Optional[str] = None,
     partition: Optional[str] = None,
     sacct: Optional[bool] = False,
+    cached: Optional[bool] = None,
+    fields: Optional[List[str]] = None,
 ):
-    # For now we are pass cached=False to ensure we don't
-    # break compatibility
-    params = {"sacct": sacct, "cached": False}
+    if cached is None:
+        cached = compute.client._cached_job_state
+
+    chunk_size = compute.client._jobid_chunk_size
+    if jobids is None or not chunk_size or len(jobids) <= chunk_size:
+        return await _fetch_raw_state_chunk(
+            compute, jobids, user, partition, sacct, cached, fields
+        )
+
+    # Split large lists of jobids into chunks, to keep the query string within
+    # URL limits and avoid single slow squeue/sacct calls. The chunks are
+    # fetched concurrently.
+    jobids = list(jobids)
+    chunks = [jobids[i : i + chunk_size] for i in range(0, len(jobids), chunk_size)]
+    outputs = await _ASYNC_MAP(
+        lambda chunk: _fetch_raw_state_chunk(
+            compute, chunk, user, partition, sacct, cached, fields
+        ),
+        chunks,
+        compute.client._jobid_chunk_concurrency,
+    )
+
+    return [state for output in outputs for state in output]
+
+
+async def _fetch_raw_state_chunk(
+    compute: "AsyncCompute",  # noqa: F821
+    jobids: Optional[List[int]] = None,
+    user: Optional[str] = None,
+    partition: Optional[str] = None,
+    sacct: Optional[bool] = False,
+    cached: bool = False,
+    fields: Optional[List[str]] = None,
+):
+    # cached=True allows the server to return the state from its cache rather
+    # than running squeue/sacct, it is opt-in as the state may be stale.
+    params = {"sacct": sacct, "cached": cached}
 
     job_url = f"compute/jobs/{compute.name}"
 
@@ -43,9 +89,14 @@ async def _fetch_raw_state(
         kwargs = params.setdefault("kwargs", [])
         kwargs.append(f"partition={partition}")
 
+    # Only ask for the columns needed, the jobid and state are always included
+    if fields is not None:
+        kwargs = params.setdefault("kwargs", [])
+        kwargs.append(f"format={','.join(_job_fields(fields))}")
+
     r = await compute.client.get(job_url, params)
 
-    json_response = r.json()
+    json_response = compute.client._json(r)
     job_state_response = JobStateResponse.model_validate(json_response)
 
     if job_state_response == JobResponseStatus.ERROR:
@@ -61,14 +112,29 @@ async def _fetch_jobs(
     jobids: Optional[List[int]] = None,
     user: Optional[str] = None,
     partition: Optional[str] = None,
+    cached: Optional[bool] = None,
+    fields: Optional[List[str]] = None,
 ):
+    if cached is None:
+        cached = compute.client._cached_job_state
+
+    fetched_at = datetime.now(timezone.utc)
     job_states = await _fetch_raw_state(
-        compute, jobids, user, partition, job_type._command == JobCommand.sacct
+        compute,
+        jobids,
+        user,
+        partition,
+        job_type._command == JobCommand.sacct,
+        cached,
+        fields,
     )
 
     jobs = [
         job_type.model_validate(dict(state, compute=compute)) for state in job_states
     ]
+    for job in jobs:
+        job._fetched_at = fetched_at
+        job._cached = cached
 
     return jobs
 
@@ -81,22 +147,39 @@ class AsyncJob(BaseModel, ABC):
     compute: Optional["AsyncCompute"] = None  # noqa: F821
     state: Optional[JobState] = None
     jobid: Optional[str] = None
+    # When the state was fetched and if it came from the server cache
+    _fetched_at: Optional[datetime] = PrivateAttr(None)
+    _cached: Optional[bool] = PrivateAttr(None)
+    # The completion callback registered when the job was submitted
+    _callback: Any = PrivateAttr(None)
 
     @field_validator("state", mode="before", check_fields=False)
     def state_validate(cls, v):
-        # sacct return a state of the form "CANCELLED by XXXX" for the
-        # cancelled state, coerce into value that will match a state
-        # modeled by the enum
-        if v.startswith("CANCELLED by"):
-            return "CANCELLED"
+        return _normalize_state(v)
+
+    @property
+    def fetched_at(self) -> Optional[datetime]:
+        """
+        When the state of the job was fetched from the compute resource.
+        """
+        return self._fetched_at
 
-        return v
+    @property
+    def cached(self) -> Optional[bool]:
+        """
+        True if the state of the job may have come from the server side cache,
+        so may be a few seconds stale.
+        """
+        return self._cached
 
-    async def update(self):
+    async def update(self, cached: Optional[bool] = None):
         """
         Update the state of the job by fetching the state from the compute resource.
+
+        :param cached: Allow the state to come from the server side cache, rather
+        than running squeue/sacct. Defaults to the `cached_job_state` of the client
         """
-        job_state = await self._fetch_state()
+        job_state = await self._fetch_state(cached)
         self._update(job_state)
 
     def _update(self, new_job_state: Any) -> Job:  # noqa: F821
@@ -104,48 +187,105 @@ class AsyncJob(BaseModel, ABC):
             v = getattr(new_job_state, k)
             setattr(self, k, v)
 
-        return self
+        if new_job_state._fetched_at is not None:
+            self._fetched_at = new_job_state._fetched_at
+            self._cached = new_job_state._cached
 
-    async def _wait_until(self, states: List[JobState], timeout: int = sys.maxsize):
-        max_iteration = math.ceil(timeout / self.compute.client._wait_interval)
-        iteration = 0
-
-        while self.state not in states:
-            await self.update()
-            await _ASYNC_SLEEP(self.compute.client._wait_interval)
-
-            if iteration == max_iteration:
-                raise TimeoutError()
+        return self
 
-            iteration += 1
+    async def _wait_until(
+        self,
+        states: List[JobState],
+        timeout: int = sys.maxsize,
+        polling: Optional[PollingStrategy] = None,
+    ):
+        # The callback is only made when the job completes
+        callback = self._callback
+        if any(s not in TERMINAL_STATES for s in states):
+            callback = None
+
+        if polling is None:
+            # The watcher polls for all the jobs being waited on
+            if self.compute._watcher is not None and callback is None:
+                return await self.compute._watcher.wait(
+                    self, states, None if timeout == sys.maxsize else timeout
+                )
+
+            polling = FixedPolling(self.compute.client._wait_interval)
+
+        deadline = time.monotonic() + timeout
+        state = self.state
+        polls = 0
+
+        try:
+            while self.state not in states:
+                await self.update()
+                if self.state in states:
+                    break
+
+                # The number of polls in the current state
+                polls = polls + 1 if self.state == state else 1
+                state = self.state
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError()
+
+                interval = min(polling.interval(self, polls), remaining)
+                if callback is not None and not callback.done:
+                    # Poll at the fallback interval in case the callback never
+                    # arrives
+                    await callback.wait(
+                        min(max(interval, callback.fallback_interval), remaining)
+                    )
+                else:
+                    await _ASYNC_SLEEP(interval)
+        finally:
+            # The callback is no longer expected once the job has finished,
+            # for example if polling saw it complete first. Otherwise it is
+            # kept, so waiting again after a timeout can still receive it.
+            if callback is not None and self.state in TERMINAL_STATES:
+                callback.cancel()
 
         return self.state
 
-    async def _wait_until_complete(self, timeout: int = sys.maxsize):
-        return await self._wait_until(TERMINAL_STATES, timeout)
+    async def _wait_until_complete(
+        self, timeout: int = sys.maxsize, polling: Optional[PollingStrategy] = None
+    ):
+        return await self._wait_until(TERMINAL_STATES, timeout, polling)
 
     def __await__(self):
         return self._wait_until_complete().__await__()
 
-    async def complete(self, timeout: int = sys.maxsize):
+    async def complete(
+        self, timeout: int = sys.maxsize, polling: Optional[PollingStrategy] = None
+    ):
         """
         Wait for a job to move into a terminal state.
 
-        :param timeout: The maximum time to wait in seconds, the actually
-        wait time will be in 10 second increments.
+        :param timeout: The maximum time to wait in seconds
+        :param polling: The strategy used to decide how long to wait between
+        polls, defaults to polling every `wait_interval` seconds. See
+        `AdaptivePolling`.
         :raises TimeoutError: if timeout is reached
         """
-        return await self._wait_until_complete(timeout)
+        return await self._wait_until_complete(timeout, polling)
 
-    async def running(self, timeout: int = sys.maxsize):
+    async def running(
+        self, timeout: int = sys.maxsize, polling: Optional[PollingStrategy] = None
+    ):
         """
         Wait for a job to move into running state.
 
-        :param timeout: The maximum time to wait in seconds, the actually wait
-        time will be in 10 second increments.
+        :param timeout: The maximum time to wait in seconds
+        :param polling: The strategy used to decide how long to wait between
+        polls, defaults to polling every `wait_interval` seconds. See
+        `AdaptivePolling`.
         :raises TimeoutError: if timeout if reached
         """
-        state = await self._wait_until([JobState.RUNNING] + TERMINAL_STATES, timeout)
+        state = await self._wait_until(
+            [JobState.RUNNING] + TERMINAL_STATES, timeout, polling
+        )
         if state != JobState.RUNNING:
             raise SfApiError(
                 f"Job never entered the running state, end state was: {state}"
@@ -183,16 +323,102 @@ class AsyncJob(BaseModel, ABC):
         return super().dict(*args, **kwargs)
 
     @abstractmethod
-    async def _fetch_state(self):
+    async def _fetch_state(self, cached: Optional[bool] = None):
         pass
 
 
 class AsyncJobSacct(AsyncJob, JobSacctBase):
     _command: ClassVar[JobCommand] = JobCommand.sacct
 
-    async def _fetch_state(self):
+    @property
+    def elapsed_seconds(self) -> Optional[float]:
+        """
+        The elapsed time of the job in seconds.
+        """
+        elapsed = _parse_int(self.elapsedraw)
+
+        return elapsed if elapsed is not None else _parse_duration(self.elapsed)
+
+    @property
+    def cpu_time_seconds(self) -> Optional[float]:
+        """
+        The allocated CPU time ( elapsed time * CPUs ) in seconds.
+        """
+        cpu_time = _parse_int(self.cputimeraw)
+
+        return cpu_time if cpu_time is not None else _parse_duration(self.cputime)
+
+    @property
+    def total_cpu_seconds(self) -> Optional[float]:
+        """
+        The CPU time used by the job in seconds.
+        """
+        return _parse_duration(self.totalcpu)
+
+    @property
+    def time_limit_seconds(self) -> Optional[float]:
+        """
+        The time limit of the job in seconds, None if unlimited.
+        """
+        # The raw time limit is in minutes
+        time_limit = _parse_int(self.timelimitraw)
+        if time_limit is not None:
+            return time_limit * 60
+
+        return _parse_duration(self.timelimit)
+
+    @property
+    def max_rss_bytes(self) -> Optional[int]:
+        """
+        The maximum resident set size of the job in bytes.
+        """
+        return _parse_memory(self.maxrss)
+
+    @property
+    def req_mem_bytes(self) -> Optional[int]:
+        """
+        The memory requested by the job in bytes, per node or per CPU.
+        """
+        return _parse_memory(self.reqmem)
+
+    @property
+    def submit_time(self) -> Optional[datetime]:
+        """
+        When the job was submitted.
+        """
+        return _parse_timestamp(self.submit)
+
+    @property
+    def start_time(self) -> Optional[datetime]:
+        """
+        When the job started.
+        """
+        return _parse_timestamp(self.start)
+
+    @property
+    def end_time(self) -> Optional[datetime]:
+        """
+        When the job ended.
+        """
+        return _parse_timestamp(self.end)
+
+    @property
+    def alloc_tres_dict(self) -> Optional[Dict[str, Union[int, float, str]]]:
+        """
+        The allocated trackable resources, sizes are in bytes.
+        """
+        return _parse_tres(self.alloctres)
+
+    @property
+    def req_tres_dict(self) -> Optional[Dict[str, Union[int, float, str]]]:
+        """
+        The requested trackable resources, sizes are in bytes.
+        """
+        return _parse_tres(self.reqtres)
+
+    async def _fetch_state(self, cached: Optional[bool] = None):
         jobs = await self.compute._monitor.fetch_jobs(
-            job_type=self.__class__, jobids=[self.jobid]
+            job_type=self.__class__, jobids=[self.jobid], cached=cached
         )
         if len(jobs) != 1:
             raise SfApiError(f"Job not found: ${self.jobid}")
@@ -206,8 +432,10 @@ class AsyncJobSacct(AsyncJob, JobSacctBase):
         jobids: Optional[List[int]] = None,
         user: Optional[str] = None,
         partition: Optional[str] = None,
+        cached: Optional[bool] = None,
+        fields: Optional[List[str]] = None,
     ):
-        return await _fetch_jobs(cls, compute, jobids, user, partition)
+        return await _fetch_jobs(cls, compute, jobids, user, partition, cached, fields)
 
 
 class AsyncJobSqueue(AsyncJob, JobSqueueBase):
@@ -218,28 +446,31 @@ class AsyncJobSqueue(AsyncJob, JobSqueueBase):
 
     _command: ClassVar[JobCommand] = JobCommand.squeue
 
-    async def _fetch_state(self):
+    async def _fetch_state(self, cached: Optional[bool] = None):
+        # If the job is no longer in the queue the monitor uses sacct to get
+        # the final state, batched with the other jobs that have left the queue.
         jobs = await self.compute._monitor.fetch_jobs(
-            job_type=self.__class__, jobids=[self.jobid]
+            job_type=self.__class__,
+            jobids=[self.jobid],
+            cached=cached,
+            sacct_fallback=True,
         )
-        # If the job state comes back empty the job is probably no longer in
-        # the queue, so we use sacct to get the final state.
-        if len(jobs) == 0:
-            jobs = await self.compute._monitor.fetch_jobs(
-                job_type=AsyncJobSacct, jobids=[self.jobid]
-            )
-            if len(jobs) != 1:
-                raise SfApiError(f"Job not found: {self.jobid}")
+        if len(jobs) != 1:
+            raise SfApiError(f"Job not found: {self.jobid}")
 
-            # We create a new squeue job instance and set the state on it,
-            # the update method will then use this to update just the job
-            # state field.
-            job = AsyncJobSqueue()
-            job.state = jobs[0].state
+        return jobs[0]
 
-            return job
+    @staticmethod
+    def _from_sacct(sacct_job: AsyncJobSacct) -> AsyncJobSqueue:
+        # We create a new squeue job instance and set the state on it, the
+        # update method will then use this to update just the job state field.
+        job = AsyncJobSqueue(compute=sacct_job.compute)
+        job.jobid = sacct_job.jobid
+        job.state = sacct_job.state
+        job._fetched_at = sacct_job._fetched_at
+        job._cached = sacct_job._cached
 
-        return jobs[0]
+        return job
 
     @classmethod
     async def _fetch_jobs(
@@ -248,5 +479,7 @@ class AsyncJobSqueue(AsyncJob, JobSqueueBase):
         jobids: Optional[List[int]] = None,
         user: Optional[str] = None,
         partition: Optional[str] = None,
+        cached: Optional[bool] = None,
+        fields: Optional[List[str]] = None,
     ):
-        return await _fetch_jobs(cls, compute, jobids, user, partition)
+        return await _fetch_jobs(cls, compute, jobids, user, partition, cached, fields)
@@ -27,7 +27,7 @@ class AsyncProject(ProjectBase):
         params = {"name": name, "repo_name": self.repo_name}
 
         r = await self.client.post("account/groups", data=params)
-        json_response = r.json()
+        json_response = self.client._json(r)
         try:
             group = AsyncGroup.model_validate(dict(json_response, client=self.client))
         except ValidationError:
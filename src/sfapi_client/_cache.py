@@ -0,0 +1,288 @@
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+import httpx
+
+# Default time to live in seconds for slowly changing endpoints, keyed by URL
+# prefix.
+DEFAULT_CACHE_TTLS = {
+    "status": 60,
+    "status/outages": 300,
+    "status/notes": 300,
+    "meta": 3600,
+}
+
+
+#
+# Single flight, concurrent calls with the same key share the result of a
+# single call rather than each making their own.
+#
+class AsyncSingleFlight:
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+
+    async def run(self, key: Hashable, fn: Callable, *args, **kwargs) -> Any:
+        while True:
+            future = self._calls.get(key)
+            if future is None:
+                break
+
+            try:
+                # Shield the shared call, so cancelling this caller doesn't
+                # cancel the call for everyone else.
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # The call we were waiting on was cancelled, rather than this
+                # caller, so try again.
+                if future.cancelled():
+                    continue
+                raise
+
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        try:
+            result = await fn(*args, **kwargs)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as ex:
+            future.set_exception(ex)
+            # Mark the exception as retrieved, there may not be anyone waiting
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+
+            return result
+        finally:
+            del self._calls[key]
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.exception = None
+
+
+class SyncSingleFlight:
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def run(self, key: Hashable, fn: Callable, *args, **kwargs) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+
+        if not leader:
+            call.done.wait()
+            if call.exception is not None:
+                raise call.exception
+
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+
+            return call.result
+        except BaseException as ex:
+            call.exception = ex
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class ResponseCache:
+    """
+    Cache of GET responses for slowly changing endpoints, such as the resource
+    status, outages, notes and the API configuration. Responses are cached for
+    a time to live that depends on the URL prefix, the longest matching prefix
+    is used and URLs that don't match a prefix aren't cached. The least
+    recently used response is evicted when the cache is full.
+
+    The cache is thread safe, so it can be shared between clients ( sync and
+    async ).
+
+    ```python
+    >>> from sfapi_client import Client
+    >>> from sfapi_client.client import ResponseCache
+    >>> cache = ResponseCache(ttls={"status": 30, "meta": 3600})
+    >>> with Client(client_id, client_secret, response_cache=cache) as client:
+    >>>    # Use client
+    ```
+
+    :param ttls: Time to live in seconds keyed by URL prefix, defaults to
+    `DEFAULT_CACHE_TTLS`
+    :param max_size: The maximum number of responses to cache
+    """
+
+    def __init__(self, ttls: Optional[Dict[str, float]] = None, max_size: int = 256):
+        ttls = ttls if ttls is not None else DEFAULT_CACHE_TTLS
+        self._ttls = {prefix.strip("/"): ttl for prefix, ttl in ttls.items()}
+        # Longest prefix first, so the most specific TTL is found first
+        self._prefixes = sorted(self._ttls.keys(), key=len, reverse=True)
+        self._max_size = max_size
+        # (base url, url, query) => (expiry, response) in least recently used
+        # order
+        self._responses = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        """
+        The number of requests served from the cache.
+        """
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """
+        The number of cacheable requests that were not in the cache.
+        """
+        return self._misses
+
+    def _ttl(self, url: str) -> Optional[float]:
+        url = url.strip("/")
+        for prefix in self._prefixes:
+            if url == prefix or url.startswith(f"{prefix}/"):
+                return self._ttls[prefix]
+
+        return None
+
+    def get(
+        self, url: str, query: str = "", base_url: str = ""
+    ) -> Optional[httpx.Response]:
+        """
+        Get a cached response.
+
+        :param url: The URL relative to the API base URL
+        :param query: The query string
+        :param base_url: The API base URL, so clients of different APIs can
+        share the cache
+        :return: The response or None if it isn't cached or has expired.
+        """
+        if self._ttl(url) is None:
+            return None
+
+        key = (base_url.rstrip("/"), url.strip("/"), query)
+        with self._lock:
+            entry = self._responses.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._responses[key]
+                self._misses += 1
+
+                return None
+
+            self._responses.move_to_end(key)
+            self._hits += 1
+
+            return entry[1]
+
+    def put(self, url: str, query: str, response: httpx.Response, base_url: str = ""):
+        """
+        Cache a response, if the URL is cacheable.
+
+        :param url: The URL relative to the API base URL
+        :param query: The query string
+        :param response: The response
+        :param base_url: The API base URL
+        """
+        ttl = self._ttl(url)
+        if ttl is None:
+            return
+
+        key = (base_url.rstrip("/"), url.strip("/"), query)
+        with self._lock:
+            self._responses[key] = (time.monotonic() + ttl, response)
+            self._responses.move_to_end(key)
+
+            while len(self._responses) > self._max_size:
+                self._responses.popitem(last=False)
+
+    def invalidate(self, prefix: Optional[str] = None):
+        """
+        Remove cached responses.
+
+        :param prefix: Only remove responses for URLs starting with this prefix,
+        if None all responses are removed.
+        """
+        with self._lock:
+            if prefix is None:
+                self._responses.clear()
+                return
+
+            prefix = prefix.strip("/")
+            for key in list(self._responses.keys()):
+                url = key[1]
+                if url == prefix or url.startswith(f"{prefix}/"):
+                    del self._responses[key]
+
+
+#
+# Stores the responses that have validators ( ETag or Last-Modified ), so
+# they can be used to make conditional requests. If the server responds with
+# 304 Not Modified the stored response is used.
+#
+class ConditionalCache:
+    def __init__(self, max_size: int = 256):
+        self._max_size = max_size
+        # (url, query) => response in least recently used order
+        self._responses = OrderedDict()
+        self._lock = threading.Lock()
+
+    def headers(self, url: str, query: str) -> Dict[str, str]:
+        """
+        The headers to make the request conditional.
+        """
+        with self._lock:
+            response = self._responses.get((url, query))
+
+        if response is None:
+            return {}
+
+        headers = {}
+        etag = response.headers.get("ETag")
+        if etag is not None:
+            headers["If-None-Match"] = etag
+        last_modified = response.headers.get("Last-Modified")
+        if last_modified is not None:
+            headers["If-Modified-Since"] = last_modified
+
+        return headers
+
+    def cached(self, url: str, query: str) -> Optional[httpx.Response]:
+        """
+        The stored response, used when the server responds with 304.
+        """
+        with self._lock:
+            response = self._responses.get((url, query))
+            if response is not None:
+                self._responses.move_to_end((url, query))
+
+            return response
+
+    def store(self, url: str, query: str, response: httpx.Response):
+        """
+        Store the response if it has validators.
+        """
+        if "ETag" not in response.headers and "Last-Modified" not in response.headers:
+            return
+
+        with self._lock:
+            self._responses[(url, query)] = response
+            self._responses.move_to_end((url, query))
+
+            while len(self._responses) > self._max_size:
+                self._responses.popitem(last=False)
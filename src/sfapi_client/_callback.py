@@ -0,0 +1,331 @@
+import asyncio
+import json
+import secrets
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional
+
+# How often to poll for the state of a job while waiting for its callback, in
+# case the callback never arrives.
+CALLBACK_FALLBACK_INTERVAL = 300
+
+# The largest callback body that will be read
+MAX_CALLBACK_SIZE = 64 * 1024
+
+
+def _parse_payload(body: bytes) -> Any:
+    try:
+        return json.loads(body) if body else None
+    except ValueError:
+        return body.decode(errors="replace")
+
+
+class _CallbackReceiver:
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        url: Optional[str],
+        fallback_interval: float,
+    ):
+        self._host = host
+        self._port = port
+        self._url = url.rstrip("/") if url is not None else None
+        self.fallback_interval = fallback_interval
+        self._callbacks: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        """
+        The base URL the callbacks are sent to.
+        """
+        if self._url is not None:
+            return self._url
+
+        return f"http://{self._host}:{self._port}"
+
+    def _register(self):
+        key = secrets.token_urlsafe(16)
+        callback = self._callback_class(self, key)
+        with self._lock:
+            self._callbacks[key] = callback
+
+        return callback
+
+    def _unregister(self, key: str):
+        with self._lock:
+            self._callbacks.pop(key, None)
+
+    # Called with the path of a request, returning True if it matched a
+    # registered callback.
+    def _receive(self, path: str, body: bytes) -> bool:
+        key = path.strip("/").split("?", 1)[0]
+        with self._lock:
+            callback = self._callbacks.pop(key, None)
+
+        if callback is None:
+            return False
+
+        callback._set(_parse_payload(body))
+
+        return True
+
+
+#
+# A callback registered for a single job submission.
+#
+class _Callback:
+    def __init__(self, receiver: _CallbackReceiver, key: str):
+        self._receiver = receiver
+        self.key = key
+        self.payload: Any = None
+
+    @property
+    def url(self) -> str:
+        return f"{self._receiver.url}/{self.key}"
+
+    @property
+    def fallback_interval(self) -> float:
+        return self._receiver.fallback_interval
+
+    def cancel(self):
+        self._receiver._unregister(self.key)
+
+
+class _AsyncCallback(_Callback):
+    def __init__(self, receiver: "AsyncCallbackReceiver", key: str):
+        super().__init__(receiver, key)
+        self._event = asyncio.Event()
+
+    @property
+    def done(self) -> bool:
+        return self._event.is_set()
+
+    def _set(self, payload: Any):
+        self.payload = payload
+        self._event.set()
+
+    async def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for the callback, returning True if it arrived.
+        """
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+        return self._event.is_set()
+
+
+class AsyncCallbackReceiver(_CallbackReceiver):
+    """
+    Embedded HTTP endpoint that receives the job completion callbacks made by
+    the API, so job completion is pushed rather than polled. Jobs submitted
+    with the receiver still poll at `fallback_interval` in case the callback
+    never arrives.
+
+    The endpoint has to be reachable from the API, if it is behind a proxy or
+    NAT use `url` to give the externally visible URL.
+
+    ```python
+    >>> from sfapi_client.compute import AsyncCallbackReceiver
+    >>> async with AsyncCallbackReceiver(host="0.0.0.0", port=8080) as callback:
+    >>>     job = await compute.submit_job(script, callback=callback)
+    >>>     await job.complete()
+    ```
+
+    :param host: The interface to listen on
+    :param port: The port to listen on, 0 picks a free port
+    :param url: The URL the API should call back, defaults to `http://host:port`
+    :param fallback_interval: The interval in seconds to poll for the job state
+    while waiting for the callback
+    """
+
+    _callback_class = _AsyncCallback
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        url: Optional[str] = None,
+        fallback_interval: float = CALLBACK_FALLBACK_INTERVAL,
+    ):
+        super().__init__(host, port, url, fallback_interval)
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def start(self):
+        """
+        Start listening for callbacks, does nothing if already started.
+        """
+        if self._server is not None:
+            return
+
+        self._server = await asyncio.start_server(self._handle, self._host, self._port)
+        self._port = self._server.sockets[0].getsockname()[1]
+
+    async def close(self):
+        """
+        Stop listening for callbacks.
+        """
+        if self._server is None:
+            return
+
+        self._server.close()
+        await self._server.wait_closed()
+        self._server = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            request_line = await reader.readline()
+            parts = request_line.decode("latin-1").split()
+            if len(parts) < 2:
+                return
+
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+            length = min(int(headers.get("content-length", 0)), MAX_CALLBACK_SIZE)
+            body = await reader.readexactly(length) if length else b""
+
+            status = "200 OK" if self._receive(parts[1], body) else "404 Not Found"
+            writer.write(
+                f"HTTP/1.1 {status}\r\n"
+                "Content-Length: 0\r\n"
+                "Connection: close\r\n\r\n".encode()
+            )
+            await writer.drain()
+        except (ValueError, asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+class _SyncCallback(_Callback):
+    def __init__(self, receiver: "SyncCallbackReceiver", key: str):
+        super().__init__(receiver, key)
+        self._event = threading.Event()
+
+    @property
+    def done(self) -> bool:
+        return self._event.is_set()
+
+    def _set(self, payload: Any):
+        self.payload = payload
+        self._event.set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for the callback, returning True if it arrived.
+        """
+        return self._event.wait(timeout)
+
+
+class _CallbackHandler(BaseHTTPRequestHandler):
+    def _handle(self):
+        length = min(int(self.headers.get("Content-Length", 0)), MAX_CALLBACK_SIZE)
+        body = self.rfile.read(length) if length else b""
+
+        self.send_response(
+            200 if self.server.receiver._receive(self.path, body) else 404
+        )
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    do_GET = do_POST = do_PUT = _handle
+
+    def log_message(self, format, *args):
+        pass
+
+
+class SyncCallbackReceiver(_CallbackReceiver):
+    """
+    Embedded HTTP endpoint that receives the job completion callbacks made by
+    the API, so job completion is pushed rather than polled. The endpoint is
+    served from a background daemon thread. Jobs submitted with the receiver
+    still poll at `fallback_interval` in case the callback never arrives.
+
+    The endpoint has to be reachable from the API, if it is behind a proxy or
+    NAT use `url` to give the externally visible URL.
+
+    ```python
+    >>> from sfapi_client.compute import SyncCallbackReceiver
+    >>> with SyncCallbackReceiver(host="0.0.0.0", port=8080) as callback:
+    >>>     job = compute.submit_job(script, callback=callback)
+    >>>     job.complete()
+    ```
+
+    :param host: The interface to listen on
+    :param port: The port to listen on, 0 picks a free port
+    :param url: The URL the API should call back, defaults to `http://host:port`
+    :param fallback_interval: The interval in seconds to poll for the job state
+    while waiting for the callback
+    """
+
+    _callback_class = _SyncCallback
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        url: Optional[str] = None,
+        fallback_interval: float = CALLBACK_FALLBACK_INTERVAL,
+    ):
+        super().__init__(host, port, url, fallback_interval)
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def start(self):
+        """
+        Start listening for callbacks, does nothing if already started.
+        """
+        with self._lock:
+            if self._server is not None:
+                return
+
+            self._server = ThreadingHTTPServer(
+                (self._host, self._port), _CallbackHandler
+            )
+            self._server.daemon_threads = True
+            self._server.receiver = self
+            self._port = self._server.server_address[1]
+            self._thread = threading.Thread(
+                target=self._server.serve_forever,
+                name="sfapi-callback-receiver",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def close(self):
+        """
+        Stop listening for callbacks.
+        """
+        with self._lock:
+            server, self._server = self._server, None
+            thread, self._thread = self._thread, None
+
+        if server is None:
+            return
+
+        server.shutdown()
+        server.server_close()
+        thread.join()
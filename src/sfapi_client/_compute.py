@@ -25,3 +25,10 @@ class TaskStatus(str, Enum):
     COMPLETED = "COMPLETED"
     CANCELLED = "CANCELLED"
     FAILED = "FAILED"
+
+
+TASK_TERMINAL_STATUSES = [
+    TaskStatus.COMPLETED,
+    TaskStatus.CANCELLED,
+    TaskStatus.FAILED,
+]
@@ -1,6 +1,6 @@
 from __future__ import annotations
 from enum import Enum
-from typing import Any, Optional, Dict, List
+from typing import Any, Optional, List, NamedTuple
 
 from pydantic import BaseModel
 
@@ -12,7 +12,8 @@ class JobCommand(str, Enum):
 
 class JobStateResponse(BaseModel):
     status: Optional[str] = None
-    output: Optional[List[Dict]] = None
+    # The rows are validated as the jobs are created, so aren't validated here
+    output: Optional[List[Any]] = None
     error: Optional[Any] = None
 
 
@@ -55,3 +56,34 @@ TERMINAL_STATES = [
     JobState.FAILED,
     JobState.TIMEOUT,
 ]
+
+
+def _normalize_state(state: str) -> str:
+    # sacct return a state of the form "CANCELLED by XXXX" for the
+    # cancelled state, coerce into value that will match a state
+    # modeled by the enum
+    if state.startswith("CANCELLED by"):
+        return "CANCELLED"
+
+    return state
+
+
+# The fields always fetched when the fields of a job are projected
+STATE_FIELDS = ["jobid", "state"]
+
+
+def _job_fields(fields: List[str]) -> List[str]:
+    return list(dict.fromkeys(STATE_FIELDS + [f.lower() for f in fields]))
+
+
+class JobStateChange(NamedTuple):
+    """
+    A change in the state of a job, yielded when watching jobs.
+    """
+
+    job: Any
+    """ The job, updated with its latest state """
+    old_state: Optional[JobState]
+    """ The previous state, None the first time the job is seen """
+    new_state: Optional[JobState]
+    """ The new state """
@@ -0,0 +1,14 @@
+import json
+from typing import Any, Callable, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Decodes the body of a response, given the raw bytes
+JsonLoads = Callable[[Union[bytes, str]], Any]
+
+# orjson is considerably faster decoding large responses, such as sacct output
+# or directory listings, so it is used when installed.
+DEFAULT_JSON_LOADS: JsonLoads = orjson.loads if orjson is not None else json.loads
@@ -0,0 +1,214 @@
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager, AsyncExitStack, ExitStack
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class RateLimit(BaseModel):
+    """
+    Rate limit applied to the requests made to the SF API. The limit applies
+    to all the requests with a URL starting with the prefix it is registered
+    against, the empty prefix applies to all requests.
+
+    ```python
+    >>> from sfapi_client import Client
+    >>> from sfapi_client.client import RateLimit
+    >>> limits = {
+    >>>     "": RateLimit(rate=20, burst=40),
+    >>>     "compute/jobs": RateLimit(rate=2, max_in_flight=4),
+    >>> }
+    >>> with Client(client_id, client_secret, rate_limits=limits) as client:
+    >>>    # Use client
+    ```
+    """
+
+    rate: Optional[float] = Field(None, gt=0)
+    """ The sustained number of requests per second """
+    burst: int = Field(1, ge=1)
+    """ The number of requests that can be made in a burst above the rate """
+    max_in_flight: Optional[int] = Field(None, ge=1)
+    """ The maximum number of concurrent requests """
+
+
+class RateLimitStats(BaseModel):
+    """
+    Statistics on the time requests have spent waiting on a rate limit.
+    """
+
+    requests: int = 0
+    """ The number of requests that have passed through the limit """
+    total_wait: float = 0.0
+    """ The total time in seconds requests have waited """
+    max_wait: float = 0.0
+    """ The longest time in seconds a request has waited """
+
+    @property
+    def mean_wait(self) -> float:
+        """
+        The average time in seconds a request has waited.
+        """
+        if self.requests == 0:
+            return 0.0
+
+        return self.total_wait / self.requests
+
+    def _record(self, wait: float):
+        self.requests += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+
+
+#
+# Token bucket that hands out reservations, the caller is responsible for
+# waiting for the returned delay. As no waiting is done while holding the
+# lock the bucket can be shared by threads and coroutines.
+#
+class _TokenBucket:
+    def __init__(self, rate: float, burst: int):
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._burst, self._tokens + (now - self._last) * self._rate
+            )
+            self._last = now
+            self._tokens -= 1
+
+            if self._tokens >= 0:
+                return 0.0
+
+            return -self._tokens / self._rate
+
+
+class _Limit:
+    def __init__(self, prefix: str, rate_limit: RateLimit):
+        self.prefix = prefix
+        self.rate_limit = rate_limit
+        self.bucket = None
+        if rate_limit.rate is not None:
+            self.bucket = _TokenBucket(rate_limit.rate, rate_limit.burst)
+        self.semaphore = None
+        self.stats = RateLimitStats()
+
+
+class _RateLimiter:
+    def __init__(self, rate_limits: Optional[Dict[str, RateLimit]] = None):
+        rate_limits = rate_limits if rate_limits is not None else {}
+        self._limits = {
+            prefix.strip("/"): _Limit(prefix.strip("/"), rate_limit)
+            for prefix, rate_limit in rate_limits.items()
+        }
+        # Longest prefix first, so the most specific endpoint limit is found first
+        self._prefixes = sorted(
+            [p for p in self._limits.keys() if p], key=len, reverse=True
+        )
+        self._stats_lock = threading.Lock()
+
+    @property
+    def stats(self) -> Dict[str, RateLimitStats]:
+        """
+        The wait time statistics for each of the limits, keyed by prefix.
+        """
+        return {prefix: limit.stats for prefix, limit in self._limits.items()}
+
+    # The global limit ( if any ) and the limit for the longest matching prefix
+    def _match(self, url: str) -> List[_Limit]:
+        limits = []
+
+        global_limit = self._limits.get("")
+        if global_limit is not None:
+            limits.append(global_limit)
+
+        url = url.lstrip("/")
+        for prefix in self._prefixes:
+            if url == prefix or url.startswith(f"{prefix}/"):
+                limits.append(self._limits[prefix])
+                break
+
+        return limits
+
+    def _record(self, limits: List[_Limit], start: float):
+        wait = time.monotonic() - start
+        with self._stats_lock:
+            for limit in limits:
+                limit.stats._record(wait)
+
+
+class AsyncRateLimiter(_RateLimiter):
+    """
+    Limits the rate and the concurrency of the requests made by an `AsyncClient`.
+    """
+
+    @asynccontextmanager
+    async def limit(self, url: str):
+        limits = self._match(url)
+        if not limits:
+            yield
+            return
+
+        start = time.monotonic()
+        async with AsyncExitStack() as stack:
+            for limit in limits:
+                if limit.rate_limit.max_in_flight is not None:
+                    # Created on first use so the semaphore is bound to the
+                    # running event loop.
+                    if limit.semaphore is None:
+                        limit.semaphore = asyncio.Semaphore(
+                            limit.rate_limit.max_in_flight
+                        )
+                    await stack.enter_async_context(limit.semaphore)
+
+                if limit.bucket is not None:
+                    delay = limit.bucket.reserve()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+
+            self._record(limits, start)
+
+            yield
+
+
+class SyncRateLimiter(_RateLimiter):
+    """
+    Limits the rate and the concurrency of the requests made by a `Client`.
+    """
+
+    def __init__(self, rate_limits: Optional[Dict[str, RateLimit]] = None):
+        super().__init__(rate_limits)
+
+        for limit in self._limits.values():
+            if limit.rate_limit.max_in_flight is not None:
+                limit.semaphore = threading.BoundedSemaphore(
+                    limit.rate_limit.max_in_flight
+                )
+
+    @contextmanager
+    def limit(self, url: str):
+        limits = self._match(url)
+        if not limits:
+            yield
+            return
+
+        start = time.monotonic()
+        with ExitStack() as stack:
+            for limit in limits:
+                if limit.semaphore is not None:
+                    stack.enter_context(limit.semaphore)
+
+                if limit.bucket is not None:
+                    delay = limit.bucket.reserve()
+                    if delay > 0:
+                        time.sleep(delay)
+
+            self._record(limits, start)
+
+            yield
@@ -1,8 +1,8 @@
 import asyncio
+import time
 from asyncio import Future
-from typing import Union, List, Set, Dict, Type
-from threading import Lock
-from functools import reduce
+from typing import Union, List, Set, Dict, Type, Optional
+from threading import Lock, Event, Condition, Thread
 
 from ._async.jobs import (
     _fetch_jobs as _fetch_jobs_async,
@@ -10,6 +10,11 @@ from ._async.jobs import (
     AsyncJobSqueue,
 )
 from ._sync.jobs import _fetch_jobs, JobSacct, JobSqueue
+from ._jobs import JobState, STATE_FIELDS
+from ._compute import TASK_TERMINAL_STATUSES
+from ._models import Task as TaskResponse
+from ._utils import _SLEEP, _MAP, _ASYNC_MAP
+from .exceptions import SfApiError
 
 
 # Async monitor that batches request for job state into fewer request by
@@ -21,12 +26,30 @@ class AsyncJobMonitor:
         self._monitor_task: asyncio.Task = None
         self._futures: Dict[Type, Future] = {}
         self._last_job_type_fetched: Type = None
+        # The job types with a pending request that doesn't accept cached state
+        self._uncached: Set[Type] = set()
+        # The job types with a pending request that wants the sacct fallback
+        self._sacct_fallback: Set[Type] = set()
+        # The fields requested for the pending job types, and the job types
+        # with a pending request that wants all the fields
+        self._fields: Dict[Type, Set[str]] = {}
+        self._all_fields: Set[Type] = set()
 
     async def _create_task(self):
         job_type = self._job_type_to_fetch()
         jobids = self._jobids[job_type]
         del self._jobids[job_type]
-        self._monitor_task = asyncio.create_task(self._monitor(job_type, jobids))
+        # The freshest state requested wins
+        cached = job_type not in self._uncached
+        self._uncached.discard(job_type)
+        sacct_fallback = job_type in self._sacct_fallback
+        self._sacct_fallback.discard(job_type)
+        fields = self._fields.pop(job_type, set())
+        fields = None if job_type in self._all_fields else sorted(fields)
+        self._all_fields.discard(job_type)
+        self._monitor_task = asyncio.create_task(
+            self._monitor(job_type, jobids, cached, sacct_fallback, fields)
+        )
 
         # If we have a future waiting then we need to hook it up
         future = self._futures.get(job_type)
@@ -65,10 +88,24 @@ class AsyncJobMonitor:
         self,
         job_type: Union[AsyncJobSacct, AsyncJobSqueue],
         jobids: List[Union[int, str]],
+        cached: Optional[bool] = None,
+        sacct_fallback: bool = False,
+        fields: Optional[List[str]] = None,
     ) -> List[Union[AsyncJobSacct, AsyncJobSqueue]]:
+        if cached is None:
+            cached = self._compute.client._cached_job_state
+
         jobids = list(map(str, jobids))
         jobids_for_type = self._jobids.setdefault(job_type, set())
         jobids_for_type.update(jobids)
+        if not cached:
+            self._uncached.add(job_type)
+        if sacct_fallback and job_type is AsyncJobSqueue:
+            self._sacct_fallback.add(job_type)
+        if fields is None:
+            self._all_fields.add(job_type)
+        else:
+            self._fields.setdefault(job_type, set()).update(fields)
 
         if self._monitor_task is None:
             await self._create_task()
@@ -81,99 +118,681 @@ class AsyncJobMonitor:
             )
             jobs = await future
 
+        jobs, fallback_jobs = jobs
+        if sacct_fallback:
+            jobs = {**fallback_jobs, **jobs}
+
         # Now filter the jobs we where looking for
         fetched_jobids = list(jobs.keys())
         return [jobs[i] for i in jobids if i in fetched_jobids]
 
     async def _monitor(
-        self, job_type: Union[AsyncJobSqueue, AsyncJobSacct], jobids: Set[int]
+        self,
+        job_type: Union[AsyncJobSqueue, AsyncJobSacct],
+        jobids: Set[int],
+        cached: bool,
+        sacct_fallback: bool,
+        fields: Optional[List[str]],
     ):
         jobs = await _fetch_jobs_async(
-            job_type=job_type, compute=self._compute, jobids=jobids
+            job_type=job_type,
+            compute=self._compute,
+            jobids=jobids,
+            cached=cached,
+            fields=fields,
         )
 
         jobs_by_id = {j.jobid: j for j in jobs}
 
+        # Jobs that are no longer in the queue get their final state from sacct,
+        # using a single request for the whole batch. Only the state is taken
+        # from sacct, and not all the squeue fields are valid sacct ones.
+        fallback_jobs_by_id = {}
+        if sacct_fallback:
+            missing = [i for i in jobids if i not in jobs_by_id]
+            if missing:
+                sacct_jobs = await _fetch_jobs_async(
+                    job_type=AsyncJobSacct,
+                    compute=self._compute,
+                    jobids=missing,
+                    cached=cached,
+                    fields=STATE_FIELDS,
+                )
+                fallback_jobs_by_id = {
+                    j.jobid: AsyncJobSqueue._from_sacct(j) for j in sacct_jobs
+                }
+
         # If we have more jobs schedule the monitor task again
         if self._jobids:
             await self._create_task()
         else:
             self._monitor_task = None
 
-        return jobs_by_id
+        return jobs_by_id, fallback_jobs_by_id
 
 
 #
-# Utility class to hold the context of a job request. The jobs property
-# is set when the request is fulfilled.
+# The requests for the state of jobs of one type that are fetched together,
+# the jobs are set when the batch is done.
 #
-class JobRequest:
-    def __init__(self, jobids):
-        self.jobids = jobids
-        self._jobs = None
+class JobBatch:
+    def __init__(self):
+        self.jobids: Set[str] = set()
+        # The freshest state requested wins
+        self.cached = True
+        self.sacct_fallback = False
+        self.done = False
+        self.error: Optional[BaseException] = None
+        self.jobs: Dict[str, Union[JobSqueue, JobSacct]] = {}
+        # Jobs no longer in the queue, with their state from sacct
+        self.fallback_jobs: Dict[str, JobSqueue] = {}
+        # The fields requested, unless a request wants all the fields
+        self.fields: Set[str] = set()
+        self.all_fields = False
+
+    def add(
+        self,
+        jobids: List[str],
+        cached: bool,
+        sacct_fallback: bool,
+        fields: Optional[List[str]] = None,
+    ):
+        self.jobids.update(jobids)
+        self.cached = self.cached and cached
+        self.sacct_fallback = self.sacct_fallback or sacct_fallback
+        if fields is None:
+            self.all_fields = True
+        else:
+            self.fields.update(fields)
 
-    @property
-    def jobs(self):
-        return self._jobs
 
-    @jobs.setter
-    def jobs(self, jobs: List[Union[JobSacct, JobSqueue]]):
-        self._jobs = jobs
+#
+# The batching state for a job type, protected by the condition.
+#
+class _JobTypeState:
+    def __init__(self):
+        self.condition = Condition()
+        # The batch collecting requests while a fetch is in progress
+        self.pending: Optional[JobBatch] = None
+        self.fetching = False
 
 
 #
-# Simple sync monitor that restricts job status requests to one at
-# a time and aggregates the waiting requests.
+# Sync monitor that restricts job status requests to one at a time per job
+# type and aggregates the waiting requests into a batch. The first thread to
+# find no fetch in progress fetches the batch on behalf of the others, which
+# wait on a condition variable.
 #
 class SyncJobMonitor:
     def __init__(self, compute: "Compute"):  # noqa: F821
         self._compute = compute
-        self._requests: Dict[Type, Set[JobRequest]] = {}
-        # Lock to protect access to self._requests
-        self._requests_lock = Lock()
-        # Lock to prevent multiple server requests concurrently
-        self._request_lock = Lock()
+        self._states: Dict[Type, _JobTypeState] = {
+            JobSqueue: _JobTypeState(),
+            JobSacct: _JobTypeState(),
+        }
 
     def fetch_jobs(
-        self, job_type: Union["JobSacct", "JobSqueue"], jobids: List[Union[int, str]]
+        self,
+        job_type: Union["JobSacct", "JobSqueue"],
+        jobids: List[Union[int, str]],
+        cached: Optional[bool] = None,
+        sacct_fallback: bool = False,
+        fields: Optional[List[str]] = None,
     ) -> List[Union[JobSqueue, JobSacct]]:
+        if cached is None:
+            cached = self._compute.client._cached_job_state
+
         jobids = list(map(str, jobids))
-        # First update the jobids and create a request context
-        request = None
-        with self._requests_lock:
-            request = JobRequest(jobids)
-            self._requests.setdefault(job_type, set()).add(request)
-
-        # Only allow a single request at a time
-        with self._request_lock:
+        state = self._states[job_type]
+
+        with state.condition:
+            batch = state.pending
+            if batch is None:
+                batch = state.pending = JobBatch()
+            batch.add(jobids, cached, sacct_fallback and job_type is JobSqueue, fields)
+
+            # Wait for our batch to be fetched, or for our turn to fetch it
+            while not batch.done and state.fetching:
+                state.condition.wait()
+
+            fetch = not batch.done
+            if fetch:
+                state.pending = None
+                state.fetching = True
+
+        if fetch:
             try:
-                self._requests_lock.acquire()
-                requests = self._requests[job_type]
-                if requests:
-                    # Copy the requests and reset the set
-                    self._requests[job_type] = set()
-
-                    # We are done updating self._requests so release the lock
-                    self._requests_lock.release()
-
-                    # Extract out the job ids from the requests we have
-                    jobids_for_job_type = reduce(
-                        lambda a, b: a + b, [r.jobids for r in requests]
-                    )
+                self._fetch(job_type, batch)
+            except BaseException as ex:
+                batch.error = ex
+            finally:
+                with state.condition:
+                    batch.done = True
+                    state.fetching = False
+                    state.condition.notify_all()
+
+        if batch.error is not None:
+            raise batch.error
+
+        # Now pick out the jobs we where looking for
+        jobs = []
+        for jobid in jobids:
+            job = batch.jobs.get(jobid)
+            if job is None and sacct_fallback:
+                job = batch.fallback_jobs.get(jobid)
+            if job is not None:
+                jobs.append(job)
+
+        return jobs
+
+    def _fetch(self, job_type: Union["JobSacct", "JobSqueue"], batch: JobBatch):
+        fields = None if batch.all_fields else sorted(batch.fields)
+        jobs = _fetch_jobs(
+            job_type=job_type,
+            compute=self._compute,
+            jobids=list(batch.jobids),
+            cached=batch.cached,
+            fields=fields,
+        )
+        batch.jobs = {j.jobid: j for j in jobs}
+
+        # Jobs that are no longer in the queue get their final state from sacct,
+        # using a single request for the whole batch. Only the state is taken
+        # from sacct, and not all the squeue fields are valid sacct ones.
+        if batch.sacct_fallback:
+            missing = [i for i in batch.jobids if i not in batch.jobs]
+            if missing:
+                sacct_jobs = _fetch_jobs(
+                    job_type=JobSacct,
+                    compute=self._compute,
+                    jobids=missing,
+                    cached=batch.cached,
+                    fields=STATE_FIELDS,
+                )
+                batch.fallback_jobs = {
+                    j.jobid: JobSqueue._from_sacct(j) for j in sacct_jobs
+                }
+
+
+#
+# A job waiting to reach one of a set of states.
+#
+class _Waiter:
+    def __init__(self, job, states: List[JobState]):
+        self.job = job
+        self.states = states
+        self.error: Optional[Exception] = None
+
 
-                    jobs = _fetch_jobs(
-                        job_type=job_type,
-                        compute=self._compute,
-                        jobids=jobids_for_job_type,
+class _JobWatcher:
+    def __init__(self, compute):
+        self._compute = compute
+        self._waiters: Set[_Waiter] = set()
+
+    # The waiters grouped by job type and then job id
+    def _waiters_by_type(self) -> Dict[Type, Dict[str, List[_Waiter]]]:
+        waiters_by_type = {}
+        for waiter in list(self._waiters):
+            waiters_by_id = waiters_by_type.setdefault(waiter.job.__class__, {})
+            waiters_by_id.setdefault(str(waiter.job.jobid), []).append(waiter)
+
+        return waiters_by_type
+
+    # Apply the fetched jobs to the waiting jobs, returning the waiters that
+    # are done.
+    def _apply(
+        self,
+        waiters_by_id: Dict[str, List[_Waiter]],
+        jobs: List[Union[AsyncJobSqueue, AsyncJobSacct, JobSqueue, JobSacct]],
+    ) -> List[_Waiter]:
+        jobs = {j.jobid: j for j in jobs}
+        done = []
+        for jobid, waiters in waiters_by_id.items():
+            for waiter in waiters:
+                if jobid not in jobs:
+                    # The job is in neither squeue or sacct, so would never
+                    # reach the states. Fail the waiter, as job.update() would.
+                    waiter.error = SfApiError(f"Job not found: {jobid}")
+                    done.append(waiter)
+                    continue
+
+                waiter.job._update(jobs[jobid])
+                if waiter.job.state in waiter.states:
+                    done.append(waiter)
+
+        return done
+
+
+#
+# Long lived watcher that polls the state of all the jobs being waited on for
+# a compute resource, using a single batched request per job type for each
+# interval, rather than each job polling for its own state.
+#
+class AsyncJobWatcher(_JobWatcher):
+    def __init__(self, compute: "AsyncCompute"):  # noqa: F821
+        super().__init__(compute)
+        self._futures: Dict[_Waiter, Future] = {}
+        self._watch_task: Optional[asyncio.Task] = None
+
+    async def wait(
+        self,
+        job: Union[AsyncJobSqueue, AsyncJobSacct],
+        states: List[JobState],
+        timeout: Optional[float] = None,
+    ) -> JobState:
+        """
+        Wait for the job to reach one of the states.
+        """
+        if job.state in states:
+            return job.state
+
+        waiter = _Waiter(job, states)
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.add(waiter)
+        self._futures[waiter] = future
+
+        if self._watch_task is None or self._watch_task.done():
+            self._watch_task = asyncio.create_task(self._watch())
+
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError()
+        finally:
+            self._waiters.discard(waiter)
+            self._futures.pop(waiter, None)
+
+    async def _poll(self):
+        for job_type, waiters_by_id in self._waiters_by_type().items():
+            jobs = await self._compute._monitor.fetch_jobs(
+                job_type=job_type,
+                jobids=list(waiters_by_id.keys()),
+                sacct_fallback=True,
+                # The waiters only need the state
+                fields=STATE_FIELDS,
+            )
+
+            for waiter in self._apply(waiters_by_id, jobs):
+                future = self._futures.get(waiter)
+                if future is None or future.done():
+                    continue
+
+                if waiter.error is not None:
+                    future.set_exception(waiter.error)
+                else:
+                    future.set_result(waiter.job.state)
+
+    async def _watch(self):
+        while self._waiters:
+            try:
+                await self._poll()
+            except Exception as ex:
+                # Fail all the waiters, as job.update() would have
+                for future in self._futures.values():
+                    if not future.done():
+                        future.set_exception(ex)
+                return
+
+            if self._waiters:
+                await asyncio.sleep(self._compute.client._wait_interval)
+
+
+#
+# Sync version of the job watcher. By default one of the waiting threads
+# polls on behalf of all the others, optionally a background daemon thread
+# does the polling and wakes the waiting threads.
+#
+class SyncJobWatcher(_JobWatcher):
+    def __init__(self, compute: "Compute"):  # noqa: F821
+        super().__init__(compute)
+        self._events: Dict[_Waiter, Event] = {}
+        self._errors: Dict[_Waiter, Exception] = {}
+        # Held by the thread polling for everyone
+        self._leader_lock = Lock()
+        self._waiters_lock = Lock()
+        self._background = compute.client._watch_jobs_thread
+        self._poll_thread: Optional[Thread] = None
+
+    def wait(
+        self,
+        job: Union[JobSqueue, JobSacct],
+        states: List[JobState],
+        timeout: Optional[float] = None,
+    ) -> JobState:
+        """
+        Wait for the job to reach one of the states.
+        """
+        if job.state in states:
+            return job.state
+
+        waiter = _Waiter(job, states)
+        event = Event()
+        with self._waiters_lock:
+            self._waiters.add(waiter)
+            self._events[waiter] = event
+            if self._background:
+                self._start_thread()
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        interval = self._compute.client._wait_interval
+
+        try:
+            if self._background and not event.wait(timeout):
+                raise TimeoutError()
+
+            while not event.is_set():
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError()
+
+                if self._leader_lock.acquire(blocking=False):
+                    try:
+                        self._lead(event, deadline, interval)
+                    finally:
+                        self._leader_lock.release()
+                else:
+                    # Wake up after an interval to take over if the leader
+                    # has gone.
+                    event.wait(
+                        interval if remaining is None else min(interval, remaining)
                     )
 
-                    # Set the jobs on the job request objects
-                    for jr in requests:
-                        jr.jobs = jobs
-            finally:
-                if self._requests_lock.locked():
-                    self._requests_lock.release()
+            error = self._errors.get(waiter)
+            if error is not None:
+                raise error
+
+            return job.state
+        finally:
+            with self._waiters_lock:
+                self._waiters.discard(waiter)
+                self._events.pop(waiter, None)
+                self._errors.pop(waiter, None)
+
+    # Called with the waiters lock held
+    def _start_thread(self):
+        if self._poll_thread is None or not self._poll_thread.is_alive():
+            self._poll_thread = Thread(
+                target=self._run, name="sfapi-job-watcher", daemon=True
+            )
+            self._poll_thread.start()
+
+    # Background thread polling for everyone until there is nothing to watch
+    def _run(self):
+        while True:
+            with self._waiters_lock:
+                if not self._waiters:
+                    self._poll_thread = None
+                    return
+
+            try:
+                self._poll()
+            except Exception as ex:
+                self._fail(ex)
+
+            _SLEEP(self._compute.client._wait_interval)
+
+    # Fail all the waiters, as job.update() would have
+    def _fail(self, ex: Exception):
+        with self._waiters_lock:
+            for waiter, waiter_event in self._events.items():
+                self._errors[waiter] = ex
+                waiter_event.set()
+
+    # Poll for everyone until our own job is done
+    def _lead(self, event: Event, deadline: Optional[float], interval: float):
+        while True:
+            try:
+                self._poll()
+            except Exception as ex:
+                self._fail(ex)
+                return
+
+            if event.is_set():
+                return
+
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return
+
+            _SLEEP(interval if remaining is None else min(interval, remaining))
+
+    def _poll(self):
+        with self._waiters_lock:
+            waiters_by_type = self._waiters_by_type()
+
+        for job_type, waiters_by_id in waiters_by_type.items():
+            jobs = self._compute._monitor.fetch_jobs(
+                job_type=job_type,
+                jobids=list(waiters_by_id.keys()),
+                sacct_fallback=True,
+                # The waiters only need the state
+                fields=STATE_FIELDS,
+            )
+
+            done = self._apply(waiters_by_id, jobs)
+            with self._waiters_lock:
+                for waiter in done:
+                    event = self._events.get(waiter)
+                    if event is not None:
+                        if waiter.error is not None:
+                            self._errors[waiter] = waiter.error
+                        event.set()
+
+
+# The maximum number of outstanding tasks fetched at a time
+TASK_FETCH_CONCURRENCY = 8
+
+
+#
+# A command task waiting to reach a terminal status.
+#
+class _TaskWaiter:
+    def __init__(self, task):
+        self.task = task
+        self.error: Optional[Exception] = None
+
+
+class _TaskMonitor:
+    def __init__(self, compute):
+        self._compute = compute
+        self._waiters: Set[_TaskWaiter] = set()
+
+    # The waiters grouped by task id
+    def _waiters_by_id(self) -> Dict[str, List[_TaskWaiter]]:
+        waiters_by_id = {}
+        for waiter in list(self._waiters):
+            waiters_by_id.setdefault(waiter.task.id, []).append(waiter)
+
+        return waiters_by_id
+
+    # Apply the fetched tasks to the waiting tasks, returning the waiters that
+    # are done.
+    def _apply(
+        self,
+        waiters_by_id: Dict[str, List[_TaskWaiter]],
+        tasks: Dict[str, TaskResponse],
+    ) -> List[_TaskWaiter]:
+        done = []
+        for task_id, waiters in waiters_by_id.items():
+            for waiter in waiters:
+                if task_id in tasks:
+                    waiter.task._apply(tasks[task_id])
+
+                if waiter.task.status in TASK_TERMINAL_STATUSES:
+                    done.append(waiter)
+
+        return done
+
+
+#
+# Async monitor that waits for command tasks to finish, the state of all the
+# outstanding tasks is fetched together every `task_interval` seconds, rather
+# than each task polling for its own state.
+#
+class AsyncTaskMonitor(_TaskMonitor):
+    def __init__(self, compute: "AsyncCompute"):  # noqa: F821
+        super().__init__(compute)
+        self._futures: Dict[_TaskWaiter, Future] = {}
+        self._poll_task: Optional[asyncio.Task] = None
+
+    async def wait(self, task: "AsyncCommandTask") -> "AsyncCommandTask":  # noqa: F821
+        """
+        Wait for the task to reach a terminal status.
+        """
+        waiter = _TaskWaiter(task)
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.add(waiter)
+        self._futures[waiter] = future
+
+        if self._poll_task is None or self._poll_task.done():
+            self._poll_task = asyncio.create_task(self._watch())
+
+        try:
+            await future
+        finally:
+            self._waiters.discard(waiter)
+            self._futures.pop(waiter, None)
+
+        return task
+
+    async def _fetch(
+        self, waiters_by_id: Dict[str, List[_TaskWaiter]]
+    ) -> Dict[str, TaskResponse]:
+        # Only the outstanding tasks are fetched, rather than the whole tasks
+        # collection, which includes all the user's recent tasks.
+        async def _fetch_task(waiters):
+            return await waiters[0].task._fetch()
+
+        task_ids = list(waiters_by_id.keys())
+        tasks = await _ASYNC_MAP(
+            _fetch_task,
+            [waiters_by_id[task_id] for task_id in task_ids],
+            TASK_FETCH_CONCURRENCY,
+        )
+
+        return dict(zip(task_ids, tasks))
+
+    async def _poll(self):
+        waiters_by_id = self._waiters_by_id()
+        if not waiters_by_id:
+            return
+
+        tasks = await self._fetch(waiters_by_id)
+
+        for waiter in self._apply(waiters_by_id, tasks):
+            self._waiters.discard(waiter)
+            future = self._futures.get(waiter)
+            if future is not None and not future.done():
+                future.set_result(None)
+
+    async def _watch(self):
+        while self._waiters:
+            try:
+                await self._poll()
+            except Exception as ex:
+                # Fail all the waiters, as task.update() would have
+                for future in self._futures.values():
+                    if not future.done():
+                        future.set_exception(ex)
+                return
+
+            if self._waiters:
+                await asyncio.sleep(self._compute.client._task_interval)
+
+
+#
+# Sync version of the task monitor, one of the waiting threads polls on behalf
+# of all the others.
+#
+class SyncTaskMonitor(_TaskMonitor):
+    def __init__(self, compute: "Compute"):  # noqa: F821
+        super().__init__(compute)
+        self._events: Dict[_TaskWaiter, Event] = {}
+        # Held by the thread polling for everyone
+        self._leader_lock = Lock()
+        self._waiters_lock = Lock()
+
+    def wait(self, task: "CommandTask") -> "CommandTask":  # noqa: F821
+        """
+        Wait for the task to reach a terminal status.
+        """
+        waiter = _TaskWaiter(task)
+        event = Event()
+        with self._waiters_lock:
+            self._waiters.add(waiter)
+            self._events[waiter] = event
+
+        interval = self._compute.client._task_interval
+
+        try:
+            while not event.is_set():
+                if self._leader_lock.acquire(blocking=False):
+                    try:
+                        self._lead(event, interval)
+                    finally:
+                        self._leader_lock.release()
+                else:
+                    # Wake up after an interval to take over if the leader
+                    # has gone.
+                    event.wait(interval)
+
+            if waiter.error is not None:
+                raise waiter.error
+
+            return task
+        finally:
+            with self._waiters_lock:
+                self._waiters.discard(waiter)
+                self._events.pop(waiter, None)
+
+    # Poll for everyone until our own task is done
+    def _lead(self, event: Event, interval: float):
+        while True:
+            try:
+                self._poll()
+            except Exception as ex:
+                # Fail all the waiters, as task.update() would have
+                with self._waiters_lock:
+                    for waiter, waiter_event in self._events.items():
+                        waiter.error = ex
+                        waiter_event.set()
+                return
+
+            if event.is_set():
+                return
+
+            _SLEEP(interval)
+
+    def _fetch(
+        self, waiters_by_id: Dict[str, List[_TaskWaiter]]
+    ) -> Dict[str, TaskResponse]:
+        # Only the outstanding tasks are fetched, rather than the whole tasks
+        # collection, which includes all the user's recent tasks.
+        def _fetch_task(waiters):
+            return waiters[0].task._fetch()
+
+        task_ids = list(waiters_by_id.keys())
+        tasks = _MAP(
+            _fetch_task,
+            [waiters_by_id[task_id] for task_id in task_ids],
+            TASK_FETCH_CONCURRENCY,
+        )
+
+        return dict(zip(task_ids, tasks))
+
+    def _poll(self):
+        with self._waiters_lock:
+            waiters_by_id = self._waiters_by_id()
+
+        if not waiters_by_id:
+            return
 
-        jobs = request.jobs
+        tasks = self._fetch(waiters_by_id)
 
-        return [j for j in jobs if j.jobid in jobids]
+        done = self._apply(waiters_by_id, tasks)
+        with self._waiters_lock:
+            for waiter in done:
+                self._waiters.discard(waiter)
+                event = self._events.get(waiter)
+                if event is not None:
+                    event.set()
@@ -0,0 +1,145 @@
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Optional, Tuple, Union
+
+# Values repeat a lot across jobs ( time limits, memory requests, TRES ... ),
+# so the parsed values are cached.
+PARSE_CACHE_SIZE = 4096
+
+# Slurm memory units are powers of 1024
+_MEMORY_UNITS = {
+    "K": 1024,
+    "M": 1024**2,
+    "G": 1024**3,
+    "T": 1024**4,
+    "P": 1024**5,
+}
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_duration(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Slurm duration into seconds, the formats are minutes,
+    minutes:seconds, hours:minutes:seconds, days-hours, days-hours:minutes
+    and days-hours:minutes:seconds.
+    """
+    if value is None:
+        return None
+
+    has_days = "-" in value
+    days = "0"
+    if has_days:
+        days, value = value.split("-", 1)
+
+    try:
+        days = int(days)
+        parts = [float(p) for p in value.strip().split(":")]
+    except ValueError:
+        # For example UNLIMITED, INVALID or NOT_SET
+        return None
+
+    if len(parts) > 3:
+        return None
+
+    if has_days:
+        # hours[:minutes[:seconds]]
+        hours, minutes, seconds = parts + [0.0] * (3 - len(parts))
+    elif len(parts) == 3:
+        hours, minutes, seconds = parts
+    else:
+        # minutes[:seconds]
+        hours = 0.0
+        minutes, seconds = parts + [0.0] * (2 - len(parts))
+
+    return days * 86400 + hours * 3600 + minutes * 60 + seconds
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_memory(value: Optional[str]) -> Optional[int]:
+    """
+    Parse a Slurm memory size, such as 12345K or 4Gn, into bytes. Values
+    without a unit are bytes.
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    # Memory requests may be per node or per cpu
+    if value[-1] in "nc":
+        value = value[:-1]
+
+    multiplier = _MEMORY_UNITS.get(value[-1:].upper())
+    if multiplier is not None:
+        value = value[:-1]
+    else:
+        multiplier = 1
+
+    try:
+        return int(float(value) * multiplier)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parse a Slurm timestamp, in the local time of the compute resource.
+    """
+    if not value:
+        return None
+
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        # For example Unknown or None
+        return None
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_int(value: Optional[str]) -> Optional[int]:
+    if not value:
+        return None
+
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+def _parse_tres_value(value: str) -> Union[int, float, str]:
+    try:
+        return int(value)
+    except ValueError:
+        pass
+
+    try:
+        return float(value)
+    except ValueError:
+        pass
+
+    size = _parse_memory(value)
+
+    return size if size is not None else value
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_tres_items(value: str) -> Tuple[Tuple[str, Union[int, float, str]], ...]:
+    items = []
+    for item in value.split(","):
+        name, sep, tres_value = item.partition("=")
+        if sep:
+            items.append((name, _parse_tres_value(tres_value)))
+
+    return tuple(items)
+
+
+def _parse_tres(value: Optional[str]) -> Optional[Dict[str, Union[int, float, str]]]:
+    """
+    Parse a Slurm TRES string, such as cpu=4,mem=16G,gres/gpu=1, into a dict.
+    Sizes are converted to bytes.
+    """
+    if value is None:
+        return None
+
+    # The cache holds tuples, so callers can't modify the cached value
+    return dict(_parse_tres_items(value))
@@ -0,0 +1,187 @@
+import random
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from ._jobs import JobState
+from ._parse import _parse_duration
+
+
+def _time_left(job) -> Optional[float]:
+    """
+    The time in seconds until the job reaches its time limit, if known.
+    """
+    # squeue
+    time_left = _parse_duration(getattr(job, "time_left", None))
+    if time_left is not None:
+        return time_left
+
+    # sacct, the limit is in minutes and the elapsed time in seconds
+    try:
+        limit = float(getattr(job, "timelimitraw", None)) * 60
+        elapsed = float(getattr(job, "elapsedraw", None))
+    except (TypeError, ValueError):
+        return None
+
+    return max(0.0, limit - elapsed)
+
+
+class PollingStrategy(ABC):
+    """
+    Decides how long to wait between polls of the state of a job, while
+    waiting for it to reach a state.
+    """
+
+    @abstractmethod
+    def interval(self, job, polls: int) -> float:
+        """
+        The time to wait before the next poll.
+
+        :param job: The job, updated with its latest state
+        :param polls: The number of polls since the job entered its current state
+        :return: The time to wait in seconds
+        """
+        pass
+
+
+class FixedPolling(PollingStrategy):
+    """
+    Poll at a fixed interval, this is the default using the `wait_interval`
+    of the client.
+
+    :param interval: The interval in seconds
+    """
+
+    def __init__(self, interval: float):
+        self._interval = interval
+
+    def interval(self, job, polls: int) -> float:
+        return self._interval
+
+
+class BackoffPolling(PollingStrategy):
+    """
+    Exponentially back off while the job stays in one of the given states (
+    PENDING by default ), jobs can be pending for hours so there is no point
+    polling them at a fixed rate. Once the job moves to another state the
+    initial interval is used.
+
+    :param initial: The initial interval in seconds
+    :param factor: The factor the interval is multiplied by on each poll
+    :param max_interval: The maximum interval in seconds
+    :param states: The states to back off in
+    """
+
+    def __init__(
+        self,
+        initial: float = 10.0,
+        factor: float = 2.0,
+        max_interval: float = 300.0,
+        states: List[JobState] = [JobState.PENDING],
+    ):
+        self._initial = initial
+        self._factor = factor
+        self._max_interval = max_interval
+        self._states = states
+
+    def interval(self, job, polls: int) -> float:
+        if job.state not in self._states:
+            return self._initial
+
+        return min(
+            self._max_interval, self._initial * self._factor ** max(0, polls - 1)
+        )
+
+
+class TimeLimitPolling(PollingStrategy):
+    """
+    Poll faster when a running job is close to its time limit, so the end of
+    the job is detected with less latency. Otherwise the wrapped strategy is
+    used.
+
+    :param strategy: The strategy to use when the job isn't near its time limit
+    :param window: How close in seconds to the time limit to poll faster
+    :param min_interval: The minimum interval in seconds
+    """
+
+    def __init__(
+        self,
+        strategy: PollingStrategy,
+        window: float = 120.0,
+        min_interval: float = 5.0,
+    ):
+        self._strategy = strategy
+        self._window = window
+        self._min_interval = min_interval
+
+    def interval(self, job, polls: int) -> float:
+        interval = self._strategy.interval(job, polls)
+        if job.state != JobState.RUNNING:
+            return interval
+
+        time_left = _time_left(job)
+        if time_left is None:
+            return interval
+
+        # Don't sleep past the start of the window
+        if time_left > self._window:
+            return min(interval, max(self._min_interval, time_left - self._window))
+
+        return min(interval, self._min_interval)
+
+
+class JitteredPolling(PollingStrategy):
+    """
+    Randomize the interval of another strategy, so jobs submitted together
+    are not all polled at the same time.
+
+    :param strategy: The strategy to add jitter to
+    :param jitter: The fraction of the interval to randomize by
+    """
+
+    def __init__(self, strategy: PollingStrategy, jitter: float = 0.1):
+        self._strategy = strategy
+        self._jitter = jitter
+
+    def interval(self, job, polls: int) -> float:
+        interval = self._strategy.interval(job, polls)
+
+        return interval * random.uniform(1 - self._jitter, 1 + self._jitter)
+
+
+class AdaptivePolling(PollingStrategy):
+    """
+    Back off while the job is pending, poll faster near the time limit and
+    add jitter.
+
+    ```python
+    >>> from sfapi_client.jobs import AdaptivePolling
+    >>> job = compute.submit_job(script)
+    >>> job.complete(polling=AdaptivePolling(max_interval=600))
+    ```
+
+    :param initial: The initial interval in seconds
+    :param max_interval: The maximum interval in seconds while pending
+    :param window: How close in seconds to the time limit to poll faster
+    :param min_interval: The minimum interval in seconds
+    :param jitter: The fraction of the interval to randomize by
+    """
+
+    def __init__(
+        self,
+        initial: float = 10.0,
+        max_interval: float = 300.0,
+        window: float = 120.0,
+        min_interval: float = 5.0,
+        jitter: float = 0.1,
+    ):
+        self._strategy = JitteredPolling(
+            TimeLimitPolling(
+                BackoffPolling(initial, max_interval=max_interval),
+                window=window,
+                min_interval=min_interval,
+            ),
+            jitter=jitter,
+        )
+
+    def interval(self, job, polls: int) -> float:
+        return self._strategy.interval(job, polls)
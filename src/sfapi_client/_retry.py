@@ -0,0 +1,190 @@
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, List, Optional
+
+import httpx
+import tenacity
+
+MAX_RETRY = 10
+
+RETRY_STATUS_CODES = [
+    httpx.codes.TOO_MANY_REQUESTS,
+    httpx.codes.BAD_GATEWAY,
+    httpx.codes.SERVICE_UNAVAILABLE,
+    httpx.codes.GATEWAY_TIMEOUT,
+]
+
+
+class RetryBudget:
+    """
+    Limits the number of retries to a fraction of the requests being made, so
+    a degraded API doesn't see a multiple of the normal request volume. A
+    minimum number of retries per second is always allowed so a client that
+    makes few requests can still retry.
+
+    The budget is thread safe, so it can be shared between clients.
+
+    :param ratio: The number of retries allowed per request made
+    :param min_per_second: The number of retries allowed per second regardless
+    of the number of requests made
+    :param max_balance: The maximum number of retries that can be accumulated
+    """
+
+    def __init__(
+        self, ratio: float = 0.2, min_per_second: float = 10.0, max_balance: int = 100
+    ):
+        self._ratio = ratio
+        self._min_per_second = min_per_second
+        self._max_balance = max_balance
+        self._balance = 0.0
+        self._reserve = min_per_second
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def deposit(self):
+        """
+        Record that a request has been made.
+        """
+        with self._lock:
+            self._balance = min(self._max_balance, self._balance + self._ratio)
+
+    def withdraw(self) -> bool:
+        """
+        Try to withdraw a retry from the budget.
+
+        :return: True if the retry is allowed, False if the budget is exhausted.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._reserve = min(
+                self._min_per_second,
+                self._reserve + (now - self._last) * self._min_per_second,
+            )
+            self._last = now
+
+            if self._reserve >= 1:
+                self._reserve -= 1
+                return True
+
+            if self._balance >= 1:
+                self._balance -= 1
+                return True
+
+            return False
+
+
+class RetryPolicy:
+    """
+    The policy used by the client to retry requests that fail with a
+    recoverable error ( timeouts, connection errors and 429, 502, 503 and 504
+    responses ).
+
+    The delay between attempts uses decorrelated jitter, so clients that fail
+    at the same time don't retry at the same time. If the server provides a
+    `Retry-After` header it is used as the minimum delay. The number of retries
+    is also limited by a `RetryBudget`.
+
+    ```python
+    >>> from sfapi_client import Client
+    >>> from sfapi_client.client import RetryPolicy
+    >>> policy = RetryPolicy(max_attempts=5, max_delay=30)
+    >>> with Client(client_id, client_secret, retry_policy=policy) as client:
+    >>>    # Use client
+    ```
+
+    :param max_attempts: The maximum number of attempts for a request
+    :param base_delay: The minimum delay between attempts in seconds
+    :param max_delay: The maximum delay between attempts in seconds
+    :param max_retry_after: The maximum `Retry-After` delay in seconds that will be
+    honored, the request isn't retried if the server asks for a longer delay
+    :param budget: The retry budget, defaults to a new `RetryBudget`. The same
+    budget can be given to several policies to share it between clients
+    :param status_codes: The response status codes to retry
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = MAX_RETRY,
+        base_delay: float = 1.0,
+        max_delay: float = 10.0,
+        max_retry_after: float = 120.0,
+        budget: Optional[RetryBudget] = None,
+        status_codes: List[int] = RETRY_STATUS_CODES,
+    ):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retry_after = max_retry_after
+        self.budget = budget if budget is not None else RetryBudget()
+        self.status_codes = status_codes
+
+    def _should_retry(self, e: BaseException) -> bool:
+        if isinstance(e, (httpx.TimeoutException, httpx.ConnectError)):
+            return True
+
+        return (
+            isinstance(e, httpx.HTTPStatusError)
+            and e.response.status_code in self.status_codes
+        )
+
+    @staticmethod
+    def _retry_after(e: BaseException) -> Optional[float]:
+        if not isinstance(e, httpx.HTTPStatusError):
+            return None
+
+        value = e.response.headers.get("Retry-After")
+        if value is None:
+            return None
+
+        # Either a number of seconds or a HTTP date
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+    def _before(self, retry_state: tenacity.RetryCallState):
+        # Only the first attempt of a request counts towards the budget
+        if retry_state.attempt_number == 1:
+            self.budget.deposit()
+
+    def _stop(self, retry_state: tenacity.RetryCallState) -> bool:
+        if retry_state.attempt_number >= self.max_attempts:
+            return True
+
+        retry_after = self._retry_after(retry_state.outcome.exception())
+        if retry_after is not None and retry_after > self.max_retry_after:
+            return True
+
+        return not self.budget.withdraw()
+
+    def _wait(self, retry_state: tenacity.RetryCallState) -> float:
+        # Decorrelated jitter, upcoming_sleep still holds the previous delay
+        previous = max(self.base_delay, retry_state.upcoming_sleep)
+        delay = min(self.max_delay, random.uniform(self.base_delay, previous * 3))
+
+        retry_after = self._retry_after(retry_state.outcome.exception())
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+
+        return delay
+
+    def _retrying_kwargs(self) -> Dict[str, Any]:
+        return {
+            "retry": tenacity.retry_if_exception(self._should_retry),
+            "wait": self._wait,
+            "stop": self._stop,
+            "before": self._before,
+        }
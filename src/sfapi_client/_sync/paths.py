@@ -1,6 +1,6 @@
-from typing import Optional, List, IO, AnyStr, Dict, Tuple
+from typing import Optional, List, IO, AnyStr, Dict, Tuple, Any
 from pathlib import PurePosixPath, Path
-from pydantic import PrivateAttr
+from pydantic import Field, PrivateAttr
 from io import StringIO, BytesIO
 from base64 import b64decode
 from contextlib import contextmanager
@@ -26,6 +26,12 @@ def _is_no_such(error: SfApiError):
 SYMLINK_REGEX = r"^(\/.*) ->"
 
 
+class _DirectoryListingResponse(DirectoryListingResponse):
+    # The entries are left as dicts, they are validated once when the paths
+    # are created rather than also being validated as DirectoryEntry's.
+    entries: List[Dict[str, Any]] = Field(..., title="Entries")
+
+
 class RemotePath(PathBase):
     """
     RemotePath is used to model a remote path, it takes inspiration from
@@ -36,6 +42,8 @@ class RemotePath(PathBase):
     # It would be nice to be able subclass PurePosixPath, however, this
     # require using private interfaces. So we derive by composition.
     _path: PurePosixPath = PrivateAttr()
+    # The response the state was last read from
+    _response: Any = PrivateAttr(None)
 
     def __init__(self, path=None, **kwargs):
         super().__init__(**kwargs)
@@ -162,10 +170,9 @@ class RemotePath(PathBase):
 
         r = self.compute.client.get(
             f"utilities/download/{self.compute.name}/{self._path}",
-            params={"binary": binary}
+            params={"binary": binary},
         )
-        json_response = r.json()
-        download_response = FileDownloadResponse.model_validate(json_response)
+        download_response = FileDownloadResponse.model_validate_json(r.content)
 
         if download_response.status == FileDownloadResponseStatus.ERROR:
             raise SfApiError(download_response.error)
@@ -186,9 +193,18 @@ class RemotePath(PathBase):
     ) -> List["RemotePath"]:  # noqa: F821
         r = compute.client.get(f"utilities/ls/{compute.name}/{path}")
 
-        json_response = r.json()
-        directory_listing_response = DirectoryListingResponse.model_validate(
-            json_response
+        return RemotePath._parse_ls(compute, path, r, directory, filter_dots)
+
+    @staticmethod
+    def _parse_ls(
+        compute: "Compute",  # noqa: F821
+        path,
+        r,
+        directory=False,
+        filter_dots=True,
+    ) -> List["RemotePath"]:
+        directory_listing_response = _DirectoryListingResponse.model_validate_json(
+            r.content
         )
         if directory_listing_response.status == DirectoryListingResponseStatus.ERROR:
             raise SfApiError(directory_listing_response.error)
@@ -196,46 +212,42 @@ class RemotePath(PathBase):
         paths = []
 
         def _to_remote_path(path, entry):
-            kwargs = entry.model_dump()
-            kwargs.update(path=path, compute=compute)
-            p = RemotePath(**kwargs)
-
-            return p
+            return RemotePath(path=path, compute=compute, **entry)
 
         # Special case for listing file or symlink
         if len(directory_listing_response.entries) == 1:
             entry = directory_listing_response.entries[0]
             # symlink
-            if entry.perms[0] == "l":
-                if match := re.search(SYMLINK_REGEX, entry.name):
-                    entry.name = match.group(1)
+            if entry["perms"][0] == "l":
+                if match := re.search(SYMLINK_REGEX, entry["name"]):
+                    entry["name"] = match.group(1)
             # file
             else:
                 # The API can add an extra /
-                path = entry.name
-                if entry.name.startswith("//"):
+                path = entry["name"]
+                if entry["name"].startswith("//"):
                     path = path[1:]
                 filename = PurePosixPath(path).name
-                entry.name = filename
+                entry["name"] = filename
 
             paths.append(_to_remote_path(path, entry))
         else:
             for entry in directory_listing_response.entries:
-                if filter_dots and not directory and entry.name in [".", ".."]:
+                if filter_dots and not directory and entry["name"] in [".", ".."]:
                     continue
                 # If we are just listing the directory look for .
                 # and just return it. In the future we should look
                 # at adding a directory option to the API to avoid
                 # the unnecessary listing.
-                elif directory and entry.name == ".":
-                    entry.name = PurePosixPath(path).name
+                elif directory and entry["name"] == ".":
+                    entry["name"] = PurePosixPath(path).name
                     return [_to_remote_path(path, entry)]
                 # Special case for symlink
-                elif entry.perms[0] == "l":
-                    if match := re.search(SYMLINK_REGEX, entry.name):
-                        entry.name = match.group(1)
+                elif entry["perms"][0] == "l":
+                    if match := re.search(SYMLINK_REGEX, entry["name"]):
+                        entry["name"] = match.group(1)
 
-                paths.append(_to_remote_path(f"{path}/{entry.name}", entry))
+                paths.append(_to_remote_path(f"{path}/{entry['name']}", entry))
 
         return paths
 
@@ -251,9 +263,17 @@ class RemotePath(PathBase):
         """
         Update the path in the latest information from the resource.
         """
+        path = str(self._path)
+        r = self.compute.client.get(f"utilities/ls/{self.compute.name}/{path}")
+
+        # The same response ( from the conditional or response cache ), so the
+        # path hasn't changed and there is nothing to validate.
+        if r is self._response:
+            return
+
         # Here we pass filter_dots=False so that we with get . if this is a
         # directory
-        file_state = self._ls(self.compute, str(self._path), filter_dots=False)
+        file_state = self._parse_ls(self.compute, path, r, filter_dots=False)
         if len(file_state) == 0:
             raise FileNotFoundError(self._path)
 
@@ -263,6 +283,7 @@ class RemotePath(PathBase):
         new_state.name = self.name
 
         self._update(new_state)
+        self._response = r
 
     def _update(self, new_file_state: "RemotePath") -> "RemotePath":
         for k in new_file_state.model_fields_set:
@@ -297,8 +318,7 @@ class RemotePath(PathBase):
 
         r = self.compute.client.put(url, files=files)
 
-        json_response = r.json()
-        upload_response = UploadResponse.model_validate(json_response)
+        upload_response = UploadResponse.model_validate_json(r.content)
         if upload_response.status == UploadResponseStatus.ERROR:
             raise SfApiError(upload_response.error)
 
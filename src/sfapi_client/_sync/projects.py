@@ -27,7 +27,7 @@ class Project(ProjectBase):
         params = {"name": name, "repo_name": self.repo_name}
 
         r = self.client.post("account/groups", data=params)
-        json_response = r.json()
+        json_response = self.client._json(r)
         try:
             group = Group.model_validate(dict(json_response, client=self.client))
         except ValidationError:
@@ -44,7 +44,7 @@ class Storage:
         :return GlobusStorage: Globus object to start and monitor transfers
         """
         response = self.client.get("status/globus")
-        values = response.json()
+        values = self.client._json(response)
         values["client"] = self.client
         _globus = GlobusStorage.model_validate(values)
 
@@ -107,7 +107,7 @@ class GlobusTransfer(GlobusTransferResult):
 
     def _fetch_state(self):
         r = self.globus.client.get(f"storage/globus/transfer/{self.transfer_id}")
-        json_response = r.json()
+        json_response = self.globus.client._json(r)
         json_response["transfer_id"] = self.transfer_id
         json_response["globus"] = self.globus
         transfer = GlobusTransfer.model_validate(json_response)
@@ -174,10 +174,10 @@ class GlobusStorage(StorageBase):
         )
 
         r = self.client.post("storage/globus/transfer", data=body.model_dump())
-        new_transfer = GlobusTransferModel.model_validate(r.json())
+        new_transfer = GlobusTransferModel.model_validate_json(r.content)
         transfer_id = new_transfer.transfer_id
         r = self.client.get(f"storage/globus/transfer/{transfer_id}")
-        json_response = r.json()
+        json_response = self.client._json(r)
         json_response["transfer_id"] = transfer_id
         json_response["globus"] = self
         transfer = GlobusTransfer.model_validate(json_response)
@@ -203,7 +203,7 @@ class GlobusStorage(StorageBase):
             raise ValueError("Must provide a transfer_uuid")
 
         r = self.client.get(f"storage/globus/transfer/{transfer_id}")
-        json_response = r.json()
+        json_response = self.client._json(r)
         json_response["transfer_id"] = transfer_id
         json_response["globus"] = self
         transfer = GlobusTransfer.model_validate(json_response)
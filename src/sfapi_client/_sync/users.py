@@ -30,7 +30,7 @@ class User(UserBase):
             params["username"] = username
 
         response = client.get(url, params=params)
-        json_response = response.json()
+        json_response = client._json(response)
 
         user = User.model_validate(dict(json_response, client=client))
 
@@ -50,8 +50,7 @@ class User(UserBase):
 
         r = self.client.get("account/groups")
 
-        json_response = r.json()
-        groups_reponse = GroupsResponse.model_validate(json_response)
+        groups_reponse = GroupsResponse.model_validate_json(r.content)
 
         groups = [
             Group.model_validate(dict(g, client=self.client))
@@ -71,7 +70,7 @@ class User(UserBase):
 
         r = self.client.get("account/projects")
 
-        project_values = r.json()
+        project_values = self.client._json(r)
 
         projects = [
             Project.model_validate(dict(p, client=self.client))
@@ -91,7 +90,7 @@ class User(UserBase):
 
         r = self.client.get("account/roles")
 
-        json_response = r.json()
+        json_response = self.client._json(r)
 
         roles = [
             Role.model_validate(dict(p, client=self.client)) for p in json_response
@@ -107,7 +106,7 @@ class User(UserBase):
         """
         r = self.client.get("account/clients")
 
-        json_response = r.json()
+        json_response = self.client._json(r)
 
         clients = [APIClient.model_validate(c) for c in json_response]
 
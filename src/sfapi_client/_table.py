@@ -0,0 +1,217 @@
+import importlib
+from datetime import datetime
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+from ._jobs import _normalize_state
+from ._parse import (
+    _parse_duration,
+    _parse_int,
+    _parse_memory,
+    _parse_timestamp,
+    _parse_tres_items,
+)
+
+
+def _import(module: str, extra: str):
+    try:
+        return importlib.import_module(module)
+    except ImportError as ex:
+        raise ImportError(
+            f"{module} is required for this conversion, install it with"
+            f" `pip install sfapi_client[{extra}]`"
+        ) from ex
+
+
+# The squeue/sacct fields that hold plain integers, these are converted to
+# typed arrays by `JobTable.to_numpy()`.
+NUMERIC_FIELDS = frozenset(
+    [
+        # sacct
+        "alloccpus",
+        "allocnodes",
+        "consumedenergyraw",
+        "cputimeraw",
+        "elapsedraw",
+        "ncpus",
+        "nnodes",
+        "ntasks",
+        "priority",
+        "reqcpus",
+        "reqnodes",
+        "resvcpuraw",
+        "timelimitraw",
+        # squeue
+        "cpus",
+        "min_cpus",
+        "nodes",
+    ]
+)
+
+
+class JobTable:
+    """
+    Columnar table of the state of jobs, as returned by `compute.jobs(...,
+    table=True)`. The table is built directly from the squeue/sacct output
+    without creating a job object per row, which is much faster and uses less
+    memory for large accounting queries. Each column is a list of the values
+    as returned by squeue/sacct.
+
+    ```python
+    >>> table = compute.jobs(user="user", command=JobCommand.sacct, table=True)
+    >>> table["state"]
+    >>> df = table.to_pandas()
+    ```
+    """
+
+    def __init__(self, columns: Dict[str, List[Any]]):
+        self._columns = columns
+        self._length = len(next(iter(columns.values()), []))
+
+    @classmethod
+    def _from_output(cls, output: List[Dict]) -> "JobTable":
+        # Rows normally all have the same fields, so only the rows with a
+        # different set of fields add columns.
+        names = {}
+        fields = None
+        uniform = True
+        for row in output:
+            if row.keys() != fields:
+                uniform = fields is None
+                fields = row.keys()
+                names.update(dict.fromkeys(fields))
+
+        names = list(names)
+        if uniform and len(names) > 1:
+            # Transpose the rows in one pass
+            values = zip(*map(itemgetter(*names), output))
+            columns = dict(zip(names, map(list, values)))
+        else:
+            columns = {name: [row.get(name) for row in output] for name in names}
+
+        # As for the job objects coerce the state to a value that will match a
+        # JobState.
+        state = columns.get("state")
+        if state is not None:
+            columns["state"] = [
+                _normalize_state(s) if s is not None else None for s in state
+            ]
+
+        return cls(columns)
+
+    @property
+    def columns(self) -> List[str]:
+        """
+        The column names.
+        """
+        return list(self._columns.keys())
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, name: str) -> List[Any]:
+        return self._columns[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._columns
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._columns)
+
+    # Each distinct value is only parsed once, columns such as the time limit
+    # or the requested memory have few distinct values.
+    def _convert(self, name: str, parse: Callable) -> List[Any]:
+        values = self._columns[name]
+        parsed = {value: parse(value) for value in set(values)}
+
+        return list(map(parsed.__getitem__, values))
+
+    def durations(self, name: str) -> List[Optional[float]]:
+        """
+        Parse a duration column, such as elapsed or timelimit, into seconds.
+        """
+        return self._convert(name, _parse_duration)
+
+    def integers(self, name: str) -> List[Optional[int]]:
+        """
+        Parse an integer column, such as elapsedraw or cputimeraw.
+        """
+        return self._convert(name, _parse_int)
+
+    def sizes(self, name: str) -> List[Optional[int]]:
+        """
+        Parse a memory size column, such as maxrss or reqmem, into bytes.
+        """
+        return self._convert(name, _parse_memory)
+
+    def timestamps(self, name: str) -> List[Optional[datetime]]:
+        """
+        Parse a timestamp column, such as start or end.
+        """
+        return self._convert(name, _parse_timestamp)
+
+    def tres(self, name: str) -> List[Optional[Dict[str, Union[int, float, str]]]]:
+        """
+        Parse a TRES column, such as alloctres, into dicts. Sizes are in bytes.
+        """
+        items = self._convert(
+            name, lambda value: _parse_tres_items(value) if value is not None else None
+        )
+
+        return [dict(i) if i is not None else None for i in items]
+
+    def to_dict(self) -> Dict[str, List[Any]]:
+        """
+        The table as a dict of columns.
+        """
+        return dict(self._columns)
+
+    def to_numpy(self, numeric: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """
+        The table as a dict of NumPy arrays. Requires numpy.
+
+        The numeric columns are parsed into `float64` arrays, with missing or
+        unparsable values as NaN. The other columns are object arrays of the
+        values as returned by squeue/sacct, use the converters such as
+        `durations()` for those.
+
+        :param numeric: The names of the numeric columns, defaults to the
+            integer fields of squeue/sacct, such as elapsedraw or cputimeraw.
+        :return: The dict of arrays
+        """
+        np = _import("numpy", "numpy")
+        numeric = NUMERIC_FIELDS if numeric is None else frozenset(numeric)
+
+        arrays = {}
+        for name, values in self._columns.items():
+            if name in numeric:
+                values = [
+                    value if value is not None else np.nan
+                    for value in self.integers(name)
+                ]
+                arrays[name] = np.array(values, dtype=np.float64)
+            else:
+                arrays[name] = np.array(values, dtype=object)
+
+        return arrays
+
+    def to_arrow(self) -> Any:
+        """
+        The table as a `pyarrow.Table` of string columns. Requires pyarrow.
+        """
+        pa = _import("pyarrow", "arrow")
+
+        return pa.table(
+            {
+                name: pa.array(values, type=pa.string())
+                for name, values in self._columns.items()
+            }
+        )
+
+    def to_pandas(self) -> Any:
+        """
+        The table as a `pandas.DataFrame`. Requires pandas.
+        """
+        pd = _import("pandas", "pandas")
+
+        return pd.DataFrame(self._columns)
@@ -0,0 +1,365 @@
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    # Not available on Windows, the cache is still used but processes may
+    # fetch a token concurrently.
+    fcntl = None
+
+# Refresh the token this many seconds before it expires, this needs to be
+# larger than the leeway used by authlib, otherwise authlib will refresh the
+# token inline before we get a chance to.
+TOKEN_REFRESH_MARGIN = 120
+# How long to wait before trying again if a background refresh fails
+TOKEN_REFRESH_RETRY = 10
+# How often the async client checks whether the cache lock has been released
+TOKEN_CACHE_LOCK_POLL = 0.05
+
+
+def _default_cache_dir() -> Path:
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    if cache_home:
+        return Path(cache_home) / "sfapi_client"
+
+    return Path.home() / ".cache" / "sfapi_client"
+
+
+class TokenCache:
+    """
+    On disk cache of access tokens, so short lived processes using the same
+    client credentials can reuse a token that is still valid rather than each
+    fetching a new one. Tokens are keyed by client id and token URL, the cache
+    files are only readable by the owner and access is serialized with a file
+    lock, so only one process fetches a new token at a time.
+
+    ```python
+    >>> from sfapi_client import Client
+    >>> from sfapi_client.client import TokenCache
+    >>> with Client(key="~/.superfacility/key.pem", token_cache=TokenCache()) as client:
+    >>>    # Use client
+    ```
+
+    :param path: The directory to store the tokens in, defaults to
+    `$XDG_CACHE_HOME/sfapi_client` or `~/.cache/sfapi_client`
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        if path is None:
+            path = _default_cache_dir()
+
+        self._path = Path(path).expanduser()
+
+    def _token_path(self, client_id: str, token_url: str) -> Path:
+        key = hashlib.sha256(f"{client_id}:{token_url}".encode()).hexdigest()
+
+        return self._path / f"{key[:32]}.json"
+
+    def _open_lock(self, client_id: str, token_url: str) -> int:
+        self._path.mkdir(mode=0o700, parents=True, exist_ok=True)
+        lock_path = self._token_path(client_id, token_url).with_suffix(".lock")
+
+        return os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+
+    @staticmethod
+    def _unlock(fd: int):
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+
+    @contextmanager
+    def lock(self, client_id: str, token_url: str):
+        """
+        Hold an exclusive lock on the cache entry.
+        """
+        fd = self._open_lock(client_id, token_url)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            self._unlock(fd)
+
+    @asynccontextmanager
+    async def async_lock(self, client_id: str, token_url: str):
+        """
+        Hold an exclusive lock on the cache entry, without blocking the event
+        loop while waiting for it. The lock may be held by another client in
+        the same event loop.
+        """
+        fd = self._open_lock(client_id, token_url)
+        try:
+            while fcntl is not None:
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    break
+                except BlockingIOError:
+                    await asyncio.sleep(TOKEN_CACHE_LOCK_POLL)
+            yield
+        finally:
+            self._unlock(fd)
+
+    def load(self, client_id: str, token_url: str) -> Optional[Dict]:
+        """
+        Load the cached token.
+
+        :return: The token or None if there is no usable token cached.
+        """
+        token_path = self._token_path(client_id, token_url)
+
+        try:
+            # Same check as for the client keys, ignore the token if anyone
+            # else could have read or modified it.
+            if token_path.stat().st_mode != 0o100600:
+                return None
+
+            with token_path.open() as fp:
+                return json.load(fp)
+        except (OSError, ValueError):
+            return None
+
+    def store(self, client_id: str, token_url: str, token: Dict):
+        """
+        Store a token in the cache.
+        """
+        self._path.mkdir(mode=0o700, parents=True, exist_ok=True)
+        token_path = self._token_path(client_id, token_url)
+        tmp_path = token_path.with_suffix(f".{os.getpid()}.tmp")
+
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as fp:
+            json.dump(dict(token), fp)
+
+        # Atomic, so readers never see a partial token
+        os.replace(tmp_path, token_path)
+
+    def clear(self, client_id: str, token_url: str):
+        """
+        Remove a token from the cache.
+        """
+        self._token_path(client_id, token_url).unlink(missing_ok=True)
+
+
+class _TokenRefresher:
+    def __init__(
+        self,
+        client,
+        margin: float = TOKEN_REFRESH_MARGIN,
+        cache: Optional[TokenCache] = None,
+    ):
+        self._client = client
+        self._margin = margin
+        self._cache = cache
+
+    def _cache_key(self):
+        return (self._client.client_id, self._client.metadata.get("token_endpoint"))
+
+    # Use the cached token if it is valid, when refreshing the cached token also
+    # has to be newer than the token we have, as in another process refreshed it.
+    def _load_cached(self, refresh: bool) -> bool:
+        token = self._cache.load(*self._cache_key())
+        if token is None or token.get("expires_at") is None:
+            return False
+
+        current = self._client.token
+        if refresh and current is not None and current.get("expires_at") is not None:
+            if token["expires_at"] <= current["expires_at"]:
+                return False
+
+        if token["expires_at"] - self._client.leeway <= time.time():
+            return False
+
+        self._client.token = token
+
+        return True
+
+    # Is the current token usable for a request
+    def _valid(self) -> bool:
+        token = self._client.token
+        if token is None:
+            return False
+
+        return not token.is_expired(leeway=self._client.leeway)
+
+    # The number of seconds until the token should be refreshed, None if the
+    # token doesn't expire. For short lived tokens we refresh half way through
+    # the remaining lifetime, so we don't continuously refresh.
+    def _refresh_in(self) -> Optional[float]:
+        token = self._client.token
+        if token is None or token.get("expires_at") is None:
+            return None
+
+        remaining = token["expires_at"] - time.time()
+
+        return max(0.0, remaining - self._margin, remaining / 2)
+
+
+#
+# Keeps the token of an AsyncOAuth2Client fresh using a background task, so
+# requests don't have to wait for the token to be fetched. Only one fetch is
+# done at a time, concurrent requests wait for the same fetch.
+#
+class AsyncTokenRefresher(_TokenRefresher):
+    def __init__(
+        self,
+        client,
+        margin: float = TOKEN_REFRESH_MARGIN,
+        cache: Optional[TokenCache] = None,
+    ):
+        super().__init__(client, margin, cache)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    def _bind_loop(self):
+        # The lock and task belong to the event loop they were created in
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._lock = asyncio.Lock()
+            self._refresh_task = None
+
+    async def ensure_token(self):
+        """
+        Make sure we have a valid token, fetching one if necessary.
+        """
+        self._bind_loop()
+
+        if not self._valid():
+            async with self._lock:
+                # Another coroutine may have fetched the token while we waited
+                if not self._valid():
+                    await self._fetch_token(refresh=False)
+
+        if self._refresh_task is None or self._refresh_task.done():
+            if self._refresh_in() is not None:
+                self._refresh_task = asyncio.create_task(self._refresh())
+
+    async def _fetch_token(self, refresh: bool):
+        if self._cache is None:
+            await self._client.fetch_token()
+            return
+
+        async with self._cache.async_lock(*self._cache_key()):
+            if self._load_cached(refresh):
+                return
+
+            await self._client.fetch_token()
+            self._cache.store(*self._cache_key(), self._client.token)
+
+    async def _refresh(self):
+        while True:
+            refresh_in = self._refresh_in()
+            if refresh_in is None:
+                return
+
+            await asyncio.sleep(refresh_in)
+
+            try:
+                async with self._lock:
+                    await self._fetch_token(refresh=True)
+            except Exception:
+                # The token will be fetched inline if it expires before we
+                # manage to refresh it.
+                await asyncio.sleep(TOKEN_REFRESH_RETRY)
+
+    async def close(self):
+        """
+        Stop the background refresh.
+        """
+        if self._refresh_task is not None and not self._refresh_task.done():
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+
+        self._refresh_task = None
+
+
+#
+# Keeps the token of an OAuth2Client fresh using a background daemon thread,
+# so requests don't have to wait for the token to be fetched. Only one fetch
+# is done at a time, concurrent requests wait for the same fetch.
+#
+class SyncTokenRefresher(_TokenRefresher):
+    def __init__(
+        self,
+        client,
+        margin: float = TOKEN_REFRESH_MARGIN,
+        cache: Optional[TokenCache] = None,
+    ):
+        super().__init__(client, margin, cache)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._refresh_thread: Optional[threading.Thread] = None
+
+    def ensure_token(self):
+        """
+        Make sure we have a valid token, fetching one if necessary.
+        """
+        if not self._valid():
+            with self._lock:
+                # Another thread may have fetched the token while we waited
+                if not self._valid():
+                    self._fetch_token(refresh=False)
+
+        if self._refresh_thread is None or not self._refresh_thread.is_alive():
+            with self._lock:
+                if self._refresh_in() is None:
+                    return
+
+                if self._refresh_thread is None or not self._refresh_thread.is_alive():
+                    self._stop.clear()
+                    self._refresh_thread = threading.Thread(
+                        target=self._refresh, name="sfapi-token-refresh", daemon=True
+                    )
+                    self._refresh_thread.start()
+
+    def _fetch_token(self, refresh: bool):
+        if self._cache is None:
+            self._client.fetch_token()
+            return
+
+        with self._cache.lock(*self._cache_key()):
+            if self._load_cached(refresh):
+                return
+
+            self._client.fetch_token()
+            self._cache.store(*self._cache_key(), self._client.token)
+
+    def _refresh(self):
+        while True:
+            refresh_in = self._refresh_in()
+            if refresh_in is None:
+                return
+
+            if self._stop.wait(refresh_in):
+                return
+
+            try:
+                with self._lock:
+                    self._fetch_token(refresh=True)
+            except Exception:
+                # The token will be fetched inline if it expires before we
+                # manage to refresh it.
+                if self._stop.wait(TOKEN_REFRESH_RETRY):
+                    return
+
+    def close(self):
+        """
+        Stop the background refresh.
+        """
+        self._stop.set()
+        if self._refresh_thread is not None:
+            self._refresh_thread.join()
+
+        self._refresh_thread = None
@@ -1,6 +1,7 @@
 import time
 import asyncio
-from typing import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List
 from functools import wraps
 from .exceptions import SfApiError
 from ._models import StatusValue
@@ -9,6 +10,26 @@ _SLEEP = time.sleep
 _ASYNC_SLEEP = asyncio.sleep
 
 
+# Map a function over items, with at most concurrency calls in flight. The
+# results are in the same order as the items.
+def _MAP(fn: Callable, items: List[Any], concurrency: int) -> List[Any]:
+    if concurrency <= 1 or len(items) <= 1:
+        return [fn(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(items))) as executor:
+        return list(executor.map(fn, items))
+
+
+async def _ASYNC_MAP(fn: Callable, items: List[Any], concurrency: int) -> List[Any]:
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _call(item):
+        async with semaphore:
+            return await fn(item)
+
+    return await asyncio.gather(*[_call(item) for item in items])
+
+
 def check_auth(method: Callable):
     @wraps(method)
     def wrapper(self, *args, **kwargs):
@@ -1,2 +1,6 @@
 from ._async.client import AsyncApi, AsyncResources, AsyncClient  # noqa: F401
 from ._sync.client import Api, Resources, Client  # noqa: F401
+from ._limiter import RateLimit, RateLimitStats  # noqa: F401
+from ._retry import RetryPolicy, RetryBudget  # noqa: F401
+from ._token import TokenCache  # noqa: F401
+from ._cache import ResponseCache, DEFAULT_CACHE_TTLS  # noqa: F401
@@ -6,3 +6,4 @@ from ._async.compute import (
 from ._sync.compute import Compute, CommandTask, CommandTaskResult  # noqa: F401
 from ._models import PublicHost as Machine  # noqa: F401
 from ._compute import TaskStatus  # noqa: F401
+from ._callback import AsyncCallbackReceiver, SyncCallbackReceiver  # noqa: F401
@@ -14,3 +14,24 @@ class ClientKeyError(Exception):
 
     def __init__(self, message):
         self.message = message
+
+
+class SubmitJobsError(SfApiError):
+    """
+    Exception indicating some of a batch of job submissions failed. The jobs
+    that were submitted are not lost, they are available along with the errors
+    for the ones that were not.
+
+    :param jobs: The submitted jobs, `None` where the submission failed.
+    :param task_ids: The submission task ids, `None` where the job was not posted.
+    :param errors: The submission errors, `None` where the job was submitted.
+    """
+
+    def __init__(self, jobs, task_ids, errors):
+        failed = [e for e in errors if e is not None]
+        message = f"{len(failed)} of {len(errors)} job submissions failed: {failed[0]}"
+        super().__init__(message)
+        self.args = (message,)
+        self.jobs = jobs
+        self.task_ids = task_ids
+        self.errors = errors
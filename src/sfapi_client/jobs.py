@@ -2,6 +2,14 @@ from ._jobs import JobCommand  # noqa: F401
 from ._jobs import JobStateResponse  # noqa: F401
 from ._jobs import JobState  # noqa: F401
 from ._jobs import TERMINAL_STATES  # noqa: F401
+from ._jobs import JobStateChange  # noqa: F401
+from ._table import JobTable  # noqa: F401
+from ._polling import PollingStrategy  # noqa: F401
+from ._polling import FixedPolling  # noqa: F401
+from ._polling import BackoffPolling  # noqa: F401
+from ._polling import TimeLimitPolling  # noqa: F401
+from ._polling import JitteredPolling  # noqa: F401
+from ._polling import AdaptivePolling  # noqa: F401
 
 from ._async.jobs import AsyncJob, AsyncJobSacct, AsyncJobSqueue  # noqa: F401
 from ._sync.jobs import Job, JobSacct, JobSqueue  # noqa: F401
@@ -6,6 +6,7 @@ from typing import Optional, Union, Dict
 from pathlib import Path
 from cryptography.hazmat.primitives.asymmetric import rsa
 
+import httpx
 import pytest
 
 from sfapi_client.compute import Machine
@@ -179,6 +180,133 @@ def async_authenticated_client(api_base_url, token_url, client_id, client_secret
     )
 
 
+MOCK_API_URL = "https://api.test/api/v1.2"
+
+
+class MockApi:
+    """
+    Stand-in for the API, so tests can run without credentials. Requests are
+    answered by the handler registered for the method and path ( relative to
+    the API base URL ), the status of the compute resources is answered by
+    default so compute objects can be created.
+    """
+
+    def __init__(self):
+        self.handlers = {}
+        self.requests = []
+
+    def route(self, method: str, path: str, handler):
+        self.handlers[(method, path)] = handler
+
+    def route_jobs(
+        self,
+        machine: str,
+        squeue: Optional[Dict[str, str]] = None,
+        sacct: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Answer the squeue and sacct queries for a machine from the job states,
+        keyed by jobid. Jobs missing from the states are not returned.
+        """
+
+        def _jobs(request: httpx.Request) -> httpx.Response:
+            params = request.url.params
+            states = (sacct if params.get("sacct") == "true" else squeue) or {}
+
+            jobids = list(states.keys())
+            for kwarg in params.get_list("kwargs"):
+                if kwarg.startswith("jobid="):
+                    jobids = kwarg.split("=", 1)[1].split(",")
+
+            output = [
+                {"jobid": jobid, "state": states[jobid]}
+                for jobid in jobids
+                if jobid in states
+            ]
+
+            return httpx.Response(200, json={"status": "OK", "output": output})
+
+        self.route("GET", f"compute/jobs/{machine}", _jobs)
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        path = request.url.path.split("/api/v1.2/", 1)[-1]
+
+        handler = self.handlers.get((request.method, path))
+        if handler is not None:
+            return handler(request)
+
+        if request.method == "GET" and path.startswith("status/"):
+            name = path.split("/", 1)[1]
+            return httpx.Response(
+                200,
+                json={
+                    "name": name,
+                    "full_name": name,
+                    "description": name,
+                    "system_type": "compute",
+                    "notes": [],
+                    "status": "active",
+                    "updated_at": None,
+                },
+            )
+
+        return httpx.Response(404)
+
+
+@pytest.fixture
+def mock_api():
+    return MockApi()
+
+
+@pytest.fixture
+def mock_api_url():
+    return MOCK_API_URL
+
+
+def _use_mock_api(mocker, client, mock_api):
+    mocker.patch.object(
+        client,
+        "_transport_kwargs",
+        return_value={"transport": httpx.MockTransport(mock_api)},
+    )
+
+    return client
+
+
+@pytest.fixture
+def use_mock_api(mocker, mock_api):
+    """
+    Route the requests of a client to the mock API, for tests that need a
+    client configured differently to the `mock_api_client` one.
+    """
+    return lambda client: _use_mock_api(mocker, client, mock_api)
+
+
+@pytest.fixture
+def mock_api_client(mocker, mock_api):
+    client = Client(
+        api_base_url=MOCK_API_URL,
+        access_token="token",
+        wait_interval=0,
+        task_interval=0,
+    )
+
+    return _use_mock_api(mocker, client, mock_api)
+
+
+@pytest.fixture
+def async_mock_api_client(mocker, mock_api):
+    client = AsyncClient(
+        api_base_url=MOCK_API_URL,
+        access_token="token",
+        wait_interval=0,
+        task_interval=0,
+    )
+
+    return _use_mock_api(mocker, client, mock_api)
+
+
 @pytest.fixture
 def access_token():
     return settings.ACCESS_TOKEN
@@ -0,0 +1,130 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from sfapi_client import Client
+from sfapi_client._cache import SyncSingleFlight
+from sfapi_client.client import ResponseCache
+
+
+@pytest.mark.public
+def test_single_flight_shared_result():
+    single_flight = SyncSingleFlight()
+    calls = []
+
+    def _call():
+        calls.append(1)
+        time.sleep(0.2)
+        return object()
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        futures = [executor.submit(single_flight.run, "key", _call) for _ in range(5)]
+        results = [f.result() for f in futures]
+
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+    assert single_flight._calls == {}
+
+
+@pytest.mark.public
+def test_single_flight_exception():
+    single_flight = SyncSingleFlight()
+    started = threading.Event()
+
+    def _call():
+        started.set()
+        time.sleep(0.2)
+        raise ValueError("failed")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(single_flight.run, "key", _call)
+        started.wait()
+        follower = executor.submit(single_flight.run, "key", _call)
+
+        with pytest.raises(ValueError):
+            leader.result()
+        with pytest.raises(ValueError):
+            follower.result()
+
+    # The next call isn't affected by the failure
+    assert single_flight.run("key", lambda: 1) == 1
+
+
+@pytest.mark.public
+@pytest.mark.parametrize("coalesce_requests, expected", [(True, 1), (False, 5)])
+def test_coalesce_requests(
+    mock_api, use_mock_api, mock_api_url, coalesce_requests, expected
+):
+    def _handler(request):
+        time.sleep(0.2)
+        return httpx.Response(200, json={"status": "active"})
+
+    mock_api.route("GET", "status", _handler)
+
+    with use_mock_api(
+        Client(
+            api_base_url=mock_api_url,
+            access_token="token",
+            coalesce_requests=coalesce_requests,
+        )
+    ) as client:
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            futures = [executor.submit(client.get, "status") for _ in range(5)]
+            responses = [f.result() for f in futures]
+
+    assert len(mock_api.requests) == expected
+    assert all(r.status_code == 200 for r in responses)
+
+
+@pytest.mark.public
+def test_response_cache_base_urls(mock_api, use_mock_api):
+    cache = ResponseCache()
+    names = {"api.test": "prod", "api-dev.test": "dev"}
+
+    def _status(request):
+        return httpx.Response(200, json={"name": names[request.url.host]})
+
+    mock_api.route("GET", "status", _status)
+
+    responses = {}
+    for name, base_url in [
+        ("prod", "https://api.test/api/v1.2"),
+        ("dev", "https://api-dev.test/api/v1.2"),
+    ]:
+        with use_mock_api(
+            Client(api_base_url=base_url, access_token="token", response_cache=cache)
+        ) as client:
+            responses[name] = [client.get("status").json() for _ in range(2)]
+
+    # Each server's response is cached separately
+    assert responses == {
+        "prod": [{"name": "prod"}] * 2,
+        "dev": [{"name": "dev"}] * 2,
+    }
+    assert cache.hits == 2
+    assert cache.misses == 2
+
+
+@pytest.mark.public
+def test_response_cache_ttl(mocker):
+    now = mocker.patch("sfapi_client._cache.time.monotonic", return_value=0.0)
+    cache = ResponseCache(ttls={"status": 60, "status/outages": 300})
+    response = httpx.Response(200)
+
+    cache.put("status/perlmutter", "", response)
+    cache.put("status/outages", "", response)
+    # Not a cached prefix
+    cache.put("compute/jobs", "", response)
+
+    assert cache.get("status/perlmutter") is response
+    assert cache.get("compute/jobs") is None
+
+    now.return_value = 120.0
+    assert cache.get("status/perlmutter") is None
+    assert cache.get("status/outages") is response
+
+    cache.invalidate("status")
+    assert cache.get("status/outages") is None
@@ -0,0 +1,116 @@
+import asyncio
+
+import httpx
+import pytest
+
+from sfapi_client import AsyncClient
+from sfapi_client._cache import AsyncSingleFlight
+
+
+@pytest.mark.public
+@pytest.mark.asyncio
+async def test_single_flight_shared_result():
+    single_flight = AsyncSingleFlight()
+    calls = []
+
+    async def _call():
+        calls.append(1)
+        await asyncio.sleep(0.1)
+        return object()
+
+    results = await asyncio.gather(*[single_flight.run("key", _call) for _ in range(5)])
+
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+    assert single_flight._calls == {}
+
+
+@pytest.mark.public
+@pytest.mark.asyncio
+async def test_single_flight_leader_cancelled():
+    single_flight = AsyncSingleFlight()
+    calls = []
+
+    async def _call():
+        calls.append(1)
+        await asyncio.sleep(0.1)
+        return len(calls)
+
+    leader = asyncio.create_task(single_flight.run("key", _call))
+    await asyncio.sleep(0)
+    followers = [asyncio.create_task(single_flight.run("key", _call)) for _ in range(3)]
+    await asyncio.sleep(0)
+
+    # The followers retry the call rather than being cancelled with the leader
+    leader.cancel()
+    results = await asyncio.gather(*followers)
+
+    assert leader.cancelled()
+    assert len(calls) == 2
+    assert results == [2, 2, 2]
+
+
+@pytest.mark.public
+@pytest.mark.asyncio
+async def test_single_flight_follower_cancelled():
+    single_flight = AsyncSingleFlight()
+    calls = []
+
+    async def _call():
+        calls.append(1)
+        await asyncio.sleep(0.1)
+        return "result"
+
+    leader = asyncio.create_task(single_flight.run("key", _call))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(single_flight.run("key", _call))
+    await asyncio.sleep(0)
+
+    # Cancelling a follower doesn't cancel the shared call
+    follower.cancel()
+
+    assert await leader == "result"
+    assert follower.cancelled()
+    assert len(calls) == 1
+
+
+@pytest.mark.public
+@pytest.mark.asyncio
+async def test_single_flight_exception():
+    single_flight = AsyncSingleFlight()
+
+    async def _call():
+        await asyncio.sleep(0.1)
+        raise ValueError("failed")
+
+    results = await asyncio.gather(
+        *[single_flight.run("key", _call) for _ in range(3)], return_exceptions=True
+    )
+
+    assert all(isinstance(r, ValueError) for r in results)
+    assert single_flight._calls == {}
+
+
+@pytest.mark.public
+@pytest.mark.asyncio
+@pytest.mark.parametrize("coalesce_requests, expected", [(True, 1), (False, 5)])
+async def test_coalesce_requests(
+    mock_api, use_mock_api, mock_api_url, coalesce_requests, expected
+):
+    async def _handler(request):
+        await asyncio.sleep(0.1)
+        return httpx.Response(200, json={"status": "active"})
+
+    mock_api.route("GET", "status", _handler)
+
+    async with use_mock_api(
+        AsyncClient(
+            api_base_url=mock_api_url,
+            access_token="token",
+            coalesce_requests=coalesce_requests,
+        )
+    ) as client:
+        responses = await asyncio.gather(*[client.get("status") for _ in range(5)])
+
+    assert len(mock_api.requests) == expected
+    assert all(r.status_code == 200 for r in responses)
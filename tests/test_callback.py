@@ -0,0 +1,84 @@
+import threading
+import time
+
+import httpx
+import pytest
+
+from sfapi_client import Client
+from sfapi_client.compute import Compute, SyncCallbackReceiver
+from sfapi_client.jobs import JobSqueue, JobState
+
+
+def _compute():
+    return Compute.model_construct(name="perlmutter", client=Client(access_token="x"))
+
+
+def _job(compute, callback):
+    job = JobSqueue(jobid="1", compute=compute, state=JobState.RUNNING)
+    job._callback = callback
+
+    return job
+
+
+@pytest.mark.public
+def test_callback_receiver():
+    with SyncCallbackReceiver() as receiver:
+        callback = receiver._register()
+
+        assert callback.url.startswith(receiver.url)
+        assert not callback.wait(0.1)
+
+        r = httpx.post(callback.url, json={"jobid": "1", "state": "COMPLETED"})
+
+        assert r.status_code == 200
+        assert callback.wait(1)
+        assert callback.payload == {"jobid": "1", "state": "COMPLETED"}
+
+        # Each callback is only used once
+        r = httpx.post(callback.url, json={})
+        assert r.status_code == 404
+
+
+@pytest.mark.public
+def test_complete_callback(mocker):
+    with SyncCallbackReceiver(fallback_interval=60) as receiver:
+        callback = receiver._register()
+        job = _job(_compute(), callback)
+
+        def _update(self, cached=None):
+            self.state = JobState.COMPLETED if callback.done else JobState.RUNNING
+
+        update = mocker.patch.object(
+            JobSqueue, "update", autospec=True, side_effect=_update
+        )
+
+        threading.Timer(0.5, httpx.post, args=(callback.url,)).start()
+
+        start = time.monotonic()
+        state = job.complete()
+
+        assert state == JobState.COMPLETED
+        assert time.monotonic() - start < 10
+        # Once before waiting for the callback and once after it arrived
+        assert update.call_count == 2
+
+
+@pytest.mark.public
+def test_complete_callback_fallback(mocker):
+    with SyncCallbackReceiver(fallback_interval=0.1) as receiver:
+        job = _job(_compute(), receiver._register())
+        job.compute.client._wait_interval = 0.1
+
+        def _update(self, cached=None):
+            if update.call_count >= 3:
+                self.state = JobState.COMPLETED
+
+        update = mocker.patch.object(
+            JobSqueue, "update", autospec=True, side_effect=_update
+        )
+
+        # The callback never arrives, so we fall back to polling
+        assert job.complete(timeout=10) == JobState.COMPLETED
+        assert update.call_count == 3
+        # The callback that never arrived is no longer registered
+        assert receiver._callbacks == {}
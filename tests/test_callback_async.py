@@ -0,0 +1,96 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from sfapi_client import AsyncClient
+from sfapi_client.compute import AsyncCompute, AsyncCallbackReceiver
+from sfapi_client.jobs import AsyncJobSqueue, JobState
+
+
+def _compute():
+    return AsyncCompute.model_construct(
+        name="perlmutter", client=AsyncClient(access_token="x")
+    )
+
+
+def _job(compute, callback):
+    job = AsyncJobSqueue(jobid="1", compute=compute, state=JobState.RUNNING)
+    job._callback = callback
+
+    return job
+
+
+async def _post(url, delay=0, **kwargs):
+    await asyncio.sleep(delay)
+    async with httpx.AsyncClient() as client:
+        return await client.post(url, **kwargs)
+
+
+@pytest.mark.public
+@pytest.mark.asyncio
+async def test_callback_receiver():
+    async with AsyncCallbackReceiver() as receiver:
+        callback = receiver._register()
+
+        assert callback.url.startswith(receiver.url)
+        assert not await callback.wait(0.1)
+
+        r = await _post(callback.url, json={"jobid": "1", "state": "COMPLETED"})
+
+        assert r.status_code == 200
+        assert await callback.wait(1)
+        assert callback.payload == {"jobid": "1", "state": "COMPLETED"}
+
+        # Each callback is only used once
+        r = await _post(callback.url, json={})
+        assert r.status_code == 404
+
+
+@pytest.mark.public
+@pytest.mark.asyncio
+async def test_complete_callback(mocker):
+    async with AsyncCallbackReceiver(fallback_interval=60) as receiver:
+        callback = receiver._register()
+        job = _job(_compute(), callback)
+
+        async def _update(self, cached=None):
+            self.state = JobState.COMPLETED if callback.done else JobState.RUNNING
+
+        update = mocker.patch.object(
+            AsyncJobSqueue, "update", autospec=True, side_effect=_update
+        )
+
+        post = asyncio.create_task(_post(callback.url, delay=0.5))
+
+        start = time.monotonic()
+        state = await job.complete()
+        await post
+
+        assert state == JobState.COMPLETED
+        assert time.monotonic() - start < 10
+        # Once before waiting for the callback and once after it arrived
+        assert update.call_count == 2
+
+
+@pytest.mark.public
+@pytest.mark.asyncio
+async def test_complete_callback_fallback(mocker):
+    async with AsyncCallbackReceiver(fallback_interval=0.1) as receiver:
+        job = _job(_compute(), receiver._register())
+        job.compute.client._wait_interval = 0.1
+
+        async def _update(self, cached=None):
+            if update.call_count >= 3:
+                self.state = JobState.COMPLETED
+
+        update = mocker.patch.object(
+            AsyncJobSqueue, "update", autospec=True, side_effect=_update
+        )
+
+        # The callback never arrives, so we fall back to polling
+        assert await job.complete(timeout=10) == JobState.COMPLETED
+        assert update.call_count == 3
+        # The callback that never arrived is no longer registered
+        assert receiver._callbacks == {}
@@ -1,6 +1,15 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
 import pytest
 
 from sfapi_client import SfApiError, Client
+from sfapi_client.client import RateLimit
+from sfapi_client.compute import Compute
+from sfapi_client.paths import RemotePath
 
 
 @pytest.mark.public
@@ -21,3 +30,236 @@ def test_access_token(api_base_url, access_token, test_machine, test_username):
     with Client(api_base_url=api_base_url, access_token=access_token) as client:
         machine = client.compute(test_machine)
         machine.jobs(user=test_username)
+
+
+@pytest.mark.public
+def test_transport_defaults(mock_api_url):
+    with Client(api_base_url=mock_api_url, access_token="token") as client:
+        assert client._transport_kwargs() == {"timeout": 10.0, "http2": False}
+
+        http_client = client._http_client()
+        assert http_client.timeout == httpx.Timeout(10.0)
+
+
+@pytest.mark.public
+def test_transport_options(mock_api_url):
+    timeout = httpx.Timeout(5.0, connect=2.0)
+    limits = httpx.Limits(max_connections=3, max_keepalive_connections=1)
+
+    with Client(
+        api_base_url=mock_api_url, access_token="token", timeout=timeout, limits=limits
+    ) as client:
+        assert client._transport_kwargs() == {
+            "timeout": timeout,
+            "http2": False,
+            "limits": limits,
+        }
+
+        # The options reach the httpx client that is built
+        http_client = client._http_client()
+        assert http_client.timeout == timeout
+        pool = http_client._transport._pool
+        assert pool._max_connections == 3
+        assert pool._max_keepalive_connections == 1
+
+
+@pytest.mark.public
+def test_transport_http2(mocker, mock_api_url):
+    # The http2 extra may not be installed, so the httpx client isn't built
+    http_client = mocker.patch("httpx.Client")
+
+    with Client(api_base_url=mock_api_url, access_token="token", http2=True) as client:
+        assert client._transport_kwargs()["http2"] is True
+
+        client._http_client()
+        assert http_client.call_args.kwargs["http2"] is True
+
+
+@pytest.mark.public
+def test_rate_limits(mock_api, use_mock_api, mock_api_url):
+    times = []
+
+    def _status(request):
+        times.append(time.monotonic())
+        return httpx.Response(200, json={"status": "active"})
+
+    mock_api.route("GET", "status", _status)
+
+    rate_limits = {"status": RateLimit(rate=10, burst=1)}
+    with use_mock_api(
+        Client(api_base_url=mock_api_url, access_token="token", rate_limits=rate_limits)
+    ) as client:
+        for _ in range(4):
+            client.get("status")
+
+        stats = client.rate_limiter.stats["status"]
+        assert stats.requests == 4
+        assert stats.max_wait > 0
+
+    # After the burst the requests are spaced out by the rate
+    gaps = [b - a for a, b in zip(times, times[1:])]
+    assert len(gaps) == 3
+    assert all(gap >= 0.08 for gap in gaps)
+
+
+@pytest.mark.public
+def test_rate_limits_max_in_flight(mock_api, use_mock_api, mock_api_url):
+    lock = threading.Lock()
+    in_flight = [0]
+    max_in_flight = [0]
+
+    def _status(request):
+        with lock:
+            in_flight[0] += 1
+            max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+        time.sleep(0.05)
+        with lock:
+            in_flight[0] -= 1
+
+        return httpx.Response(200, json={"status": "active"})
+
+    mock_api.route("GET", "status", _status)
+
+    rate_limits = {"status": RateLimit(max_in_flight=2)}
+    with use_mock_api(
+        Client(api_base_url=mock_api_url, access_token="token", rate_limits=rate_limits)
+    ) as client:
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            list(executor.map(lambda _: client.get("status"), range(6)))
+
+    assert max_in_flight[0] == 2
+
+
+@pytest.mark.public
+def test_json_loads(mock_api, use_mock_api, mock_api_url, test_machine):
+    bodies = []
+
+    def _loads(body):
+        bodies.append(body)
+        return json.loads(body)
+
+    with use_mock_api(
+        Client(api_base_url=mock_api_url, access_token="token", json_loads=_loads)
+    ) as client:
+        compute = client.compute(test_machine)
+
+    assert compute.name == test_machine.value
+    # The status response was decoded by the custom function
+    [body] = bodies
+    assert json.loads(body)["name"] == test_machine.value
+
+
+ETAG = '"v1"'
+LAST_MODIFIED = "Wed, 01 May 2024 00:00:00 GMT"
+
+
+def _route_conditional(mock_api, payloads):
+    """
+    Respond to the paths with an ETag and Last-Modified, and 304 if the
+    request has a matching If-None-Match.
+    """
+    for path, payload in payloads.items():
+
+        def _handler(request, payload=payload):
+            if request.headers.get("If-None-Match") == ETAG:
+                return httpx.Response(304)
+
+            return httpx.Response(
+                200,
+                json=payload,
+                headers={"ETag": ETAG, "Last-Modified": LAST_MODIFIED},
+            )
+
+        mock_api.route("GET", path, _handler)
+
+
+@pytest.mark.public
+def test_conditional_requests_not_modified(mock_api, use_mock_api, mock_api_url):
+    _route_conditional(mock_api, {"status/perlmutter": {"name": "perlmutter"}})
+
+    with use_mock_api(
+        Client(
+            api_base_url=mock_api_url,
+            access_token="token",
+            conditional_requests=True,
+        )
+    ) as client:
+        first = client.get("status/perlmutter")
+        second = client.get("status/perlmutter")
+
+    assert "If-None-Match" not in mock_api.requests[0].headers
+    assert mock_api.requests[1].headers["If-None-Match"] == ETAG
+    assert mock_api.requests[1].headers["If-Modified-Since"] == LAST_MODIFIED
+    # The 304 returns the stored response
+    assert second is first
+    assert second.json() == {"name": "perlmutter"}
+
+
+@pytest.mark.public
+def test_conditional_requests_path_update(mocker, mock_api, use_mock_api, mock_api_url):
+    entry = {
+        "perms": "-rw-r--r--",
+        "hardlinks": 1,
+        "user": "user",
+        "group": "group",
+        "size": 10,
+        "date": "2024-01-01T00:00:00",
+        "name": "/tmp/file",
+    }
+    _route_conditional(
+        mock_api,
+        {"utilities/ls/perlmutter//tmp/file": {"status": "OK", "entries": [entry]}},
+    )
+
+    with use_mock_api(
+        Client(
+            api_base_url=mock_api_url,
+            access_token="token",
+            conditional_requests=True,
+        )
+    ) as client:
+        compute = Compute.model_construct(name="perlmutter", client=client)
+        path = RemotePath(path="/tmp/file", compute=compute)
+        _parse_ls = mocker.spy(RemotePath, "_parse_ls")
+
+        path.update()
+        path.update()
+
+    assert len(mock_api.requests) == 2
+    assert mock_api.requests[1].headers["If-None-Match"] == ETAG
+    # The unchanged listing isn't parsed again
+    assert _parse_ls.call_count == 1
+    assert path.size == 10
+
+
+@pytest.mark.public
+def test_conditional_requests_group_update(
+    mocker, mock_api, use_mock_api, mock_api_url
+):
+    _route_conditional(
+        mock_api,
+        {
+            "account/groups/group": {
+                "gid": 1,
+                "name": "group",
+                "users": [{"uid": 1, "name": "user"}],
+            }
+        },
+    )
+
+    with use_mock_api(
+        Client(
+            api_base_url=mock_api_url,
+            access_token="token",
+            conditional_requests=True,
+        )
+    ) as client:
+        group = client.group("group")
+        _json = mocker.spy(client, "_json")
+
+        group.update()
+
+    assert mock_api.requests[1].headers["If-None-Match"] == ETAG
+    # The unchanged group isn't decoded or validated again
+    assert _json.call_count == 0
+    assert [m.name for m in group.members] == ["user"]
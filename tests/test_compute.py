@@ -1,10 +1,89 @@
 import time
+from concurrent.futures import ThreadPoolExecutor
+import json
 from pathlib import Path
+from urllib.parse import parse_qs
 
-from sfapi_client.jobs import JobState
+import httpx
+import pytest
+
+from sfapi_client import Client, SfApiError, SubmitJobsError
+from sfapi_client.jobs import JobState, JobCommand, JobTable, JobSacct
 from sfapi_client.compute import CommandTask, TaskStatus
 
 
+def _route_submissions(mock_api, machine):
+    # Scripts containing "fail" are rejected, the others are given a task that
+    # has already completed with a jobid.
+    def _submit(request):
+        script = parse_qs(request.content.decode())["job"][0]
+        if "fail" in script:
+            return httpx.Response(
+                200, json={"task_id": "", "status": "ERROR", "error": "rejected"}
+            )
+
+        task_id = str(len(mock_api.requests))
+        return httpx.Response(
+            200, json={"task_id": task_id, "status": "OK", "error": None}
+        )
+
+    def _task(task_id):
+        return {
+            "id": task_id,
+            "status": "completed",
+            "result": json.dumps({"status": "ok", "jobid": f"job-{task_id}"}),
+        }
+
+    mock_api.route("POST", f"compute/jobs/{machine}", _submit)
+    for i in range(1, 10):
+        mock_api.route(
+            "GET", f"tasks/{i}", lambda r, i=i: httpx.Response(200, json=_task(str(i)))
+        )
+
+
+def _route_commands(mock_api, machine):
+    # Each command is run as a task that is new when first fetched, then
+    # completed with the command as its output.
+    commands = {}
+    fetches = {}
+
+    def _run(request):
+        task_id = str(len(commands) + 1)
+        commands[task_id] = parse_qs(request.content.decode())["executable"][0]
+
+        return httpx.Response(200, json={"task_id": task_id, "status": "OK"})
+
+    def _task(request):
+        task_id = request.url.path.rsplit("/", 1)[-1]
+        fetches[task_id] = fetches.get(task_id, 0) + 1
+        if fetches[task_id] == 1:
+            return httpx.Response(
+                200, json={"id": task_id, "status": "new", "result": None}
+            )
+
+        result = {"status": "ok", "output": commands[task_id], "error": None}
+        return httpx.Response(
+            200,
+            json={"id": task_id, "status": "completed", "result": json.dumps(result)},
+        )
+
+    mock_api.route("POST", f"utilities/command/{machine}", _run)
+    for i in range(1, 10):
+        mock_api.route("GET", f"tasks/{i}", _task)
+
+    return fetches
+
+
+def _jobid_chunks(mock_api):
+    # The jobids asked for by each of the job state requests
+    return [
+        kwarg[len("jobid=") :].split(",")
+        for request in mock_api.requests
+        for kwarg in request.url.params.get_list("kwargs")
+        if kwarg.startswith("jobid=")
+    ]
+
+
 def _periodic_command():
     return "bash -lc 'i=0; while [ $i -lt 30 ]; do echo tick-$i; i=$((i+1)); sleep 1; done'"
 
@@ -49,12 +128,281 @@ def test_job(authenticated_client, test_job_path, test_machine):
         assert job.jobid == job_looked_up.jobid
 
 
+def test_watch(authenticated_client, test_job_path, test_machine):
+    with authenticated_client as client:
+        machine = client.compute(test_machine)
+
+        job = machine.submit_job(test_job_path)
+        events = list(machine.watch([job.jobid], interval=2))
+
+        assert events[0].old_state is None
+        assert events[-1].job.jobid == job.jobid
+        assert events[-1].new_state == JobState.COMPLETED
+
+
+@pytest.mark.public
+def test_watch_unknown_job(mocker, mock_api_client, test_machine):
+    _fetch_jobs = mocker.patch("sfapi_client._monitor._fetch_jobs")
+
+    # Job 2 is in neither squeue or sacct
+    def _jobs(job_type, compute, jobids, **kwargs):
+        return [
+            JobSacct(jobid=i, compute=compute, state=JobState.COMPLETED)
+            for i in jobids
+            if i != "2"
+        ]
+
+    _fetch_jobs.side_effect = _jobs
+
+    with mock_api_client as client:
+        machine = client.compute(test_machine)
+
+        with pytest.raises(SfApiError, match="2"):
+            list(machine.watch([1, 2]))
+
+
+@pytest.mark.public
+def test_watch_timeout(mocker, mock_api_client, test_machine):
+    _fetch_jobs = mocker.patch("sfapi_client._monitor._fetch_jobs")
+
+    def _jobs(job_type, compute, jobids, **kwargs):
+        return [
+            JobSacct(jobid=i, compute=compute, state=JobState.RUNNING) for i in jobids
+        ]
+
+    _fetch_jobs.side_effect = _jobs
+
+    with mock_api_client as client:
+        machine = client.compute(test_machine)
+
+        events = []
+        with pytest.raises(TimeoutError):
+            for event in machine.watch([1], interval=0.05, timeout=0.2):
+                events.append(event)
+
+        assert [e.new_state for e in events] == [JobState.RUNNING]
+        assert _fetch_jobs.call_count > 1
+
+
+@pytest.mark.public
+def test_submit_jobs_partial_failure(mock_api, mock_api_client, test_machine):
+    _route_submissions(mock_api, test_machine)
+    scripts = ["#!/bin/bash\necho ok", "#!/bin/bash\necho fail", "#!/bin/bash\necho ok"]
+
+    with mock_api_client as client:
+        machine = client.compute(test_machine)
+
+        with pytest.raises(SubmitJobsError) as exc_info:
+            machine.submit_jobs(scripts, concurrency=1)
+
+    ex = exc_info.value
+    [job, failed, skipped] = ex.jobs
+    assert job.jobid == f"job-{ex.task_ids[0]}"
+    assert failed is None and skipped is None
+    assert ex.task_ids[1:] == [None, None]
+    assert ex.errors[0] is None
+    assert ex.errors[1].message == "rejected"
+    assert "earlier submission failed" in ex.errors[2].message
+
+    # No more jobs are posted after the failure
+    posts = [r for r in mock_api.requests if r.method == "POST"]
+    assert len(posts) == 2
+
+
+@pytest.mark.public
+def test_submit_job_failure(mock_api, mock_api_client, test_machine):
+    _route_submissions(mock_api, test_machine)
+
+    with mock_api_client as client:
+        machine = client.compute(test_machine)
+
+        with pytest.raises(SfApiError) as exc_info:
+            machine.submit_job("#!/bin/bash\necho fail")
+
+    assert not isinstance(exc_info.value, SubmitJobsError)
+    assert exc_info.value.message == "rejected"
+    # The batch error isn't chained onto the original one
+    assert exc_info.value.__cause__ is None
+    assert exc_info.value.__suppress_context__
+
+
+@pytest.mark.public
+def test_submit_job_callback_email(mock_api, mock_api_client, test_machine):
+    _route_submissions(mock_api, test_machine)
+
+    with mock_api_client as client:
+        machine = client.compute(test_machine)
+        job = machine.submit_job(
+            "#!/bin/bash\necho ok",
+            callback_email="user@example.com",
+            callback_timeout=60,
+        )
+
+    assert job.jobid is not None
+    [post] = [r for r in mock_api.requests if r.method == "POST"]
+    data = parse_qs(post.content.decode())
+    assert data["callbackEmail"] == ["user@example.com"]
+    assert data["callbackTimeout"] == ["60"]
+    assert "callbackUrl" not in data
+
+
+@pytest.mark.public
+def test_cancel_jobs_unknown_job(mocker, mock_api, mock_api_client, test_machine):
+    _fetch_jobs = mocker.patch("sfapi_client._monitor._fetch_jobs")
+
+    # Job 2 is not in sacct
+    def _jobs(job_type, compute, jobids, **kwargs):
+        return [
+            JobSacct(jobid=i, compute=compute, state=JobState.CANCELLED)
+            for i in jobids
+            if i != "2"
+        ]
+
+    _fetch_jobs.side_effect = _jobs
+    for i in [1, 2]:
+        mock_api.route(
+            "DELETE", f"compute/jobs/{test_machine}/{i}", lambda r: httpx.Response(200)
+        )
+
+    with mock_api_client as client:
+        machine = client.compute(test_machine)
+
+        with pytest.raises(SfApiError, match="2"):
+            machine.cancel_jobs([1, 2], wait=True)
+
+
+@pytest.mark.public
+def test_cancel_jobs_timeout(mocker, mock_api, mock_api_client, test_machine):
+    _fetch_jobs = mocker.patch("sfapi_client._monitor._fetch_jobs")
+
+    def _jobs(job_type, compute, jobids, **kwargs):
+        return [
+            JobSacct(jobid=i, compute=compute, state=JobState.RUNNING) for i in jobids
+        ]
+
+    _fetch_jobs.side_effect = _jobs
+    mock_api.route(
+        "DELETE", f"compute/jobs/{test_machine}/1", lambda r: httpx.Response(200)
+    )
+
+    with mock_api_client as client:
+        machine = client.compute(test_machine)
+
+        with pytest.raises(TimeoutError):
+            machine.cancel_jobs([1], wait=True, timeout=0.1)
+
+        assert _fetch_jobs.call_count > 1
+
+
 def test_fetch_jobs(authenticated_client, test_machine, test_username):
     with authenticated_client as client:
         machine = client.compute(test_machine)
         machine.jobs(user=test_username)
 
 
+@pytest.mark.public
+def test_fetch_jobs_chunked(mock_api, use_mock_api, mock_api_url, test_machine):
+    mock_api.route_jobs(test_machine, sacct={str(i): "COMPLETED" for i in range(1, 6)})
+
+    with use_mock_api(
+        Client(api_base_url=mock_api_url, access_token="token", jobid_chunk_size=2)
+    ) as client:
+        machine = client.compute(test_machine)
+        jobs = machine.jobs(jobids=[1, 2, 3, 4, 5], command=JobCommand.sacct)
+
+    assert sorted(job.jobid for job in jobs) == ["1", "2", "3", "4", "5"]
+
+    # Three chunks of at most two jobids
+    chunks = _jobid_chunks(mock_api)
+    assert sorted(len(chunk) for chunk in chunks) == [1, 2, 2]
+    jobids = sorted(jobid for chunk in chunks for jobid in chunk)
+    assert jobids == ["1", "2", "3", "4", "5"]
+
+
+def test_fetch_jobs_fields(authenticated_client, test_machine, test_username):
+    with authenticated_client as client:
+        machine = client.compute(test_machine)
+        jobs = machine.jobs(
+            user=test_username, command=JobCommand.sacct, fields=["user"]
+        )
+
+        for job in jobs:
+            assert job.jobid is not None
+            assert job.state is not None
+            assert job.user == test_username
+            # Not requested
+            assert job.account is None
+
+
+def test_fetch_jobs_table(authenticated_client, test_machine, test_username):
+    with authenticated_client as client:
+        machine = client.compute(test_machine)
+        table = machine.jobs(user=test_username, command=JobCommand.sacct, table=True)
+
+        assert isinstance(table, JobTable)
+        assert len(table["jobid"]) == len(table)
+        for state in table["state"]:
+            assert state in JobState.__members__
+
+
+@pytest.mark.public
+def test_job_table():
+    table = JobTable._from_output(
+        [
+            {"jobid": "1", "state": "COMPLETED"},
+            {"jobid": "2", "state": "CANCELLED by 1234", "user": "bob"},
+        ]
+    )
+
+    assert len(table) == 2
+    assert table.columns == ["jobid", "state", "user"]
+    assert table["state"] == ["COMPLETED", "CANCELLED"]
+    assert table["user"] == [None, "bob"]
+
+
+@pytest.mark.public
+def test_job_table_converters():
+    table = JobTable._from_output(
+        [
+            {
+                "jobid": "1",
+                "elapsed": "1-00:00:10",
+                "maxrss": "2K",
+                "alloctres": "cpu=2",
+            },
+            {"jobid": "2", "elapsed": "00:10", "maxrss": None, "alloctres": "mem=1G"},
+        ]
+    )
+
+    assert table.durations("elapsed") == [86410, 10]
+    assert table.sizes("maxrss") == [2048, None]
+    assert table.tres("alloctres") == [{"cpu": 2}, {"mem": 1024**3}]
+
+
+@pytest.mark.public
+def test_job_table_to_numpy():
+    np = pytest.importorskip("numpy")
+
+    table = JobTable._from_output(
+        [
+            {"jobid": "1", "elapsedraw": "10", "ncpus": "4", "elapsed": "00:10"},
+            {"jobid": "2", "elapsedraw": None, "ncpus": "8", "elapsed": "00:20"},
+        ]
+    )
+
+    arrays = table.to_numpy()
+    assert arrays["elapsedraw"].dtype == np.float64
+    assert arrays["elapsedraw"][0] == 10
+    assert np.isnan(arrays["elapsedraw"][1])
+    assert arrays["ncpus"].tolist() == [4, 8]
+    assert arrays["jobid"].dtype == object
+    assert arrays["elapsed"].tolist() == ["00:10", "00:20"]
+
+    arrays = table.to_numpy(numeric=["jobid"])
+    assert arrays["jobid"].dtype == np.float64
+    assert arrays["ncpus"].dtype == object
+
+
 def test_list_dir_contents(authenticated_client, test_machine, test_job_path):
     with authenticated_client as client:
         machine = client.compute(test_machine)
@@ -151,6 +499,27 @@ def test_run_task_wait(authenticated_client, test_machine):
         assert task.result.error in ("", None)
 
 
+@pytest.mark.public
+def test_run_concurrent(mock_api, mock_api_client, test_machine):
+    fetches = _route_commands(mock_api, test_machine)
+
+    num_tasks = 5
+    with mock_api_client as client:
+        machine = client.compute(test_machine)
+
+        with ThreadPoolExecutor(max_workers=num_tasks) as executor:
+            outputs = list(
+                executor.map(lambda i: machine.run(f"echo hello-{i}"), range(num_tasks))
+            )
+
+    for i, output in enumerate(outputs):
+        assert f"hello-{i}" in output
+
+    # Only the outstanding tasks are fetched, each until it completes
+    assert fetches == {str(i): 2 for i in range(1, num_tasks + 1)}
+    assert not any(r.url.path.endswith("/tasks") for r in mock_api.requests)
+
+
 def test_run_task_update(authenticated_client, test_machine):
     with authenticated_client as client:
         machine = client.compute(test_machine)
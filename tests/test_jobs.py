@@ -1,10 +1,41 @@
+import httpx
 import pytest
+import threading
 from concurrent.futures import ThreadPoolExecutor
 import time
+from datetime import datetime
 
+from sfapi_client import Client, SfApiError
 from sfapi_client.jobs import JobState
 from sfapi_client.compute import Compute
-from sfapi_client.jobs import JobSqueue
+from sfapi_client.jobs import JobSqueue, JobSacct
+from sfapi_client.jobs import AdaptivePolling, PollingStrategy
+from sfapi_client._jobs import STATE_FIELDS
+
+
+@pytest.mark.public
+def test_sacct_typed_fields():
+    job = JobSacct(
+        jobid="1",
+        state="COMPLETED",
+        elapsed="1-02:03:04",
+        cputimeraw="7200",
+        timelimit="UNLIMITED",
+        maxrss="1024K",
+        reqmem="4Gn",
+        start="2024-05-01T10:00:00",
+        end="Unknown",
+        alloctres="cpu=4,mem=16G,gres/gpu=1",
+    )
+
+    assert job.elapsed_seconds == 93784
+    assert job.cpu_time_seconds == 7200
+    assert job.time_limit_seconds is None
+    assert job.max_rss_bytes == 1024 * 1024
+    assert job.req_mem_bytes == 4 * 1024**3
+    assert job.start_time == datetime(2024, 5, 1, 10)
+    assert job.end_time is None
+    assert job.alloc_tres_dict == {"cpu": 4, "mem": 16 * 1024**3, "gres/gpu": 1}
 
 
 def test_submit(authenticated_client, test_job_path, test_machine):
@@ -41,6 +72,18 @@ def test_submit_with_args(
             machine.run(["rm", "-f", str(remote_script)])
 
 
+def test_submit_jobs(authenticated_client, test_job_path, test_machine):
+    with authenticated_client as client:
+        machine = client.compute(test_machine)
+        jobs = machine.submit_jobs([test_job_path] * 3)
+
+        assert len(jobs) == 3
+        assert len({job.jobid for job in jobs}) == 3
+
+        for job in jobs:
+            assert job.complete() == JobState.COMPLETED
+
+
 def test_cancel(authenticated_client, test_job_path, test_machine):
     with authenticated_client as client:
         machine = client.compute(test_machine)
@@ -56,6 +99,18 @@ def test_cancel_wait_for_it(authenticated_client, test_job_path, test_machine):
         job.cancel(wait=True)
 
 
+def test_cancel_jobs(authenticated_client, test_job_path, test_machine):
+    with authenticated_client as client:
+        machine = client.compute(test_machine)
+        jobs = machine.submit_jobs([test_job_path] * 3)
+
+        cancelled = machine.cancel_jobs([job.jobid for job in jobs], wait=True)
+
+        assert [job.jobid for job in cancelled] == [job.jobid for job in jobs]
+        for job in cancelled:
+            assert job.state == JobState.CANCELLED
+
+
 def test_running(authenticated_client, test_job_path, test_machine):
     with authenticated_client as client:
         machine = client.compute(test_machine)
@@ -66,6 +121,72 @@ def test_running(authenticated_client, test_job_path, test_machine):
         assert state == JobState.RUNNING
 
 
+def test_complete_adaptive_polling(authenticated_client, test_job_path, test_machine):
+    with authenticated_client as client:
+        machine = client.compute(test_machine)
+        job = machine.submit_job(test_job_path)
+
+        state = job.complete(polling=AdaptivePolling(initial=2, max_interval=10))
+
+        assert state == JobState.COMPLETED
+
+
+class _RecordingPolling(PollingStrategy):
+    # Records the state and poll count each interval is asked for with
+    def __init__(self):
+        self.calls = []
+
+    def interval(self, job, polls):
+        self.calls.append((job.state, polls))
+        return 0
+
+
+@pytest.mark.public
+def test_complete_polls_reset_on_state_change(mock_api, mock_api_client, test_machine):
+    states = ["PENDING", "PENDING", "PENDING", "RUNNING", "RUNNING", "COMPLETED"]
+    squeue = {"1": states[0]}
+    jobs = None
+
+    def _jobs(request):
+        squeue["1"] = states.pop(0)
+        return jobs(request)
+
+    mock_api.route_jobs(test_machine, squeue=squeue)
+    jobs = mock_api.handlers[("GET", f"compute/jobs/{test_machine}")]
+    mock_api.route("GET", f"compute/jobs/{test_machine}", _jobs)
+
+    polling = _RecordingPolling()
+    with mock_api_client as client:
+        machine = client.compute(test_machine)
+        job = JobSqueue(jobid="1", compute=machine, state=JobState.PENDING)
+
+        assert job.complete(polling=polling) == JobState.COMPLETED
+
+    assert polling.calls == [
+        (JobState.PENDING, 1),
+        (JobState.PENDING, 2),
+        (JobState.PENDING, 3),
+        (JobState.RUNNING, 1),
+        (JobState.RUNNING, 2),
+    ]
+
+
+def test_update_cached(authenticated_client, test_job_path, test_machine):
+    with authenticated_client as client:
+        machine = client.compute(test_machine)
+        job = machine.submit_job(test_job_path)
+
+        job.update(cached=True)
+        assert job.cached
+        fetched_at = job.fetched_at
+
+        job.update()
+        assert not job.cached
+        assert job.fetched_at > fetched_at
+
+        job.cancel()
+
+
 def test_complete_timeout(authenticated_client, test_job_path, test_machine):
     with authenticated_client as client:
         machine = client.compute(test_machine)
@@ -165,3 +286,327 @@ def test_job_monitor_multiple_threads(
 
         for j in jobs:
             assert j.state == JobState.COMPLETED
+
+
+def _hold_squeue(mock_api, machine, squeue, sacct=None):
+    # Hold the first squeue request until released, so other threads can join
+    # the batch collecting while it is in flight.
+    mock_api.route_jobs(machine, squeue=squeue, sacct=sacct)
+    jobs = mock_api.handlers[("GET", f"compute/jobs/{machine}")]
+    in_flight = threading.Event()
+    release = threading.Event()
+
+    def _handler(request):
+        if request.url.params.get("sacct") != "true" and not in_flight.is_set():
+            in_flight.set()
+            assert release.wait(10)
+
+        return jobs(request)
+
+    mock_api.route("GET", f"compute/jobs/{machine}", _handler)
+
+    return in_flight, release
+
+
+def _squeue_requests(mock_api):
+    return [r for r in mock_api.requests if r.url.params.get("sacct") == "false"]
+
+
+def _wait_for_batch(monitor, job_type, size):
+    deadline = time.monotonic() + 10
+    while True:
+        with monitor._states[job_type].condition:
+            batch = monitor._states[job_type].pending
+            if batch is not None and len(batch.jobids) == size:
+                return
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+@pytest.mark.public
+def test_job_monitor_batches_threads(mock_api, mock_api_client, test_machine):
+    num_jobs = 10
+    squeue = {str(i): "RUNNING" for i in range(num_jobs)}
+    in_flight, release = _hold_squeue(mock_api, test_machine, squeue)
+
+    with mock_api_client as client:
+        machine = client.compute(test_machine)
+        monitor = machine._monitor
+
+        def _fetch(jobid):
+            return monitor.fetch_jobs(job_type=JobSqueue, jobids=[jobid])
+
+        with ThreadPoolExecutor(max_workers=num_jobs) as executor:
+            first = executor.submit(_fetch, 0)
+            assert in_flight.wait(10)
+
+            # The other threads wait for the first fetch, then are batched
+            others = [executor.submit(_fetch, i) for i in range(1, num_jobs)]
+            _wait_for_batch(monitor, JobSqueue, num_jobs - 1)
+            release.set()
+
+            results = [first.result()] + [f.result() for f in others]
+
+    assert [[j.jobid for j in jobs] for jobs in results] == [
+        [str(i)] for i in range(num_jobs)
+    ]
+
+    requests = _squeue_requests(mock_api)
+    assert len(requests) == 2
+    [jobids] = [
+        k for k in requests[1].url.params.get_list("kwargs") if k.startswith("jobid=")
+    ]
+    assert sorted(jobids[len("jobid=") :].split(","), key=int) == [
+        str(i) for i in range(1, num_jobs)
+    ]
+
+
+@pytest.mark.public
+def test_job_monitor_job_types_separate(mock_api, mock_api_client, test_machine):
+    in_flight, release = _hold_squeue(
+        mock_api, test_machine, squeue={"1": "RUNNING"}, sacct={"1": "COMPLETED"}
+    )
+
+    with mock_api_client as client:
+        machine = client.compute(test_machine)
+        monitor = machine._monitor
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            squeue_future = executor.submit(
+                monitor.fetch_jobs, job_type=JobSqueue, jobids=[1]
+            )
+            assert in_flight.wait(10)
+
+            # sacct isn't held up by the squeue fetch in progress
+            try:
+                [sacct_job] = monitor.fetch_jobs(job_type=JobSacct, jobids=[1])
+            finally:
+                release.set()
+
+            [squeue_job] = squeue_future.result()
+
+    assert isinstance(sacct_job, JobSacct)
+    assert sacct_job.state == JobState.COMPLETED
+    assert isinstance(squeue_job, JobSqueue)
+    assert squeue_job.state == JobState.RUNNING
+
+
+@pytest.mark.public
+def test_job_monitor_error_reaches_batch(mock_api, mock_api_client, test_machine):
+    num_jobs = 5
+    squeue = {str(i): "RUNNING" for i in range(num_jobs)}
+    in_flight, release = _hold_squeue(mock_api, test_machine, squeue)
+    held = mock_api.handlers[("GET", f"compute/jobs/{test_machine}")]
+
+    # Only the first request succeeds
+    def _handler(request):
+        if in_flight.is_set() and release.is_set():
+            return httpx.Response(400)
+
+        return held(request)
+
+    mock_api.route("GET", f"compute/jobs/{test_machine}", _handler)
+
+    with mock_api_client as client:
+        machine = client.compute(test_machine)
+        monitor = machine._monitor
+
+        def _fetch(jobid):
+            return monitor.fetch_jobs(job_type=JobSqueue, jobids=[jobid])
+
+        with ThreadPoolExecutor(max_workers=num_jobs) as executor:
+            first = executor.submit(_fetch, 0)
+            assert in_flight.wait(10)
+
+            others = [executor.submit(_fetch, i) for i in range(1, num_jobs)]
+            _wait_for_batch(monitor, JobSqueue, num_jobs - 1)
+            release.set()
+
+            assert [j.jobid for j in first.result()] == ["0"]
+
+            # Every thread in the failed batch gets the error, the request
+            # isn't retried by each of them.
+            for f in others:
+                assert isinstance(f.exception(), httpx.HTTPStatusError)
+
+    assert len(_squeue_requests(mock_api)) == 2
+
+
+def test_job_watcher(
+    api_base_url, token_url, client_id, client_secret, mocker, test_machine
+):
+    with Client(
+        api_base_url=api_base_url,
+        token_url=token_url,
+        client_id=client_id,
+        secret=client_secret,
+        wait_interval=1,
+        watch_jobs=True,
+    ) as client:
+        _fetch_jobs = mocker.patch("sfapi_client._monitor._fetch_jobs")
+        machine = client.compute(test_machine)
+
+        num_jobs = 10
+        jobs = [
+            JobSqueue(jobid=str(i), compute=machine, state=JobState.RUNNING)
+            for i in range(0, num_jobs)
+        ]
+
+        def _jobs(*arg, **kwargs):
+            time.sleep(1)
+
+            return [
+                JobSqueue(jobid=i, compute=machine, state=JobState.COMPLETED)
+                for i in kwargs["jobids"]
+            ]
+
+        _fetch_jobs.side_effect = _jobs
+
+        with ThreadPoolExecutor(max_workers=num_jobs) as executor:
+            futures = [executor.submit(j.complete) for j in jobs]
+
+        assert [f.result() for f in futures] == [JobState.COMPLETED] * num_jobs
+
+        # One thread polls for all the others
+        assert _fetch_jobs.call_count < num_jobs
+
+
+@pytest.mark.public
+@pytest.mark.parametrize("watch_jobs_thread", [False, True])
+def test_job_watcher_unknown_job(
+    mock_api, use_mock_api, mock_api_url, test_machine, watch_jobs_thread
+):
+    mock_api.route_jobs(test_machine, squeue={"1": "RUNNING"}, sacct={})
+
+    with use_mock_api(
+        Client(
+            api_base_url=mock_api_url,
+            access_token="token",
+            wait_interval=0,
+            watch_jobs=True,
+            watch_jobs_thread=watch_jobs_thread,
+        )
+    ) as client:
+        machine = client.compute(test_machine)
+        job = JobSqueue(jobid="99", compute=machine, state=JobState.RUNNING)
+
+        # The job is in neither squeue or sacct
+        with pytest.raises(SfApiError, match="Job not found: 99"):
+            job.complete(timeout=10)
+
+
+def test_job_watcher_thread(
+    api_base_url, token_url, client_id, client_secret, mocker, test_machine
+):
+    with Client(
+        api_base_url=api_base_url,
+        token_url=token_url,
+        client_id=client_id,
+        secret=client_secret,
+        wait_interval=1,
+        watch_jobs=True,
+        watch_jobs_thread=True,
+    ) as client:
+        _fetch_jobs = mocker.patch("sfapi_client._monitor._fetch_jobs")
+        machine = client.compute(test_machine)
+
+        num_jobs = 10
+        jobs = [
+            JobSqueue(jobid=str(i), compute=machine, state=JobState.RUNNING)
+            for i in range(0, num_jobs)
+        ]
+
+        def _jobs(*arg, **kwargs):
+            time.sleep(1)
+
+            return [
+                JobSqueue(jobid=i, compute=machine, state=JobState.COMPLETED)
+                for i in kwargs["jobids"]
+            ]
+
+        _fetch_jobs.side_effect = _jobs
+
+        with ThreadPoolExecutor(max_workers=num_jobs) as executor:
+            futures = [executor.submit(j.complete) for j in jobs]
+
+        assert [f.result() for f in futures] == [JobState.COMPLETED] * num_jobs
+
+        # The background thread polls for all the waiting threads
+        assert _fetch_jobs.call_count < num_jobs
+
+
+def test_job_monitor_sacct_fallback(mocker, authenticated_client, test_machine):
+    with authenticated_client as client:
+        _fetch_jobs = mocker.patch("sfapi_client._monitor._fetch_jobs")
+        machine = client.compute(test_machine)
+
+        num_jobs = 10
+        jobs = [
+            JobSqueue(jobid=str(i), compute=machine, state=JobState.RUNNING)
+            for i in range(0, num_jobs)
+        ]
+
+        # The jobs have all left the queue
+        def _jobs(job_type, compute, jobids, **kwargs):
+            time.sleep(1)
+
+            if job_type is JobSqueue:
+                return []
+
+            return [
+                JobSacct(jobid=i, compute=machine, state=JobState.COMPLETED)
+                for i in jobids
+            ]
+
+        _fetch_jobs.side_effect = _jobs
+
+        with ThreadPoolExecutor(max_workers=num_jobs) as executor:
+            futures = [executor.submit(j.update) for j in jobs]
+
+        for f in futures:
+            assert f.exception() is None
+
+        assert [j.state for j in jobs] == [JobState.COMPLETED] * num_jobs
+
+        # The sacct requests should be batched in the same way as the squeue ones
+        sacct_calls = [
+            kwargs
+            for _, kwargs in _fetch_jobs.call_args_list
+            if kwargs["job_type"] is JobSacct
+        ]
+        assert len(sacct_calls) < num_jobs
+        assert all(kwargs["fields"] == STATE_FIELDS for kwargs in sacct_calls)
+
+
+@pytest.mark.public
+def test_job_monitor_sacct_fallback_fields(mocker, mock_api_client, test_machine):
+    _fetch_jobs = mocker.patch("sfapi_client._monitor._fetch_jobs")
+
+    # The job has left the queue
+    def _jobs(job_type, compute, jobids, **kwargs):
+        if job_type is JobSqueue:
+            return []
+
+        return [
+            JobSacct(jobid=i, compute=compute, state=JobState.COMPLETED) for i in jobids
+        ]
+
+    _fetch_jobs.side_effect = _jobs
+
+    with mock_api_client as client:
+        machine = client.compute(test_machine)
+
+        [job] = machine._monitor.fetch_jobs(
+            job_type=JobSqueue,
+            jobids=[1],
+            sacct_fallback=True,
+            fields=["jobid", "state", "time_left"],
+        )
+
+    assert job.state == JobState.COMPLETED
+
+    # time_left is only valid for squeue, sacct is only asked for the state
+    [squeue_call, sacct_call] = [kwargs for _, kwargs in _fetch_jobs.call_args_list]
+    assert "time_left" in squeue_call["fields"]
+    assert sacct_call["job_type"] is JobSacct
+    assert sacct_call["fields"] == STATE_FIELDS
@@ -1,8 +1,11 @@
 import pytest
 import asyncio
 
+from sfapi_client import AsyncClient, SfApiError
 from sfapi_client.compute import AsyncCompute
-from sfapi_client.jobs import AsyncJobSqueue, AsyncJobSacct, JobState
+from sfapi_client.jobs import AsyncJobSqueue, AsyncJobSacct, JobState, AdaptivePolling
+from sfapi_client.jobs import PollingStrategy
+from sfapi_client._jobs import STATE_FIELDS
 
 
 @pytest.mark.asyncio
@@ -41,6 +44,19 @@ async def test_submit_with_args(
             await machine.run(["rm", "-f", str(remote_script)])
 
 
+@pytest.mark.asyncio
+async def test_submit_jobs(async_authenticated_client, test_job_path, test_machine):
+    async with async_authenticated_client as client:
+        machine = await client.compute(test_machine)
+        jobs = await machine.submit_jobs([test_job_path] * 3)
+
+        assert len(jobs) == 3
+        assert len({job.jobid for job in jobs}) == 3
+
+        states = await asyncio.gather(*[job.complete() for job in jobs])
+        assert all(state == JobState.COMPLETED for state in states)
+
+
 @pytest.mark.asyncio
 async def test_cancel(async_authenticated_client, test_job_path, test_machine):
     async with async_authenticated_client as client:
@@ -63,6 +79,19 @@ async def test_cancel_wait_for_it(
         assert job.state == JobState.CANCELLED
 
 
+@pytest.mark.asyncio
+async def test_cancel_jobs(async_authenticated_client, test_job_path, test_machine):
+    async with async_authenticated_client as client:
+        machine = await client.compute(test_machine)
+        jobs = await machine.submit_jobs([test_job_path] * 3)
+
+        cancelled = await machine.cancel_jobs([job.jobid for job in jobs], wait=True)
+
+        assert [job.jobid for job in cancelled] == [job.jobid for job in jobs]
+        for job in cancelled:
+            assert job.state == JobState.CANCELLED
+
+
 @pytest.mark.asyncio
 async def test_running(async_authenticated_client, test_job_path, test_machine):
     async with async_authenticated_client as client:
@@ -74,6 +103,79 @@ async def test_running(async_authenticated_client, test_job_path, test_machine):
         assert state == JobState.RUNNING
 
 
+@pytest.mark.asyncio
+async def test_complete_adaptive_polling(
+    async_authenticated_client, test_job_path, test_machine
+):
+    async with async_authenticated_client as client:
+        machine = await client.compute(test_machine)
+        job = await machine.submit_job(test_job_path)
+
+        state = await job.complete(polling=AdaptivePolling(initial=2, max_interval=10))
+
+        assert state == JobState.COMPLETED
+
+
+class _RecordingPolling(PollingStrategy):
+    # Records the state and poll count each interval is asked for with
+    def __init__(self):
+        self.calls = []
+
+    def interval(self, job, polls):
+        self.calls.append((job.state, polls))
+        return 0
+
+
+@pytest.mark.public
+@pytest.mark.asyncio
+async def test_complete_polls_reset_on_state_change(
+    mock_api, async_mock_api_client, test_machine
+):
+    states = ["PENDING", "PENDING", "PENDING", "RUNNING", "RUNNING", "COMPLETED"]
+    squeue = {"1": states[0]}
+    jobs = None
+
+    def _jobs(request):
+        squeue["1"] = states.pop(0)
+        return jobs(request)
+
+    mock_api.route_jobs(test_machine, squeue=squeue)
+    jobs = mock_api.handlers[("GET", f"compute/jobs/{test_machine}")]
+    mock_api.route("GET", f"compute/jobs/{test_machine}", _jobs)
+
+    polling = _RecordingPolling()
+    async with async_mock_api_client as client:
+        machine = await client.compute(test_machine)
+        job = AsyncJobSqueue(jobid="1", compute=machine, state=JobState.PENDING)
+
+        assert await job.complete(polling=polling) == JobState.COMPLETED
+
+    assert polling.calls == [
+        (JobState.PENDING, 1),
+        (JobState.PENDING, 2),
+        (JobState.PENDING, 3),
+        (JobState.RUNNING, 1),
+        (JobState.RUNNING, 2),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_update_cached(async_authenticated_client, test_job_path, test_machine):
+    async with async_authenticated_client as client:
+        machine = await client.compute(test_machine)
+        job = await machine.submit_job(test_job_path)
+
+        await job.update(cached=True)
+        assert job.cached
+        fetched_at = job.fetched_at
+
+        await job.update()
+        assert not job.cached
+        assert job.fetched_at > fetched_at
+
+        await job.cancel()
+
+
 @pytest.mark.asyncio
 async def test_complete_timeout(
     async_authenticated_client, test_job_path, test_machine
@@ -204,3 +306,138 @@ async def test_job_monitor_gather(
 
         for j in jobs:
             assert j.state == JobState.COMPLETED
+
+
+@pytest.mark.asyncio
+async def test_job_watcher(
+    api_base_url, token_url, client_id, client_secret, mocker, test_machine
+):
+    async with AsyncClient(
+        api_base_url=api_base_url,
+        token_url=token_url,
+        client_id=client_id,
+        secret=client_secret,
+        watch_jobs=True,
+    ) as client:
+        _fetch_jobs_async = mocker.patch("sfapi_client._monitor._fetch_jobs_async")
+        machine = await client.compute(test_machine)
+
+        num_jobs = 10
+        jobs = [
+            AsyncJobSqueue(jobid=str(i), compute=machine, state=JobState.RUNNING)
+            for i in range(0, num_jobs)
+        ]
+        _fetch_jobs_async.return_value = [
+            AsyncJobSqueue(jobid=str(i), compute=machine, state=JobState.COMPLETED)
+            for i in range(0, num_jobs)
+        ]
+
+        states = await asyncio.gather(*[j.complete() for j in jobs])
+
+        assert states == [JobState.COMPLETED] * num_jobs
+
+        # The state of all the jobs should be fetched in a single request
+        assert _fetch_jobs_async.await_count == 1
+        _, kwargs = _fetch_jobs_async.await_args
+        assert len(kwargs["jobids"]) == num_jobs
+
+
+@pytest.mark.public
+@pytest.mark.asyncio
+async def test_job_watcher_unknown_job(
+    mock_api, use_mock_api, mock_api_url, test_machine
+):
+    mock_api.route_jobs(test_machine, squeue={"1": "RUNNING"}, sacct={})
+
+    async with use_mock_api(
+        AsyncClient(
+            api_base_url=mock_api_url,
+            access_token="token",
+            wait_interval=0,
+            watch_jobs=True,
+        )
+    ) as client:
+        machine = await client.compute(test_machine)
+        job = AsyncJobSqueue(jobid="99", compute=machine, state=JobState.RUNNING)
+
+        # The job is in neither squeue or sacct
+        with pytest.raises(SfApiError, match="Job not found: 99"):
+            await job.complete(timeout=10)
+
+
+@pytest.mark.asyncio
+async def test_job_monitor_sacct_fallback(
+    async_authenticated_client, mocker, test_machine
+):
+    async with async_authenticated_client as client:
+        _fetch_jobs_async = mocker.patch("sfapi_client._monitor._fetch_jobs_async")
+        machine = await client.compute(test_machine)
+
+        num_jobs = 10
+        jobs = [
+            AsyncJobSqueue(jobid=str(i), compute=machine, state=JobState.RUNNING)
+            for i in range(0, num_jobs)
+        ]
+
+        # The jobs have all left the queue
+        async def _jobs(job_type, compute, jobids, **kwargs):
+            if job_type is AsyncJobSqueue:
+                return []
+
+            return [
+                AsyncJobSacct(jobid=i, compute=machine, state=JobState.COMPLETED)
+                for i in jobids
+            ]
+
+        _fetch_jobs_async.side_effect = _jobs
+
+        await asyncio.gather(*[asyncio.create_task(j.update()) for j in jobs])
+
+        assert [j.state for j in jobs] == [JobState.COMPLETED] * num_jobs
+
+        # The sacct requests should be batched in the same way as the squeue ones
+        sacct_calls = [
+            kwargs
+            for _, kwargs in _fetch_jobs_async.await_args_list
+            if kwargs["job_type"] is AsyncJobSacct
+        ]
+        assert [len(kwargs["jobids"]) for kwargs in sacct_calls] == [1, 9]
+        assert all(kwargs["fields"] == STATE_FIELDS for kwargs in sacct_calls)
+
+
+@pytest.mark.public
+@pytest.mark.asyncio
+async def test_job_monitor_sacct_fallback_fields(
+    mocker, async_mock_api_client, test_machine
+):
+    _fetch_jobs = mocker.patch("sfapi_client._monitor._fetch_jobs_async")
+
+    # The job has left the queue
+    async def _jobs(job_type, compute, jobids, **kwargs):
+        if job_type is AsyncJobSqueue:
+            return []
+
+        return [
+            AsyncJobSacct(jobid=i, compute=compute, state=JobState.COMPLETED)
+            for i in jobids
+        ]
+
+    _fetch_jobs.side_effect = _jobs
+
+    async with async_mock_api_client as client:
+        machine = await client.compute(test_machine)
+
+        [job] = await machine._monitor.fetch_jobs(
+            job_type=AsyncJobSqueue,
+            jobids=[1],
+            sacct_fallback=True,
+            fields=["jobid", "state", "time_left"],
+        )
+
+    assert job.state == JobState.COMPLETED
+
+    # time_left is only valid for squeue, sacct is only asked for the state
+    [squeue_call, sacct_call] = [kwargs for _, kwargs in _fetch_jobs.await_args_list]
+    assert "time_left" in squeue_call["fields"]
+    assert sacct_call["job_type"] is AsyncJobSacct
+    assert sacct_call["fields"] == STATE_FIELDS
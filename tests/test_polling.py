@@ -0,0 +1,124 @@
+import pytest
+
+from sfapi_client.jobs import (
+    AdaptivePolling,
+    BackoffPolling,
+    FixedPolling,
+    JitteredPolling,
+    JobSacct,
+    JobSqueue,
+    JobState,
+    TimeLimitPolling,
+)
+
+
+def _job(state, time_left=None):
+    return JobSqueue(jobid="1", state=state, time_left=time_left)
+
+
+@pytest.mark.public
+def test_fixed_polling():
+    polling = FixedPolling(5)
+
+    assert [polling.interval(_job(JobState.PENDING), p) for p in range(1, 4)] == [5] * 3
+
+
+@pytest.mark.public
+def test_backoff_polling_growth_and_cap():
+    polling = BackoffPolling(initial=10, factor=2, max_interval=60)
+    job = _job(JobState.PENDING)
+
+    intervals = [polling.interval(job, polls) for polls in range(1, 7)]
+
+    assert intervals == [10, 20, 40, 60, 60, 60]
+
+
+@pytest.mark.public
+def test_backoff_polling_other_states():
+    polling = BackoffPolling(initial=10, factor=2, max_interval=60)
+
+    # Once the job leaves the back off states the initial interval is used
+    assert polling.interval(_job(JobState.RUNNING), 5) == 10
+
+    polling = BackoffPolling(initial=10, states=[JobState.RUNNING])
+    assert polling.interval(_job(JobState.RUNNING), 3) == 40
+    assert polling.interval(_job(JobState.PENDING), 3) == 10
+
+
+@pytest.mark.public
+def test_time_limit_polling_window():
+    polling = TimeLimitPolling(FixedPolling(60), window=120, min_interval=5)
+
+    # Well outside the window the wrapped strategy is used
+    assert polling.interval(_job(JobState.RUNNING, "1:00:00"), 1) == 60
+    # Don't sleep past the start of the window
+    assert polling.interval(_job(JobState.RUNNING, "2:30"), 1) == 30
+    # Not less than the minimum interval before the window
+    assert polling.interval(_job(JobState.RUNNING, "2:02"), 1) == 5
+    # Inside the window
+    assert polling.interval(_job(JobState.RUNNING, "1:00"), 1) == 5
+    assert polling.interval(_job(JobState.RUNNING, "0:00"), 1) == 5
+
+
+@pytest.mark.public
+def test_time_limit_polling_not_applicable():
+    polling = TimeLimitPolling(FixedPolling(60), window=120, min_interval=5)
+
+    # Only running jobs are near their time limit
+    assert polling.interval(_job(JobState.PENDING, "1:00"), 1) == 60
+    # The time left isn't known
+    assert polling.interval(_job(JobState.RUNNING), 1) == 60
+    assert polling.interval(_job(JobState.RUNNING, "UNLIMITED"), 1) == 60
+
+
+@pytest.mark.public
+def test_time_limit_polling_sacct():
+    polling = TimeLimitPolling(FixedPolling(60), window=120, min_interval=5)
+
+    # A 10 minute limit with 9 minutes elapsed
+    job = JobSacct(
+        jobid="1", state=JobState.RUNNING, timelimitraw="10", elapsedraw="540"
+    )
+    assert polling.interval(job, 1) == 5
+
+    job = JobSacct(
+        jobid="1", state=JobState.RUNNING, timelimitraw="10", elapsedraw="60"
+    )
+    assert polling.interval(job, 1) == 60
+
+
+@pytest.mark.public
+def test_jittered_polling_bounds():
+    polling = JitteredPolling(FixedPolling(100), jitter=0.1)
+    job = _job(JobState.RUNNING)
+
+    intervals = [polling.interval(job, 1) for _ in range(1000)]
+
+    assert all(90 <= interval <= 110 for interval in intervals)
+    # The intervals are actually randomized
+    assert len(set(intervals)) > 1
+
+
+@pytest.mark.public
+def test_jittered_polling_no_jitter():
+    polling = JitteredPolling(FixedPolling(100), jitter=0)
+
+    assert polling.interval(_job(JobState.RUNNING), 1) == 100
+
+
+@pytest.mark.public
+def test_adaptive_polling():
+    polling = AdaptivePolling(
+        initial=10, max_interval=60, window=120, min_interval=5, jitter=0.1
+    )
+
+    pending = _job(JobState.PENDING)
+    for polls, expected in [(1, 10), (2, 20), (3, 40), (4, 60), (10, 60)]:
+        interval = polling.interval(pending, polls)
+        assert 0.9 * expected <= interval <= 1.1 * expected
+
+    # Running jobs are polled at the initial interval, faster near the limit
+    interval = polling.interval(_job(JobState.RUNNING, "1:00:00"), 10)
+    assert 9 <= interval <= 11
+    interval = polling.interval(_job(JobState.RUNNING, "1:00"), 10)
+    assert 4.5 <= interval <= 5.5
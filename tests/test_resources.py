@@ -1,5 +1,6 @@
 import pytest
-from sfapi_client import StatusValue
+from sfapi_client import StatusValue, Client
+from sfapi_client.client import ResponseCache
 
 
 @pytest.mark.public
@@ -83,3 +84,20 @@ def test_resouce_status(unauthenticated_client, test_resource):
 
         assert test_resource.value in status.name
         assert status.status in StatusValue
+
+
+@pytest.mark.public
+def test_status_cached(api_base_url, test_machine):
+    cache = ResponseCache()
+    with Client(api_base_url=api_base_url, response_cache=cache) as client:
+        status = client.resources.status(test_machine)
+        cached_status = client.resources.status(test_machine)
+
+        assert cached_status == status
+        assert cache.misses == 1
+        assert cache.hits == 1
+
+        cache.invalidate("status")
+        client.resources.status(test_machine)
+
+        assert cache.misses == 2
@@ -1,6 +1,7 @@
 import pytest
 
-from sfapi_client import StatusValue
+from sfapi_client import StatusValue, AsyncClient
+from sfapi_client.client import ResponseCache
 
 
 @pytest.mark.public
@@ -95,3 +96,21 @@ async def test_resouce_status(async_unauthenticated_client, test_resource):
 
         assert test_resource.value in status.name
         assert status.status in StatusValue
+
+
+@pytest.mark.public
+@pytest.mark.asyncio
+async def test_status_cached(api_base_url, test_machine):
+    cache = ResponseCache()
+    async with AsyncClient(api_base_url=api_base_url, response_cache=cache) as client:
+        status = await client.resources.status(test_machine)
+        cached_status = await client.resources.status(test_machine)
+
+        assert cached_status == status
+        assert cache.misses == 1
+        assert cache.hits == 1
+
+        cache.invalidate("status")
+        await client.resources.status(test_machine)
+
+        assert cache.misses == 2
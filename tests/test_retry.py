@@ -0,0 +1,188 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import httpx
+import pytest
+import tenacity
+
+from sfapi_client import Client
+from sfapi_client.client import RetryBudget, RetryPolicy
+
+
+def _status_error(status_code=429, headers=None):
+    request = httpx.Request("GET", "https://api.test/status")
+    response = httpx.Response(status_code, headers=headers, request=request)
+
+    return httpx.HTTPStatusError("error", request=request, response=response)
+
+
+def _retry_state(exception, attempt_number=1, upcoming_sleep=0.0):
+    state = tenacity.RetryCallState(None, None, (), {})
+    state.attempt_number = attempt_number
+    state.upcoming_sleep = upcoming_sleep
+    state.set_exception((type(exception), exception, None))
+
+    return state
+
+
+@pytest.mark.public
+def test_retry_after_seconds():
+    e = _status_error(headers={"Retry-After": "30"})
+
+    assert RetryPolicy._retry_after(e) == 30.0
+
+
+@pytest.mark.public
+def test_retry_after_date():
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=60)
+    e = _status_error(headers={"Retry-After": format_datetime(retry_at, usegmt=True)})
+
+    assert 55 < RetryPolicy._retry_after(e) <= 60
+
+
+@pytest.mark.public
+def test_retry_after_past_date():
+    retry_at = datetime.now(timezone.utc) - timedelta(seconds=60)
+    e = _status_error(headers={"Retry-After": format_datetime(retry_at, usegmt=True)})
+
+    assert RetryPolicy._retry_after(e) == 0.0
+
+
+@pytest.mark.public
+def test_retry_after_invalid():
+    assert RetryPolicy._retry_after(_status_error()) is None
+    assert (
+        RetryPolicy._retry_after(_status_error(headers={"Retry-After": "soon"})) is None
+    )
+    assert RetryPolicy._retry_after(httpx.ConnectError("error")) is None
+
+
+@pytest.mark.public
+def test_retry_after_used_as_minimum_delay():
+    policy = RetryPolicy(base_delay=1, max_delay=2)
+    state = _retry_state(_status_error(headers={"Retry-After": "30"}))
+
+    assert policy._wait(state) == 30.0
+
+
+@pytest.mark.public
+def test_stop_max_retry_after():
+    policy = RetryPolicy(max_retry_after=60)
+
+    state = _retry_state(_status_error(headers={"Retry-After": "30"}))
+    assert not policy._stop(state)
+
+    state = _retry_state(_status_error(headers={"Retry-After": "120"}))
+    assert policy._stop(state)
+
+
+@pytest.mark.public
+def test_stop_max_attempts():
+    policy = RetryPolicy(max_attempts=3)
+
+    assert not policy._stop(_retry_state(_status_error(), attempt_number=2))
+    assert policy._stop(_retry_state(_status_error(), attempt_number=3))
+
+
+@pytest.mark.public
+def test_decorrelated_jitter_bounds():
+    policy = RetryPolicy(base_delay=1, max_delay=10)
+    e = httpx.ConnectError("error")
+
+    for previous in [0.0, 1.0, 2.0, 5.0, 20.0]:
+        for _ in range(100):
+            delay = policy._wait(_retry_state(e, upcoming_sleep=previous))
+            assert 1 <= delay <= min(10, max(1, previous) * 3)
+
+
+@pytest.mark.public
+def test_should_retry():
+    policy = RetryPolicy()
+
+    assert policy._should_retry(httpx.ConnectError("error"))
+    assert policy._should_retry(httpx.ReadTimeout("error"))
+    assert policy._should_retry(_status_error(503))
+    assert not policy._should_retry(_status_error(404))
+    assert not policy._should_retry(ValueError())
+
+
+@pytest.mark.public
+def test_budget_min_per_second(mocker):
+    now = mocker.patch("sfapi_client._retry.time.monotonic", return_value=0.0)
+    budget = RetryBudget(ratio=0.5, min_per_second=2)
+
+    assert budget.withdraw()
+    assert budget.withdraw()
+    assert not budget.withdraw()
+
+    # The reserve is replenished over time
+    now.return_value = 0.5
+    assert budget.withdraw()
+    assert not budget.withdraw()
+
+
+@pytest.mark.public
+def test_budget_deposit(mocker):
+    mocker.patch("sfapi_client._retry.time.monotonic", return_value=0.0)
+    budget = RetryBudget(ratio=0.5, min_per_second=0, max_balance=2)
+
+    assert not budget.withdraw()
+
+    # Each request deposits half a retry
+    budget.deposit()
+    assert not budget.withdraw()
+    budget.deposit()
+    assert budget.withdraw()
+    assert not budget.withdraw()
+
+    # The balance is capped
+    for _ in range(10):
+        budget.deposit()
+    assert budget.withdraw()
+    assert budget.withdraw()
+    assert not budget.withdraw()
+
+
+@pytest.mark.public
+def test_stop_budget_exhausted(mocker):
+    mocker.patch("sfapi_client._retry.time.monotonic", return_value=0.0)
+    policy = RetryPolicy(budget=RetryBudget(min_per_second=1))
+
+    assert not policy._stop(_retry_state(_status_error()))
+    assert policy._stop(_retry_state(_status_error()))
+
+
+@pytest.mark.public
+def test_retry_request(mock_api, use_mock_api, mock_api_url):
+    statuses = [503, 503, 200]
+
+    def _handler(request):
+        return httpx.Response(statuses.pop(0), json={"status": "active"})
+
+    mock_api.route("GET", "status", _handler)
+
+    policy = RetryPolicy(base_delay=0, max_delay=0)
+    with use_mock_api(
+        Client(api_base_url=mock_api_url, access_token="token", retry_policy=policy)
+    ) as client:
+        r = client.get("status")
+
+    assert r.status_code == 200
+    assert statuses == []
+
+
+@pytest.mark.public
+def test_retry_request_retry_after_too_long(mock_api, use_mock_api, mock_api_url):
+    def _handler(request):
+        return httpx.Response(429, headers={"Retry-After": "3600"})
+
+    mock_api.route("GET", "status", _handler)
+
+    policy = RetryPolicy(max_retry_after=60)
+    with use_mock_api(
+        Client(api_base_url=mock_api_url, access_token="token", retry_policy=policy)
+    ) as client:
+        with pytest.raises(tenacity.RetryError):
+            client.get("status")
+
+    assert len(mock_api.requests) == 1
@@ -0,0 +1,170 @@
+import threading
+import time
+
+import pytest
+from authlib.oauth2.rfc6749 import OAuth2Token
+
+from sfapi_client.client import TokenCache
+from sfapi_client._token import SyncTokenRefresher
+
+
+class _FakeOAuthClient:
+    def __init__(self, expires_in=3600, delay=0.0, leeway=60):
+        self.client_id = "client"
+        self.metadata = {"token_endpoint": "https://oidc.test/token"}
+        self.leeway = leeway
+        self.expires_in = expires_in
+        self.delay = delay
+        self.fetches = 0
+        self._token = None
+
+    @property
+    def token(self):
+        return self._token
+
+    @token.setter
+    def token(self, token):
+        self._token = OAuth2Token(token) if token is not None else None
+
+    def fetch_token(self):
+        time.sleep(self.delay)
+        self.fetches += 1
+        self.token = {
+            "access_token": f"token{self.fetches}",
+            "expires_at": time.time() + self.expires_in,
+        }
+
+        return self.token
+
+
+def _token(access_token, expires_in):
+    return {
+        "access_token": access_token,
+        "expires_at": int(time.time()) + expires_in,
+    }
+
+
+@pytest.mark.public
+def test_token_cache_permissions(tmp_path):
+    cache = TokenCache(tmp_path)
+    token = _token("cached", 3600)
+    cache.store("client", "https://oidc.test/token", token)
+
+    token_path = cache._token_path("client", "https://oidc.test/token")
+    assert token_path.stat().st_mode == 0o100600
+    assert cache.load("client", "https://oidc.test/token") == token
+
+    # Readable by others, so the token isn't trusted
+    token_path.chmod(0o644)
+    assert cache.load("client", "https://oidc.test/token") is None
+
+
+@pytest.mark.public
+def test_token_cache_newer_token(tmp_path):
+    cache = TokenCache(tmp_path)
+    client = _FakeOAuthClient()
+    client.token = _token("current", 1000)
+    refresher = SyncTokenRefresher(client, cache=cache)
+
+    # Another process has refreshed the token
+    cache.store(*refresher._cache_key(), _token("newer", 2000))
+    refresher._fetch_token(refresh=True)
+
+    assert client.token["access_token"] == "newer"
+    assert client.fetches == 0
+
+    # The cached token is no newer than ours, so a new one is fetched
+    refresher._fetch_token(refresh=True)
+
+    assert client.token["access_token"] == "token1"
+    assert client.fetches == 1
+    assert cache.load(*refresher._cache_key())["access_token"] == "token1"
+
+
+@pytest.mark.public
+def test_token_cache_lock(tmp_path):
+    cache = TokenCache(tmp_path)
+    clients = [_FakeOAuthClient(delay=0.2) for _ in range(4)]
+    refreshers = [SyncTokenRefresher(c, cache=cache) for c in clients]
+
+    threads = [threading.Thread(target=r.ensure_token) for r in refreshers]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=10)
+
+    try:
+        assert not any(t.is_alive() for t in threads)
+        # Only the first client to take the lock fetches a token, the others
+        # use the one it cached.
+        assert sum(c.fetches for c in clients) == 1
+        assert len({c.token["access_token"] for c in clients}) == 1
+    finally:
+        for r in refreshers:
+            r.close()
+
+
+@pytest.mark.public
+def test_refresh_in():
+    client = _FakeOAuthClient()
+    refresher = SyncTokenRefresher(client, margin=120)
+
+    assert refresher._refresh_in() is None
+
+    client.token = _token("token", 1000)
+    assert refresher._refresh_in() == pytest.approx(880, abs=2)
+
+    # Short lived tokens are refreshed half way through their lifetime
+    client.token = _token("token", 100)
+    assert refresher._refresh_in() == pytest.approx(50, abs=2)
+
+
+@pytest.mark.public
+def test_initial_fetch_single_flight():
+    client = _FakeOAuthClient(delay=0.2)
+    refresher = SyncTokenRefresher(client)
+
+    threads = [threading.Thread(target=refresher.ensure_token) for _ in range(10)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    try:
+        assert client.fetches == 1
+    finally:
+        refresher.close()
+
+
+@pytest.mark.public
+def test_background_refresh():
+    client = _FakeOAuthClient(expires_in=4, leeway=0)
+    refresher = SyncTokenRefresher(client, margin=2)
+
+    try:
+        refresher.ensure_token()
+        assert client.fetches == 1
+
+        # The token is refreshed two seconds before it expires, expires_at is
+        # truncated to a whole second so this is 1.5 to 2 seconds from now.
+        time.sleep(1.0)
+        assert client.fetches == 1
+        time.sleep(1.5)
+        assert client.fetches == 2
+    finally:
+        refresher.close()
+
+
+@pytest.mark.public
+def test_close_stops_refresh():
+    client = _FakeOAuthClient()
+    refresher = SyncTokenRefresher(client)
+    refresher.ensure_token()
+
+    thread = refresher._refresh_thread
+    assert thread.is_alive()
+
+    refresher.close()
+
+    assert not thread.is_alive()
+    assert refresher._refresh_thread is None
@@ -0,0 +1,137 @@
+import asyncio
+import time
+
+import pytest
+from authlib.oauth2.rfc6749 import OAuth2Token
+
+from sfapi_client.client import TokenCache
+from sfapi_client._token import AsyncTokenRefresher
+
+
+class _FakeAsyncOAuthClient:
+    def __init__(self, expires_in=3600, delay=0.0, leeway=60):
+        self.client_id = "client"
+        self.metadata = {"token_endpoint": "https://oidc.test/token"}
+        self.leeway = leeway
+        self.expires_in = expires_in
+        self.delay = delay
+        self.fetches = 0
+        self._token = None
+
+    @property
+    def token(self):
+        return self._token
+
+    @token.setter
+    def token(self, token):
+        self._token = OAuth2Token(token) if token is not None else None
+
+    async def fetch_token(self):
+        await asyncio.sleep(self.delay)
+        self.fetches += 1
+        self.token = {
+            "access_token": f"token{self.fetches}",
+            "expires_at": time.time() + self.expires_in,
+        }
+
+        return self.token
+
+
+def _token(access_token, expires_in):
+    return {
+        "access_token": access_token,
+        "expires_at": int(time.time()) + expires_in,
+    }
+
+
+@pytest.mark.public
+@pytest.mark.asyncio
+async def test_token_cache_newer_token(tmp_path):
+    cache = TokenCache(tmp_path)
+    client = _FakeAsyncOAuthClient()
+    client.token = _token("current", 1000)
+    refresher = AsyncTokenRefresher(client, cache=cache)
+
+    # Another process has refreshed the token
+    cache.store(*refresher._cache_key(), _token("newer", 2000))
+    await refresher._fetch_token(refresh=True)
+
+    assert client.token["access_token"] == "newer"
+    assert client.fetches == 0
+
+    # The cached token is no newer than ours, so a new one is fetched
+    await refresher._fetch_token(refresh=True)
+
+    assert client.token["access_token"] == "token1"
+    assert client.fetches == 1
+
+
+@pytest.mark.public
+@pytest.mark.asyncio
+async def test_token_cache_lock_same_loop(tmp_path):
+    # Clients in the same event loop sharing a cache, waiting for the lock
+    # must not block the loop.
+    cache = TokenCache(tmp_path)
+    clients = [_FakeAsyncOAuthClient(delay=0.2) for _ in range(4)]
+    refreshers = [AsyncTokenRefresher(c, cache=cache) for c in clients]
+
+    try:
+        await asyncio.wait_for(
+            asyncio.gather(*[r.ensure_token() for r in refreshers]), timeout=10
+        )
+
+        assert sum(c.fetches for c in clients) == 1
+        assert len({c.token["access_token"] for c in clients}) == 1
+    finally:
+        for r in refreshers:
+            await r.close()
+
+
+@pytest.mark.public
+@pytest.mark.asyncio
+async def test_initial_fetch_single_flight():
+    client = _FakeAsyncOAuthClient(delay=0.2)
+    refresher = AsyncTokenRefresher(client)
+
+    try:
+        await asyncio.gather(*[refresher.ensure_token() for _ in range(10)])
+
+        assert client.fetches == 1
+    finally:
+        await refresher.close()
+
+
+@pytest.mark.public
+@pytest.mark.asyncio
+async def test_background_refresh():
+    client = _FakeAsyncOAuthClient(expires_in=4, leeway=0)
+    refresher = AsyncTokenRefresher(client, margin=2)
+
+    try:
+        await refresher.ensure_token()
+        assert client.fetches == 1
+
+        # The token is refreshed two seconds before it expires, expires_at is
+        # truncated to a whole second so this is 1.5 to 2 seconds from now.
+        await asyncio.sleep(1.0)
+        assert client.fetches == 1
+        await asyncio.sleep(1.5)
+        assert client.fetches == 2
+    finally:
+        await refresher.close()
+
+
+@pytest.mark.public
+@pytest.mark.asyncio
+async def test_close_cancels_refresh():
+    client = _FakeAsyncOAuthClient()
+    refresher = AsyncTokenRefresher(client)
+    await refresher.ensure_token()
+
+    task = refresher._refresh_task
+    assert not task.done()
+
+    await refresher.close()
+
+    assert task.cancelled()
+    assert refresher._refresh_task is None